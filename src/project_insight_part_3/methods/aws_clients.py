@@ -0,0 +1,102 @@
+import threading
+import boto3
+from botocore.config import Config
+from .env_initialize import EnvConfig, AWS_CREDENTIAL_KEYS, get_env_config
+
+# Shared botocore config: a larger connection pool so the thread pools used by the
+# reports can reuse keep-alive connections instead of opening new TLS sessions.
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    connect_timeout=5,
+    read_timeout=30,
+    tcp_keepalive=True,
+    retries={'max_attempts': 5, 'mode': 'standard'}
+)
+
+_lock = threading.RLock()
+_session = None
+_clients = {}
+
+
+def get_aws_credentials(env_vars: dict) -> tuple:
+    """Pull the AWS credentials out of the .env values.
+
+    Args:
+        env_vars (dict): Values returned by read_env_variables().
+
+    Returns:
+        tuple: (aws_access_key_id, aws_secret_access_key, region_name)
+    """
+    return EnvConfig.credentials_from(env_vars)
+
+
+def reset_clients():
+    """Drop the cached session and every client/resource built from it."""
+    global _session
+    with _lock:
+        _session = None
+        _clients.clear()
+
+
+def _on_config_change(changed_keys: set):
+    if changed_keys & set(AWS_CREDENTIAL_KEYS):
+        reset_clients()
+
+
+get_env_config().subscribe(_on_config_change)
+
+
+def get_session() -> boto3.Session:
+    """Return the process-wide boto3 session for the current .env credentials.
+
+    A new session is only built the first time or after the credentials in the
+    .env file change (the config's change event drops the session and every cached
+    client).
+
+    Returns:
+        boto3.Session: The shared session.
+    """
+    global _session
+    aws_access_key_id, aws_secret_access_key, region_name = get_env_config().aws_credentials
+    with _lock:
+        if _session is None:
+            _clients.clear()
+            _session = boto3.Session(
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name
+            )
+        return _session
+
+
+def _get_cached(name: str, factory):
+    session = get_session()
+    with _lock:
+        if name not in _clients:
+            _clients[name] = factory(session)
+        return _clients[name]
+
+
+def get_dynamodb_resource():
+    """Return the shared DynamoDB resource."""
+    return _get_cached('dynamodb', lambda session: session.resource('dynamodb', config=CLIENT_CONFIG))
+
+
+def get_dynamodb_client():
+    """Return the low-level DynamoDB client behind the shared resource (thread-safe)."""
+    return get_dynamodb_resource().meta.client
+
+
+def get_participant_table():
+    """Return the participant DynamoDB table named in the .env file."""
+    return get_dynamodb_resource().Table(get_env_config().table_name)
+
+
+def get_logs_client():
+    """Return the shared CloudWatch Logs client."""
+    return _get_cached('logs', lambda session: session.client('logs', config=CLIENT_CONFIG))
+
+
+def get_sns_client():
+    """Return the shared SNS client."""
+    return _get_cached('sns', lambda session: session.client('sns', config=CLIENT_CONFIG))
@@ -1,7 +1,24 @@
-import boto3
 import os
+import polars as pl
+from concurrent.futures import ThreadPoolExecutor
+from boto3.dynamodb.types import TypeDeserializer
 from dotenv import load_dotenv
-from ..methods.env_initialize import read_env_variables
+from ..methods.env_initialize import get_env_config
+from ..methods.aws_clients import get_participant_table, get_sns_client, get_dynamodb_client
+from ..methods.timing import timed, submit_in_context
+
+# Fixed schema for participant table scans so every page/segment concatenates cleanly
+PARTICIPANT_TABLE_SCHEMA = {
+    'participant_id': pl.Int64,
+    'start_date': pl.Utf8,
+    'end_date': pl.Utf8,
+    'phone_number': pl.Utf8,
+    'leaderboard_link': pl.Utf8,
+    'schedule_type': pl.Utf8,
+    'message_randomizer': pl.List(pl.Int64)
+}
+
+_deserializer = TypeDeserializer()
 
 def add_user_to_database(participant_id,
                          start_date,
@@ -26,33 +43,62 @@ def add_user_to_database(participant_id,
         message (str): Success or error message.
     """
     
-    env_vars = read_env_variables()
-    
-    Session = boto3.Session(
-        aws_access_key_id=env_vars['aws_access_key_id'],
-        aws_secret_access_key=env_vars['aws_secret_access_key'],
-        region_name=env_vars['region']
-    )
-    dynamodb = Session.resource('dynamodb')
-    table = dynamodb.Table(env_vars['insight_p3_table_name'])
+    table = get_participant_table()
     
     try:
         table.put_item(
-            Item={
-                'participant_id': int(participant_id),
-                'start_date': start_date,
-                'end_date': end_date,
-                'phone_number': phone_number,
-                'leaderboard_link': lb_link,
-                'schedule_type': schedule,
-                'message_randomizer': message_randomizer
-            }
+            Item=participant_item(participant_id, start_date, end_date, phone_number, lb_link, schedule, message_randomizer)
         )
         return True, "User added successfully."
     except Exception as e:
         print(f"Error adding user to database: {e}")
         return False, f"Error adding user to database: {e}"
 
+def participant_item(participant_id, start_date, end_date, phone_number, lb_link, schedule, message_randomizer) -> dict:
+    """Build the DynamoDB item for a participant (same arguments as add_user_to_database)."""
+    return {
+        'participant_id': int(participant_id),
+        'start_date': start_date,
+        'end_date': end_date,
+        'phone_number': phone_number,
+        'leaderboard_link': lb_link,
+        'schedule_type': schedule,
+        'message_randomizer': message_randomizer
+    }
+
+# BatchWriteItem accepts at most 25 items per request
+BATCH_WRITE_SIZE = 25
+
+@timed('dynamodb.batch_write')
+def add_users_to_database(items: list, batch_size: int = BATCH_WRITE_SIZE) -> list:
+    """Add several users to the AWS DynamoDB table with batched writes.
+
+    Items are written in batches of batch_size through the table's batch_writer, which
+    re-sends any unprocessed items until DynamoDB accepts them. A batch that fails is
+    reported for each of its items; the other batches are still written.
+
+    Args:
+        items (list): Items built with participant_item().
+        batch_size (int, optional): Items per BatchWriteItem request. Defaults to BATCH_WRITE_SIZE.
+
+    Returns:
+        list: One (success, message) tuple per item, in the order given.
+    """
+    table = get_participant_table()
+    results = []
+    
+    for start in range(0, len(items), batch_size):
+        batch_items = items[start:start + batch_size]
+        try:
+            with table.batch_writer(overwrite_by_pkeys=['participant_id']) as batch:
+                for item in batch_items:
+                    batch.put_item(Item=item)
+            results.extend((True, "User added successfully.") for _ in batch_items)
+        except Exception as e:
+            print(f"Error adding users to database: {e}")
+            results.extend((False, f"Error adding user to database: {e}") for _ in batch_items)
+    return results
+
 def get_user_info(participant_id):
     """
     Retrieve user information from the AWS DynamoDB table.
@@ -63,15 +109,7 @@ def get_user_info(participant_id):
     Returns:
         dict: User information if found, None otherwise.
     """
-    env_vars = read_env_variables()
-    
-    Session = boto3.Session(
-        aws_access_key_id=env_vars['aws_access_key_id'],
-        aws_secret_access_key=env_vars['aws_secret_access_key'],
-        region_name=env_vars['region']
-    )
-    dynamodb = Session.resource('dynamodb')
-    table = dynamodb.Table(env_vars['insight_p3_table_name'])
+    table = get_participant_table()
     
     try:
         response = table.get_item(
@@ -97,15 +135,7 @@ def update_user_info(participant_id, attribute_name, new_value):
         bool: True if the update was successful, False otherwise.
         message (str): Success or error message.
     """
-    env_vars = read_env_variables()
-    
-    Session = boto3.Session(
-        aws_access_key_id=env_vars['aws_access_key_id'],
-        aws_secret_access_key=env_vars['aws_secret_access_key'],
-        region_name=env_vars['region']
-    )
-    dynamodb = Session.resource('dynamodb')
-    table = dynamodb.Table(env_vars['insight_p3_table_name'])
+    table = get_participant_table()
     
     try: 
         table.update_item(
@@ -132,15 +162,7 @@ def delete_user_from_database(participant_id):
         bool: True if the deletion was successful, False otherwise.
         message (str): Success or error message.
     """
-    env_vars = read_env_variables()
-    
-    Session = boto3.Session(
-        aws_access_key_id=env_vars['aws_access_key_id'],
-        aws_secret_access_key=env_vars['aws_secret_access_key'],
-        region_name=env_vars['region']
-    )
-    dynamodb = Session.resource('dynamodb')
-    table = dynamodb.Table(env_vars['insight_p3_table_name'])
+    table = get_participant_table()
     
     try:
         table.delete_item(
@@ -165,15 +187,7 @@ def send_test_sms(participant_phone_number, message):
         bool: True if the SMS was sent successfully, False otherwise.
         message (str): Success or error message.
     """
-    env_vars = read_env_variables()
-    
-    Session = boto3.Session(
-        aws_access_key_id=env_vars['aws_access_key_id'],
-        aws_secret_access_key=env_vars['aws_secret_access_key'],
-        region_name=env_vars['region']
-    )
-    
-    sns = Session.client('sns')
+    sns = get_sns_client()
     
     try:
         sns.publish(
@@ -183,4 +197,65 @@ def send_test_sms(participant_phone_number, message):
         return True, "SMS sent successfully."
     except Exception as e:
         print(f"Error sending test SMS: {e}")
-        return False, f"Error sending test SMS: {e}"
\ No newline at end of file
+        return False, f"Error sending test SMS: {e}"
+
+def _item_to_row(item: dict) -> dict:
+    """Convert a low-level DynamoDB item into a row matching PARTICIPANT_TABLE_SCHEMA."""
+    values = {key: _deserializer.deserialize(value) for key, value in item.items()}
+    message_randomizer = values.get('message_randomizer')
+    return {
+        'participant_id': int(values['participant_id']) if values.get('participant_id') is not None else None,
+        'start_date': values.get('start_date'),
+        'end_date': values.get('end_date'),
+        'phone_number': values.get('phone_number'),
+        'leaderboard_link': values.get('leaderboard_link'),
+        'schedule_type': values.get('schedule_type'),
+        'message_randomizer': [int(x) for x in message_randomizer] if message_randomizer is not None else None
+    }
+
+def _scan_segment(table_name: str, segment: int, total_segments: int) -> list:
+    """Scan one segment of the table, following LastEvaluatedKey until the segment is exhausted.
+
+    Returns:
+        list: One DataFrame per page returned by DynamoDB.
+    """
+    paginator = get_dynamodb_client().get_paginator('scan')
+    scan_kwargs = {'TableName': table_name}
+    if total_segments > 1:
+        scan_kwargs['Segment'] = segment
+        scan_kwargs['TotalSegments'] = total_segments
+
+    frames = []
+    for page in paginator.paginate(**scan_kwargs):
+        rows = [_item_to_row(item) for item in page.get('Items', [])]
+        if rows:
+            frames.append(pl.DataFrame(rows, schema=PARTICIPANT_TABLE_SCHEMA))
+    return frames
+
+@timed('dynamodb.scan')
+def scan_participant_table(total_segments: int = 4) -> pl.DataFrame:
+    """Scan the full participant table into a single Polars DataFrame.
+
+    Pagination is followed for every segment, so results are not truncated at
+    DynamoDB's 1 MB page limit. With total_segments > 1 the segments are scanned
+    in parallel on a thread pool.
+
+    Args:
+        total_segments (int, optional): Number of parallel scan segments. Defaults to 4.
+
+    Returns:
+        pl.DataFrame: All participants, using PARTICIPANT_TABLE_SCHEMA.
+    """
+    table_name = get_env_config().table_name
+    total_segments = max(1, int(total_segments))
+
+    if total_segments == 1:
+        frames = _scan_segment(table_name, 0, 1)
+    else:
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            segment_jobs = [submit_in_context(executor, _scan_segment, table_name, segment, total_segments) for segment in range(total_segments)]
+            frames = [frame for job in segment_jobs for frame in job.result()]
+
+    if not frames:
+        return pl.DataFrame(schema=PARTICIPANT_TABLE_SCHEMA)
+    return pl.concat(frames, how='vertical', rechunk=True)
@@ -1,55 +1,34 @@
-import boto3
 import polars as pl
-import pytz
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 import plotly.graph_objects as go
 from project_insight_part_3.methods.env_initialize import read_env_variables
-from project_insight_part_3.methods.aws_functions import get_user_info
-from collections import defaultdict
-
-import pytz
+from project_insight_part_3.methods.aws_functions import get_user_info, scan_participant_table
+from project_insight_part_3.methods.aws_clients import get_participant_table
+from project_insight_part_3.methods.survey_cache import load_cached_frame
+from project_insight_part_3.methods.participant_directory import get_participant_directory
+from project_insight_part_3.methods.send_times import fetch_send_times, send_times_wide
+from project_insight_part_3.methods.timing import timed
+from project_insight_part_3.methods.survey_ingest import SURVEY_SOURCE_KEYS, STORE_COLUMNS, normalize_survey_rows, ingest_survey_exports, scan_survey_store, survey_store_files
+
+# Study days follow the send schedules, which are in New York time
+STUDY_TIME_ZONE = "America/New_York"
+
+# Completion windows in minutes after the send time, as (early, late): a response counts when
+# early < minutes after send <= late
+SINGLE_RESPONSE_WINDOW = (-10, 60)
+MULTIPLE_RESPONSE_WINDOW = (0, 60)
+
+def study_today():
+    """Return today's date in STUDY_TIME_ZONE; every "today" in compliance checks uses this clock."""
+    return datetime.now(ZoneInfo(STUDY_TIME_ZONE)).date()
 
 def get_participant_initials():
-    env_vars = read_env_variables()
-
-    # get initials and participant db
-    participant_db_path = env_vars['participant_db']
-    participant_db_df = pl.read_csv(participant_db_path)
-    participant_db_df = participant_db_df.select([
-        'Participant ID #',
-        'Initials',
-        'Age'
-    ])
-    
-    # print column names to debug
-    print("Columns in participant_db_df:", participant_db_df.columns)
-    
-    participant_db_df = participant_db_df.filter(pl.col('Participant ID #').is_not_null())
-    
-    # Capitalize initials and remove spaces from initials
-    participant_db_df = participant_db_df.with_columns(
-        pl.col('Initials').str.to_uppercase().str.replace_all(" ", "")
-    )
-
-    # Combine Participant ID # and Initials into a new column
-    participant_db_df = participant_db_df.with_columns(
-        (pl.col('Participant ID #').cast(pl.Utf8) + ' (' + pl.col('Initials') + ')').alias('Participant_Initials')
-    )
-
-    return participant_db_df
+    # Served from the in-memory directory; the CSV is only re-read when it changes
+    return get_participant_directory().frame
 
 def get_participant_dynamo_db(participant_id: str):
-    env_vars = read_env_variables()
-    
-    Session = boto3.Session(
-        aws_access_key_id=env_vars['aws_access_key_id'],
-        aws_secret_access_key=env_vars['aws_secret_access_key'],
-        region_name=env_vars['region']
-    )
-    
-    # Get the needed variables
-    dynamodb = Session.resource('dynamodb')
-    table = dynamodb.Table(env_vars['insight_p3_table_name'])
+    table = get_participant_table()
 
     response = table.get_item(Key={"participant_id": participant_id})
     
@@ -60,33 +39,23 @@ def get_participant_dynamo_db(participant_id: str):
     
     return study_start_date, study_end_date, schedule_type
 
-def merge_survey_data():
-    env_vars = read_env_variables()
-
+def read_survey_files(env_vars: dict):
     # Load Files
     try:
-        survey_1a_df = pl.read_csv(env_vars['qualtrics_survey_p3_1a_path'], schema_overrides={"Date/Time": str})
-        survey_1b_df = pl.read_csv(env_vars['qualtrics_survey_p3_1b_path'], schema_overrides={"Date/Time": str})
-        survey_2a_df = pl.read_csv(env_vars['qualtrics_survey_p3_2a_path'], schema_overrides={"Date/Time": str})
-        survey_2b_df = pl.read_csv(env_vars['qualtrics_survey_p3_2b_path'], schema_overrides={"Date/Time": str})
-        survey_3_df = pl.read_csv(env_vars['qualtrics_survey_p3_3_path'], schema_overrides={"Date/Time": str})
-        survey_4_df = pl.read_csv(env_vars['qualtrics_survey_p3_4_path'], schema_overrides={"Date/Time": str})
-
+        survey_dfs = {
+            source: pl.read_csv(env_vars[key], schema_overrides={"Date/Time": str})
+            for source, key in SURVEY_SOURCE_KEYS.items()
+        }
         print("Survey files loaded successfully.")
     except Exception as e:
         print(f"Error loading survey files: {e}")
         return None
 
     # Add column to identify survey source
-    survey_1a_df = survey_1a_df.with_columns(pl.lit("Survey 1A").alias("Survey_Source"))
-    survey_1b_df = survey_1b_df.with_columns(pl.lit("Survey 1B").alias("Survey_Source"))
-    survey_2a_df = survey_2a_df.with_columns(pl.lit("Survey 2A").alias("Survey_Source"))
-    survey_2b_df = survey_2b_df.with_columns(pl.lit("Survey 2B").alias("Survey_Source"))
-    survey_3_df = survey_3_df.with_columns(pl.lit("Survey 3").alias("Survey_Source"))
-    survey_4_df = survey_4_df.with_columns(pl.lit("Survey 4").alias("Survey_Source"))
+    survey_dfs = [df.with_columns(pl.lit(source).alias("Survey_Source")) for source, df in survey_dfs.items()]
 
     # Merge Files
-    merged_df = pl.concat([survey_1a_df, survey_1b_df, survey_2a_df, survey_2b_df, survey_3_df, survey_4_df], how="vertical")
+    merged_df = pl.concat(survey_dfs, how="vertical")
     print("Survey files merged successfully.")
 
     merged_df = merged_df.with_columns(pl.col("Date/Time").str.strptime(pl.Datetime, format="%Y-%m-%d %H:%M:%S", strict=False))
@@ -103,6 +72,91 @@ def merge_survey_data():
 
     return merged_df
 
+@timed('surveys.merge')
+def merge_survey_data():
+    env_vars = read_env_variables()
+
+    # Append only new responses to the local store, then read the merged view from it
+    try:
+        ingest_survey_exports(env_vars)
+    except Exception as e:
+        print(f"Error ingesting survey files, reading the exports directly: {e}")
+        return read_survey_files(env_vars)
+
+    store_files = survey_store_files()
+    if not store_files:
+        print("No survey responses found in the survey store.")
+        return None
+
+    # The concat + sort only runs again when ingestion appended a new part
+    return load_cached_frame("merged_surveys", store_files, lambda: scan_survey_store().sort("Date/Time", descending=True).collect())
+
+MERGED_SURVEY_COLUMNS = STORE_COLUMNS
+
+def _to_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    return value
+
+def scan_merged_surveys(start_date=None, end_date=None, survey_sources: list = None, initials: list = None, columns: list = None):
+    """Lazily scan the merged Qualtrics survey data with the filters pushed into the scan.
+
+    Reads the incrementally ingested survey store (see survey_ingest), falling back to
+    scanning the CSV exports directly. Only the requested survey sources are scanned
+    and only MERGED_SURVEY_COLUMNS are read from each export.
+
+    Args:
+        start_date (date | str, optional): First response date to keep (America/New_York).
+        end_date (date | str, optional): Last response date to keep (America/New_York).
+        survey_sources (list, optional): Survey sources to keep, e.g. ["Survey 1A", "Survey 4"].
+        initials (list, optional): Normalized participant initials to keep.
+        columns (list, optional): Columns to return. Defaults to MERGED_SURVEY_COLUMNS.
+
+    Returns:
+        pl.LazyFrame: The filtered survey responses, newest first, or None if the exports are not configured.
+    """
+    env_vars = read_env_variables()
+    start_date = _to_date(start_date)
+    end_date = _to_date(end_date)
+    sources = [source for source in SURVEY_SOURCE_KEYS if survey_sources is None or source in survey_sources]
+
+    try:
+        ingest_survey_exports(env_vars)
+        lf = scan_survey_store(sources)
+    except Exception as e:
+        print(f"Error reading the survey store, scanning the exports directly: {e}")
+        lf = None
+
+    if lf is None:
+        source_paths = {source: env_vars.get(SURVEY_SOURCE_KEYS[source]) for source in sources}
+        missing = [SURVEY_SOURCE_KEYS[source] for source, path in source_paths.items() if not path]
+        if missing:
+            print(f"Error loading survey files: missing {', '.join(missing)}")
+            return None
+
+        raw_frames = []
+        for source, path in source_paths.items():
+            raw_lf = pl.scan_csv(path, schema_overrides={"Date/Time": pl.Utf8}).select(["Name", "Age", "Date/Time"])
+            # Coarse filter on the raw Denver timestamp string (pushed into the CSV scan);
+            # one day of slack on each side covers the Denver -> New York conversion.
+            if start_date is not None:
+                raw_lf = raw_lf.filter(pl.col("Date/Time") >= str(start_date - timedelta(days=1)))
+            if end_date is not None:
+                raw_lf = raw_lf.filter(pl.col("Date/Time") < str(end_date + timedelta(days=2)))
+            raw_frames.append(normalize_survey_rows(raw_lf, source))
+        lf = pl.concat(raw_frames, how="vertical")
+
+    if start_date is not None:
+        lf = lf.filter(pl.col("Date/Time").dt.date() >= start_date)
+    if end_date is not None:
+        lf = lf.filter(pl.col("Date/Time").dt.date() <= end_date)
+    if initials is not None:
+        lf = lf.filter(pl.col("Name").is_in(list(initials)))
+
+    return lf.select(columns or MERGED_SURVEY_COLUMNS).sort("Date/Time", descending=True)
+
 def match_initials_table(merged_df, participant_db_df):
     merged_df = merged_df.join(
         participant_db_df.select(['Initials', 'Participant ID #']),
@@ -124,219 +178,16 @@ def generate_compliance_table_individual(participant_id: str):
     
 
 def get_survey_send_times_all(input_date: str):
-    # Convert input_date to datetime object
+    # Send times for every schedule on the input date and the day before, fetched from all
+    # twelve log groups concurrently and split into one wide table per schedule
     input_date_dt = datetime.strptime(input_date, "%Y-%m-%d")
     yesterday_dt = input_date_dt - timedelta(days=1)
     
-    # Create timezone-aware datetime objects
-    est = pytz.timezone('America/New_York')
-    input_date_aware = est.localize(input_date_dt)
-    yesterday_aware = est.localize(yesterday_dt)
-    
-    schedule_types = ["Early Bird Schedule", "Standard Schedule", "Night Owl Schedule"]
-    
-    env_vars = read_env_variables()
-    
-    Session = boto3.Session(
-        aws_access_key_id=env_vars['aws_access_key_id'],
-        aws_secret_access_key=env_vars['aws_secret_access_key'],
-        region_name=env_vars['region']
-    )
-    
-    cloudwatch_logs = Session.client('logs')
-    
-    early_bird_data = defaultdict(lambda: {"Survey 1": None, "Survey 2": None, "Survey 3": None, "Survey 4": None})
-    standard_data = defaultdict(lambda: {"Survey 1": None, "Survey 2": None, "Survey 3": None, "Survey 4": None})
-    night_owl_data = defaultdict(lambda: {"Survey 1": None, "Survey 2": None, "Survey 3": None, "Survey 4": None})
-    
-    
-    for schedules in schedule_types:
-        
-        if schedules == "Early Bird Schedule":
-            log_group_name_list = ['/aws/lambda/INSIGHT_Part3_earlybird_message1', 
-                                '/aws/lambda/INSIGHT_Part3_earlybird_message2',
-                                '/aws/lambda/INSIGHT_Part3_earlybird_message3',
-                                '/aws/lambda/INSIGHT_Part3_earlybird_message4']
-            
-            # Should generate one row for the input date and another with the previous dates send times
-            for log_group_name in log_group_name_list:
-                response = cloudwatch_logs.describe_log_streams(
-                    logGroupName=log_group_name,
-                    orderBy='LastEventTime',
-                    descending=True,
-                    limit=50
-                )
-                log_stream_df = pl.DataFrame(response['logStreams'])
-                
-                log_stream_df = log_stream_df.with_columns(
-                    pl.from_epoch(pl.col('firstEventTimestamp'), time_unit="ms").alias('firstEventTimestamp'),
-                    pl.from_epoch(pl.col('lastEventTimestamp'), time_unit="ms").alias('lastEventTimestamp'),
-                    pl.from_epoch(pl.col('creationTime'), time_unit="ms").alias('creationTime')
-                )
-                
-                log_stream_df = log_stream_df.with_columns(
-                    pl.col('firstEventTimestamp').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('firstEventTimestamp'),
-                    pl.col('lastEventTimestamp').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('lastEventTimestamp'),
-                    pl.col('creationTime').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('creationTime')
-                )
-                
-                # Filter BEFORE converting to string - look for both yesterday and today
-                log_stream_df = log_stream_df.filter(
-                    (pl.col('firstEventTimestamp') >= yesterday_aware) &
-                    (pl.col('firstEventTimestamp') < input_date_aware + timedelta(days=1))
-                )
-                
-                # NOW convert to string after filtering
-                log_stream_df = log_stream_df.with_columns(
-                    pl.col('firstEventTimestamp').dt.strftime("%Y-%m-%dT%H:%M:%S").alias('firstEventTimestamp')
-                )
-                
-                # Put values in early_bird_dict
-                for row in log_stream_df.iter_rows(named=True):
-                    date_str = row['firstEventTimestamp'][:10]  # Extract "YYYY-MM-DD"
-                    time_str = row['firstEventTimestamp'][11:19]  # Extract "HH:MM:SS"
-                    
-                    if "message1" in log_group_name:
-                        early_bird_data[date_str]["Survey 1"] = time_str
-                    elif "message2" in log_group_name:
-                        early_bird_data[date_str]["Survey 2"] = time_str
-                    elif "message3" in log_group_name:
-                        early_bird_data[date_str]["Survey 3"] = time_str
-                    elif "message4" in log_group_name:
-                        early_bird_data[date_str]["Survey 4"] = time_str
-                        
-                
-        elif schedules == "Standard Schedule":
-            log_group_name_list = ['/aws/lambda/INSIGHT_Part3_standard_message1', 
-                                '/aws/lambda/INSIGHT_Part3_standard_message2',
-                                '/aws/lambda/INSIGHT_Part3_standard_message3',
-                                '/aws/lambda/INSIGHT_Part3_standard_message4']
-            
-            for log_group_name in log_group_name_list:
-                response = cloudwatch_logs.describe_log_streams(
-                    logGroupName=log_group_name,
-                    orderBy='LastEventTime',
-                    descending=True,
-                    limit=50
-                )
-                log_stream_df = pl.DataFrame(response['logStreams'])
-                
-                log_stream_df = log_stream_df.with_columns(
-                    pl.from_epoch(pl.col('firstEventTimestamp'), time_unit="ms").alias('firstEventTimestamp'),
-                    pl.from_epoch(pl.col('lastEventTimestamp'), time_unit="ms").alias('lastEventTimestamp'),
-                    pl.from_epoch(pl.col('creationTime'), time_unit="ms").alias('creationTime')
-                )
-                
-                log_stream_df = log_stream_df.with_columns(
-                    pl.col('firstEventTimestamp').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('firstEventTimestamp'),
-                    pl.col('lastEventTimestamp').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('lastEventTimestamp'),
-                    pl.col('creationTime').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('creationTime')
-                )
-                
-                log_stream_df = log_stream_df.filter(
-                    (pl.col('firstEventTimestamp') >= yesterday_aware) &
-                    (pl.col('firstEventTimestamp') < input_date_aware + timedelta(days=1))
-                )
-                
-                log_stream_df = log_stream_df.with_columns(
-                    pl.col('firstEventTimestamp').dt.strftime("%Y-%m-%dT%H:%M:%S").alias('firstEventTimestamp')
-                )
-
-                for row in log_stream_df.iter_rows(named=True):
-                    date_str = row['firstEventTimestamp'][:10]  # Extract "YYYY-MM-DD"
-                    time_str = row['firstEventTimestamp'][11:19]  # Extract "HH:MM:SS"
-                    
-                    if "message1" in log_group_name:
-                        standard_data[date_str]["Survey 1"] = time_str
-                    elif "message2" in log_group_name:
-                        standard_data[date_str]["Survey 2"] = time_str
-                    elif "message3" in log_group_name:
-                        standard_data[date_str]["Survey 3"] = time_str
-                    elif "message4" in log_group_name:
-                        standard_data[date_str]["Survey 4"] = time_str
-                        
-        elif schedules == "Night Owl Schedule":
-            log_group_name_list = ['/aws/lambda/INSIGHT_Part3_nightowl_message1',
-                                '/aws/lambda/INSIGHT_Part3_nightowl_message2',
-                                '/aws/lambda/INSIGHT_Part3_nightowl_message3',
-                                '/aws/lambda/INSIGHT_Part3_nightowl_message4']
-            
-            for log_group_name in log_group_name_list:
-                response = cloudwatch_logs.describe_log_streams(
-                    logGroupName=log_group_name,
-                    orderBy='LastEventTime',
-                    descending=True,
-                    limit=50
-                )
-                log_stream_df = pl.DataFrame(response['logStreams'])
-                
-                log_stream_df = log_stream_df.with_columns(
-                    pl.from_epoch(pl.col('firstEventTimestamp'), time_unit="ms").alias('firstEventTimestamp'),
-                    pl.from_epoch(pl.col('lastEventTimestamp'), time_unit="ms").alias('lastEventTimestamp'),
-                    pl.from_epoch(pl.col('creationTime'), time_unit="ms").alias('creationTime')
-                )
-                
-                log_stream_df = log_stream_df.with_columns(
-                    pl.col('firstEventTimestamp').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('firstEventTimestamp'),
-                    pl.col('lastEventTimestamp').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('lastEventTimestamp'),
-                    pl.col('creationTime').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('creationTime')
-                )
-                
-                log_stream_df = log_stream_df.filter(
-                    (pl.col('firstEventTimestamp') >= yesterday_aware) &
-                    (pl.col('firstEventTimestamp') < input_date_aware + timedelta(days=1))
-                )
-                
-                log_stream_df = log_stream_df.with_columns(
-                    pl.col('firstEventTimestamp').dt.strftime("%Y-%m-%dT%H:%M:%S").alias('firstEventTimestamp')
-                )
-
-                for row in log_stream_df.iter_rows(named=True):
-                    date_str = row['firstEventTimestamp'][:10]  # Extract "YYYY-MM-DD"
-                    time_str = row['firstEventTimestamp'][11:19]  # Extract "HH:MM:SS"
-                    
-                    if "message1" in log_group_name:
-                        night_owl_data[date_str]["Survey 1"] = time_str
-                    elif "message2" in log_group_name:
-                        night_owl_data[date_str]["Survey 2"] = time_str
-                    elif "message3" in log_group_name:
-                        night_owl_data[date_str]["Survey 3"] = time_str
-                    elif "message4" in log_group_name:
-                        night_owl_data[date_str]["Survey 4"] = time_str
-    
-    # Convert dicts to dataframes with proper structure
-    early_bird_rows = []
-    for date, surveys in sorted(early_bird_data.items()):
-        early_bird_rows.append({
-            "Date": date,
-            "Survey 1": surveys["Survey 1"],
-            "Survey 2": surveys["Survey 2"],
-            "Survey 3": surveys["Survey 3"],
-            "Survey 4": surveys["Survey 4"]
-        })
-    early_bird_df = pl.DataFrame(early_bird_rows)
+    send_times = fetch_send_times(yesterday_dt.date(), input_date_dt.date())
     
-    standard_rows = []
-    for date, surveys in sorted(standard_data.items()):
-        standard_rows.append({
-            "Date": date,
-            "Survey 1": surveys["Survey 1"],
-            "Survey 2": surveys["Survey 2"],
-            "Survey 3": surveys["Survey 3"],
-            "Survey 4": surveys["Survey 4"]
-        })
-    standard_schedule_df = pl.DataFrame(standard_rows)
-    
-    night_owl_rows = []
-    for date, surveys in sorted(night_owl_data.items()):
-        night_owl_rows.append({
-            "Date": date,
-            "Survey 1": surveys["Survey 1"],
-            "Survey 2": surveys["Survey 2"],
-            "Survey 3": surveys["Survey 3"],
-            "Survey 4": surveys["Survey 4"]
-        })
-    night_owl_df = pl.DataFrame(night_owl_rows)
+    early_bird_df = send_times_wide(send_times, "Early Bird Schedule")
+    standard_schedule_df = send_times_wide(send_times, "Standard Schedule")
+    night_owl_df = send_times_wide(send_times, "Night Owl Schedule")
     
     return early_bird_df, standard_schedule_df, night_owl_df
 
@@ -354,749 +205,111 @@ def get_survey_send_times(participant_id: str):
         eager=True
     )
     
-    if schedule_type == "Early Bird Schedule":
-        log_group_name_list = ['/aws/lambda/INSIGHT_Part3_earlybird_message1', 
-                            '/aws/lambda/INSIGHT_Part3_earlybird_message2',
-                            '/aws/lambda/INSIGHT_Part3_earlybird_message3',
-                            '/aws/lambda/INSIGHT_Part3_earlybird_message4']
-    elif schedule_type == "Standard Schedule":
-        log_group_name_list = ['/aws/lambda/INSIGHT_Part3_standard_message1', 
-                                '/aws/lambda/INSIGHT_Part3_standard_message2',
-                                '/aws/lambda/INSIGHT_Part3_standard_message3',
-                                '/aws/lambda/INSIGHT_Part3_standard_message4']
-    elif schedule_type == "Night Owl Schedule":
-        log_group_name_list = ['/aws/lambda/INSIGHT_Part3_nightowl_message1', 
-                                '/aws/lambda/INSIGHT_Part3_nightowl_message2',
-                                '/aws/lambda/INSIGHT_Part3_nightowl_message3',
-                                '/aws/lambda/INSIGHT_Part3_nightowl_message4']
-    else:
+    if schedule_type not in SCHEDULE_TYPES:
         raise ValueError(f"Unknown schedule type: {schedule_type}")
     
-    env_vars = read_env_variables()
-    
-    Session = boto3.Session(
-        aws_access_key_id=env_vars['aws_access_key_id'],
-        aws_secret_access_key=env_vars['aws_secret_access_key'],
-        region_name=env_vars['region']
-    )
-    
-    cloudwatch_logs = Session.client('logs')
-    
-    send_time_dict = {str(date): [] for date in date_range}
-    for log_group_name in log_group_name_list:
-        response = cloudwatch_logs.describe_log_streams(
-            logGroupName=log_group_name,
-            orderBy='LastEventTime',
-            descending=True,
-            limit=50
-        )
-        log_stream_df = pl.DataFrame(response['logStreams'])
-        
-        log_stream_df = log_stream_df.with_columns(
-            pl.from_epoch(pl.col('firstEventTimestamp'), time_unit="ms").alias('firstEventTimestamp'),
-            pl.from_epoch(pl.col('lastEventTimestamp'), time_unit="ms").alias('lastEventTimestamp'),
-            pl.from_epoch(pl.col('creationTime'), time_unit="ms").alias('creationTime')
-        )
-        
-        log_stream_df = log_stream_df.with_columns(
-            pl.col('firstEventTimestamp').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('firstEventTimestamp'),
-            pl.col('lastEventTimestamp').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('lastEventTimestamp'),
-            pl.col('creationTime').dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York").alias('creationTime')
-        )
-        
-        study_start_dt = pl.lit(study_start_date).dt.replace_time_zone("America/New_York").dt.cast_time_unit("ms")
-        study_end_dt = pl.lit(study_end_date + timedelta(days=1)).dt.replace_time_zone("America/New_York").dt.cast_time_unit("ms")
-        log_stream_df = log_stream_df.filter(
-            (pl.col('firstEventTimestamp') >= study_start_dt) &
-            (pl.col('firstEventTimestamp') < study_end_dt)
-        )
-        log_stream_df = log_stream_df.with_columns(
-            pl.col('firstEventTimestamp').dt.strftime("%Y-%m-%dT%H:%M:%S").alias('firstEventTimestamp')
-        )
-        
-        # with pl.Config(tbl_rows=-1, tbl_cols=-1):
-        #      display(log_stream_df)
-        
-        for date in date_range:
-            match = None
-            date_str = str(date)
-            for row in log_stream_df.iter_rows(named=True):
-                # Check if the timestamp string starts with the date (e.g., '2025-08-12')
-                if date_str in row['firstEventTimestamp']:
-                    match = row
-                    break
-            if match and match['firstEventTimestamp'] is not None:
-                # firstEventTimestamp is already a string in "%Y-%m-%dT%H:%M:%S" format
-                time_str = match['firstEventTimestamp'][11:19]  # Extract "HH:MM:SS"
-                send_time_dict[date_str].append(time_str)
-            else:
-                send_time_dict[date_str].append(None)
-                
-        # Convert send_time_dict to dataframe
-        send_time_df = pl.DataFrame({
-            "Date": list(send_time_dict.keys()),
-            "Survey 1": [times[0] if len(times) > 0 else None for times in send_time_dict.values()],
-            "Survey 2": [times[1] if len(times) > 1 else None for times in send_time_dict.values()],
-            "Survey 3": [times[2] if len(times) > 2 else None for times in send_time_dict.values()],
-            "Survey 4": [times[3] if len(times) > 3 else None for times in send_time_dict.values()]
-        })
-    
-    #print(send_time_df)
+    # Read from the local send time store (synced from CloudWatch only for dates it lacks)
+    send_times = fetch_send_times(study_start_date, study_end_date, [schedule_type])
+    send_time_df = send_times_wide(send_times, schedule_type, dates=date_range.to_list())
     
     return send_time_df
 
 def get_dynamo_table():
     env_vars = read_env_variables()
-    #print(env_vars)
-
-    Session = boto3.Session(
-        aws_access_key_id=env_vars['aws_access_key_id'],
-        aws_secret_access_key=env_vars['aws_secret_access_key'],
-        region_name=env_vars['region']
-    )
-
-    # Get the needed variables
-    dynamodb = Session.resource('dynamodb')
-    table = dynamodb.Table(env_vars['insight_p3_table_name'])
-
-    response = table.scan()
-
-    data = response['Items']
-    df = pl.DataFrame(data)
+    df = scan_participant_table()
     return env_vars, df
 
 """Individual Participant Compliance Check Page Methods"""
 
+@timed('compliance.individual')
 def generate_compliance_table_individual(participant_id: str):
-    study_start_date, study_end_date, schedule_type = get_participant_dynamo_db(participant_id)
-    
-    study_start_date = datetime.strptime(study_start_date, "%Y-%m-%d")
-    study_end_date = datetime.strptime(study_end_date, "%Y-%m-%d")
-    
-    # Make df from study start and end date in the first column, the other columns names are "Survey 1", "Survey 2", "Survey 3", and "Survey 4." Keep those empty
-    date_range = pl.date_range(
-        start=study_start_date,
-        end=study_end_date,
-        interval="1d",
-        eager=True
+    user_info, message = get_user_info(participant_id)
+    if user_info is None:
+        raise KeyError(participant_id)
+    schedule_type = user_info['schedule_type']
+    
+    participant = get_participant_directory().lookup(participant_id)
+    if participant is None:
+        raise ValueError(f"Participant {participant_id} is in DynamoDB but not in the participant database")
+    if participant['needs_age']:
+        print(f"Warning: The initials {participant['Initials']} are shared by multiple participants: {get_participant_directory().ids_for_initials(participant['Initials'])}")
+    
+    participants = pl.DataFrame([{
+        "Participant ID": int(participant_id),
+        "Initials": participant['Initials'],
+        "Age": participant['Age'],
+        "Needs Age": participant['needs_age'],
+        "Schedule Type": schedule_type,
+        "Start Date": datetime.strptime(user_info['start_date'], "%Y-%m-%d").date(),
+        "End Date": datetime.strptime(user_info['end_date'], "%Y-%m-%d").date(),
+        "Message Randomizer": [int(x) for x in user_info.get('message_randomizer', [])]
+    }], schema=TIMELINE_PARTICIPANT_SCHEMA)
+    
+    # Survey send time data, already long and typed
+    send_times = fetch_send_times(user_info['start_date'], user_info['end_date'], [schedule_type])
+    
+    # Only materialize this participant's responses inside their study window
+    merged_df = scan_merged_surveys(
+        start_date=user_info['start_date'],
+        end_date=user_info['end_date'],
+        initials=[participant['Initials']]
+    ).collect()
+    
+    compliance_df = compliance_timeline(participants, merged_df, send_times.select("Schedule Type", "Date", "Survey", "Send Time"))
+    return compliance_df.drop("Participant ID")
+
+TIMELINE_PARTICIPANT_SCHEMA = {
+    "Participant ID": pl.Int64,
+    "Initials": pl.Utf8,
+    "Age": pl.Int64,
+    "Needs Age": pl.Boolean,
+    "Schedule Type": pl.Utf8,
+    "Start Date": pl.Date,
+    "End Date": pl.Date,
+    "Message Randomizer": pl.List(pl.Int64),
+}
+
+@timed('compliance.timeline')
+def compliance_timeline(participants: pl.DataFrame, merged_df: pl.DataFrame, send_times: pl.DataFrame, current_day=None,
+                        single_window: tuple = SINGLE_RESPONSE_WINDOW, multiple_window: tuple = MULTIPLE_RESPONSE_WINDOW) -> pl.DataFrame:
+    # Build every participant's (date x survey) grid over their study window, join responses and send
+    # times once and evaluate all cells in one pass. participants follows TIMELINE_PARTICIPANT_SCHEMA.
+    current_day = current_day or study_today()
+    survey_numbers = pl.DataFrame({"Survey": [1, 2, 3, 4]})
+    
+    grid = (
+        participants
+        .with_columns(pl.date_ranges("Start Date", "End Date", interval="1d").alias("Date"))
+        .explode("Date")
+        .join(survey_numbers, how="cross")
+        .with_columns(((pl.col("Date") - pl.col("Start Date")).dt.total_days() + 1).alias("Day in Study"))
     )
-    compliance_df = pl.DataFrame({
-        "Date": date_range,
-        "Survey 1": [None] * len(date_range),
-        "Survey 2": [None] * len(date_range),
-        "Survey 3": [None] * len(date_range),
-        "Survey 4": [None] * len(date_range)
-    })
-    #display(compliance_df)
-    
-    participant_db = get_participant_initials()
-    participant_row = participant_db.filter(pl.col('Participant ID #') == participant_id)
-    initials = participant_row.select('Initials').to_series()[0]
-    
-    # Check if the initials are the same as anyone elses in participant db
-    same_initials_df = participant_db.filter(pl.col('Initials') == initials).filter(pl.col('Participant ID #') != participant_id)
-    if same_initials_df.height > 0:
-        print(f"Warning: The initials {initials} are shared by multiple participants: {same_initials_df.select('Participant ID #').to_series().to_list()}")
-        use_age = True
-        print(f"Use_age: {use_age}")
-        age = participant_row.select('Age').to_series()[0]
-    else:
-        use_age = False
-        age = None
-        print(f"Use_age: {use_age}")
-    
-    # Survey send time data
-    survey_send_time_df = get_survey_send_times(participant_id)
-    
-    merged_df = merge_survey_data()
     
-    # Split the date/time column into separate date and time columns
-    merged_df = merged_df.with_columns(
-        pl.col("Date/Time").dt.date().alias("Date"),
-        pl.col("Date/Time").dt.time().alias("Time")
+    # Survey 2 in phase 2 follows the participant's message randomizer (days 5-12): 1 -> 2A, 0 -> 2B
+    day = pl.col("Day in Study")
+    randomized = pl.col("Message Randomizer").list.get(day - 5, null_on_oob=True)
+    grid = grid.with_columns(
+        pl.when(pl.col("Date") > current_day).then(None)
+          .when((pl.col("Survey") == 2) & day.is_between(5, 12)).then(
+              pl.when(randomized == 1).then(pl.lit("Survey 2A"))
+                .when(randomized == 0).then(pl.lit("Survey 2B"))
+          )
+          .otherwise(expected_survey_source(day, pl.col("Survey")))
+          .alias("Survey_Source")
     )
     
-    # Checking Survey 1
-    compliance_df = check_survey_1(participant_id, initials, study_start_date, study_end_date, merged_df, survey_send_time_df, compliance_df, use_age, age)
-    #display(compliance_df)
-    compliance_df = check_survey_2(participant_id, initials, study_start_date, study_end_date, merged_df, survey_send_time_df, compliance_df, use_age, age)
-    #display(compliance_df)
-    compliance_df = check_survey_3(participant_id, initials, study_start_date, study_end_date, merged_df, survey_send_time_df, compliance_df, use_age, age)
-    #display(compliance_df)
-    compliance_df = check_survey_4(participant_id, initials, study_start_date, study_end_date, merged_df, survey_send_time_df, compliance_df, use_age, age)
-    #display(compliance_df)
-    
-    return compliance_df
-
-def check_survey_1(participant_id: str, initials: str, start_date: datetime, end_date: datetime, merged_df: pl.DataFrame, send_time_df: pl.DataFrame, compliance_df: pl.DataFrame, use_age: bool = False, age: int = None):
-    current_day = datetime.now().date()
-    #display(compliance_df)
-    
-    survey_1_dict = {
-        "Date": [],
-        "Time": [],
-        "Code": []
-    }
-    for row in compliance_df.iter_rows(named=True):
-        survey_date = row['Date']
-        if survey_date <= current_day:
-            print(f"--- Checking Survey 1 for date: {survey_date} ---")
-
-            day_in_study = (survey_date - start_date.date()).days + 1
-            print(f"Day in study: {day_in_study}")
-
-            if (day_in_study >= 1 and day_in_study <= 4) or (day_in_study == 13 or day_in_study == 14):
-                if use_age is True:
-                    survey_1b_row = merged_df.filter(
-                        (pl.col('Date') == survey_date) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 1B') &
-                        (pl.col('Age') == age)
-                    )
-                else:
-                    survey_1b_row = merged_df.filter(
-                        (pl.col('Date') == survey_date) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 1B')
-                    )
-                    
-                if not survey_1b_row.is_empty():
-                    print(f"Survey 1B completed on {survey_date}")
-                    if len(survey_1b_row) == 1:
-                        print(f"Found one entry for Survey 1B on {survey_date}.")
-                        date = survey_1b_row["Date"][0]
-                        time = survey_1b_row["Time"][0]
-                        name = survey_1b_row["Name"][0]
-                        
-                        code = compare_times(survey_1b_row, send_time_df, 1)
-                        
-                        # put values in survey_1_dict
-                        survey_1_dict["Date"].append(date)
-                        survey_1_dict["Time"].append(time)
-                        survey_1_dict["Code"].append(code)
-                    elif len(survey_1b_row) > 1:
-                        print(f"Multiple entries found for Survey 1B on {survey_date} for participant {initials}. Taking the first entry.")
-                        date = survey_1b_row["Date"][0]
-                        name = survey_1b_row["Name"][0]
-                        
-                        code = compare_times(survey_1b_row, send_time_df, 1)
-                        # put values in survey_1_dict
-                        survey_1_dict["Date"].append(date)
-                        survey_1_dict["Time"].append(None)
-                        survey_1_dict["Code"].append(code)
-                else:
-                    print(f"No entry found for Survey 1B on {survey_date} for participant {initials}.")
-                    # Add this block - append None values when no entry found
-                    survey_1_dict["Date"].append(survey_date)
-                    survey_1_dict["Time"].append(None)
-                    survey_1_dict["Code"].append("✗ NR")
-                    
-            elif day_in_study >= 5 and day_in_study <= 12:
-                if use_age is True:
-                    survey_1a_row = merged_df.filter(
-                        (pl.col('Date') == survey_date) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 1A') &
-                        (pl.col('Age') == age)
-                    )
-                else:
-                    survey_1a_row = merged_df.filter(
-                        (pl.col('Date') == survey_date) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 1A')
-                    )
-                    
-                if not survey_1a_row.is_empty():
-                    print(f"Survey 1A completed on {survey_date}")
-                    if len(survey_1a_row) == 1:
-                        print(f"Found one entry for Survey 1A on {survey_date}.")
-                        date = survey_1a_row["Date"][0]
-                        time = survey_1a_row["Time"][0]
-                        name = survey_1a_row["Name"][0]
-                        
-                        code = compare_times(survey_1a_row, send_time_df, 1)
-                        # Add this - append to dict for single entry
-                        survey_1_dict["Date"].append(date)
-                        survey_1_dict["Time"].append(time)
-                        survey_1_dict["Code"].append(code)
-                    elif len(survey_1a_row) > 1:
-                        print(f"Multiple entries found for Survey 1A on {survey_date} for participant {initials}. Taking the first entry.")
-                        date = survey_1a_row["Date"][0]
-                        name = survey_1a_row["Name"][0]
-                        
-                        code = compare_times(survey_1a_row, send_time_df, 1)
-                        # put values in survey_1_dict
-                        survey_1_dict["Date"].append(date)
-                        survey_1_dict["Time"].append(None)
-                        survey_1_dict["Code"].append(code)
-                else:
-                    print(f"No entry found for Survey 1A on {survey_date} for participant {initials}.")
-                    code = "✗ NR" # No Response
-                    # put values in survey_1_dict
-                    survey_1_dict["Date"].append(survey_date)
-                    survey_1_dict["Time"].append(None)
-                    survey_1_dict["Code"].append(code)
-        else:
-            # Add this block - for dates in the future, still append to maintain length
-            survey_1_dict["Date"].append(survey_date)
-            survey_1_dict["Time"].append(None)
-            survey_1_dict["Code"].append(None)
-    
-    # Put values in compliance_df (already has "Date" column and "Survey 1" columns). Match the date values to ensure correct placement. For the "Survey 1" column put f"{code} {time}"
-    ## Join compliance_df with survey_1_dict on Date
-    survey_1_df = pl.DataFrame(survey_1_dict)
-    compliance_df = compliance_df.join(
-        survey_1_df,
-        on="Date",
-        how="left",
-        suffix="_survey1"
-    ).with_columns(
-        pl.when(pl.col("Code").is_not_null())
-          .then(pl.col("Code"))
-          .otherwise(None)
-          .alias("Survey 1")
-    ).drop(["Time", "Code"])
-    
-    
-
-    #display(compliance_df)
-    return compliance_df
-
-def check_survey_2(participant_id: str, initials: str, start_date: datetime, end_date: datetime, merged_df: pl.DataFrame, send_time_df: pl.DataFrame, compliance_df: pl.DataFrame, use_age: bool = False, age: int = None):
-    current_day = datetime.now().date()
-    survey_2_dict = {
-        "Date": [],
-        "Time": [],
-        "Code": []
-    }
-    
-    # Get the participant's details from dynamo table
-    user_info = get_user_info(participant_id)
-    user_info = user_info[0]
-    message_randomizer = user_info['message_randomizer']
-    
-    # Convert all values in message randomizer to ints
-    message_randomizer = [int(x) for x in message_randomizer]
-    print(message_randomizer)
-    day_list = list(range(5,13,1))
-    zip_day_message = dict(zip(day_list, message_randomizer))
-    print(zip_day_message)
-    
-    for row in compliance_df.iter_rows(named=True):
-        survey_date = row['Date']
-        if survey_date <= current_day:
-            print(f"--- Checking Survey 2 for date: {survey_date} ---")
-
-            day_in_study = (survey_date - start_date.date()).days + 1
-            print(f"Day in study: {day_in_study}")
-
-            if (day_in_study >= 1 and day_in_study <= 4) or (day_in_study == 13 or day_in_study == 14):
-                if use_age is True:
-                    survey_2b_row = merged_df.filter(
-                        (pl.col('Date') == survey_date) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 2B') &
-                        (pl.col('Age') == age)
-                    )
-                else:
-                    survey_2b_row = merged_df.filter(
-                        (pl.col('Date') == survey_date) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 2B')
-                    )
-                    
-                if not survey_2b_row.is_empty():
-                    print(f"Survey 2B completed on {survey_date}")
-                    if len(survey_2b_row) == 1:
-                        print(f"Found one entry for Survey 2B on {survey_date}.")
-                        date = survey_2b_row["Date"][0]
-                        time = survey_2b_row["Time"][0]
-                        name = survey_2b_row["Name"][0]
-                        
-                        code = compare_times(survey_2b_row, send_time_df, 2)
-                        
-                        # put values in survey_2_dict
-                        survey_2_dict["Date"].append(date)
-                        survey_2_dict["Time"].append(time)
-                        survey_2_dict["Code"].append(code)
-                    elif len(survey_2b_row) > 1:
-                        print(f"Multiple entries found for Survey 2B on {survey_date} for participant {initials}. Taking the first entry.")
-                        date = survey_2b_row["Date"][0]
-                        name = survey_2b_row["Name"][0]
-                        
-                        code = compare_times(survey_2b_row, send_time_df, 2)
-                        # put values in survey_2_dict
-                        survey_2_dict["Date"].append(date)
-                        survey_2_dict["Time"].append(None)
-                        survey_2_dict["Code"].append(code)
-                else:
-                    print(f"No entry found for Survey 2B on {survey_date} for participant {initials}.")
-                    # Add this block - append None values when no entry found
-                    survey_2_dict["Date"].append(survey_date)
-                    survey_2_dict["Time"].append(None)
-                    survey_2_dict["Code"].append("✗ NR")
-            elif (day_in_study >= 5 and day_in_study <= 12):
-                message_number = int(zip_day_message[day_in_study])
-                print(f"[Survey 2] day_in_study={day_in_study} message_number={message_number} type={type(message_number)} zip_day_message={zip_day_message}")
-                print(zip_day_message)
-                
-                if message_number == 1:
-                    survey_2a_source = f"Survey 2A"
-                    
-                    if use_age is True:
-                        survey_2a_row = merged_df.filter(
-                            (pl.col('Date') == survey_date) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == survey_2a_source) &
-                            (pl.col('Age') == age)
-                        )
-                    else:
-                        survey_2a_row = merged_df.filter(
-                            (pl.col('Date') == survey_date) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == survey_2a_source)
-                        )
-                        
-                    if not survey_2a_row.is_empty():
-                        print(f"Survey 2A completed on {survey_date}")
-                        if len(survey_2a_row) == 1:
-                            print(f"Found one entry for Survey 2A on {survey_date}.")
-                            date = survey_2a_row["Date"][0]
-                            time = survey_2a_row["Time"][0]
-                            name = survey_2a_row["Name"][0]
-                            
-                            code = compare_times(survey_2a_row, send_time_df, 2)
-                            # Add this - append to dict for single entry
-                            survey_2_dict["Date"].append(date)
-                            survey_2_dict["Time"].append(time)
-                            survey_2_dict["Code"].append(code)
-                        elif len(survey_2a_row) > 1:
-                            print(f"Multiple entries found for Survey 2A on {survey_date} for participant {initials}. Taking the first entry.")
-                            date = survey_2a_row["Date"][0]
-                            name = survey_2a_row["Name"][0]
-                            
-                            code = compare_times(survey_2a_row, send_time_df, 2)
-                            # put values in survey_2_dict
-                            survey_2_dict["Date"].append(date)
-                            survey_2_dict["Time"].append(None)
-                            survey_2_dict["Code"].append(code)
-                elif message_number == 0:
-                    survey_2b_source = f"Survey 2B"
-                    
-                    if use_age is True:
-                        survey_2b_row = merged_df.filter(
-                            (pl.col('Date') == survey_date) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == survey_2b_source) &
-                            (pl.col('Age') == age)
-                        )
-                    else:
-                        survey_2b_row = merged_df.filter(
-                            (pl.col('Date') == survey_date) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == survey_2b_source)
-                        )
-                        
-                    if not survey_2b_row.is_empty():
-                        print(f"Survey 2B completed on {survey_date}")
-                        if len(survey_2b_row) == 1:
-                            print(f"Found one entry for Survey 2B on {survey_date}.")
-                            date = survey_2b_row["Date"][0]
-                            time = survey_2b_row["Time"][0]
-                            name = survey_2b_row["Name"][0]
-                            
-                            code = compare_times(survey_2b_row, send_time_df, 2)
-                            # Add this - append to dict for single entry
-                            survey_2_dict["Date"].append(date)
-                            survey_2_dict["Time"].append(time)
-                            survey_2_dict["Code"].append(code)
-                        elif len(survey_2b_row) > 1:
-                            print(f"Multiple entries found for Survey 2B on {survey_date} for participant {initials}. Taking the first entry.")
-                            date = survey_2b_row["Date"][0]
-                            name = survey_2b_row["Name"][0]
-                            
-                            code = compare_times(survey_2b_row, send_time_df, 2)
-                            # put values in survey_2_dict
-                            survey_2_dict["Date"].append(date)
-                            survey_2_dict["Time"].append(None)
-                            survey_2_dict["Code"].append(code)
-                    
-                else:
-                    print(f"No entry found for Survey 2 on {survey_date} for participant {initials}.")
-                    code = "✗ NR" # No Response
-                    # put values in survey_2_dict
-                    survey_2_dict["Date"].append(survey_date)
-                    survey_2_dict["Time"].append(None)
-                    survey_2_dict["Code"].append(code)
-        else:
-            # Add this block - for dates in the future, still append to maintain length
-            survey_2_dict["Date"].append(survey_date)
-            survey_2_dict["Time"].append(None)
-            survey_2_dict["Code"].append(None)
-    
-    # Put values in compliance_df (already has "Date" column and "Survey 2" columns). Match the date values to ensure correct placement. For the "Survey 2" column put f"{code} {time}"
-    ## Join compliance_df with survey_2_dict on Date
-    survey_2_df = pl.DataFrame(survey_2_dict)
-    compliance_df = compliance_df.join(
-        survey_2_df,
-        on="Date",
-        how="left",
-        suffix="_survey2"
-    ).with_columns(
-        pl.when(pl.col("Code").is_not_null())
-          .then(pl.col("Code"))
-          .otherwise(None)
-          .alias("Survey 2")
-    ).drop(["Time", "Code"])
-
-    return compliance_df
-
-def check_survey_3(participant_id: str, initials: str, start_date: datetime, end_date: datetime, merged_df: pl.DataFrame, send_time_df: pl.DataFrame, compliance_df: pl.DataFrame, use_age: bool = False, age: int = None):
-    current_day = datetime.now().date()
-    survey_3_dict = {
-        "Date": [],
-        "Time": [],
-        "Code": []
-    }
-    
-    for row in compliance_df.iter_rows(named=True):
-        survey_date = row['Date']
-        if survey_date <= current_day:
-            print(f"--- Checking Survey 3 for date: {survey_date} ---")
-
-            day_in_study = (survey_date - start_date.date()).days + 1
-            print(f"Day in study: {day_in_study}")
-
-            if day_in_study > 0 and day_in_study <= 14:
-                if use_age is True:
-                    survey_3_row = merged_df.filter(
-                        (pl.col('Date') == survey_date) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 3') &
-                        (pl.col('Age') == age)
-                    )
-                else:
-                    survey_3_row = merged_df.filter(
-                        (pl.col('Date') == survey_date) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 3')
-                    )
-                    
-                if not survey_3_row.is_empty():
-                    print(f"Survey 3 completed on {survey_date}")
-                    if len(survey_3_row) == 1:
-                        print(f"Found one entry for Survey 3 on {survey_date}.")
-                        date = survey_3_row["Date"][0]
-                        time = survey_3_row["Time"][0]
-                        name = survey_3_row["Name"][0]
-                        
-                        code = compare_times(survey_3_row, send_time_df, 3)
-                        
-                        # put values in survey_3_dict
-                        survey_3_dict["Date"].append(date)
-                        survey_3_dict["Time"].append(time)
-                        survey_3_dict["Code"].append(code)
-                    elif len(survey_3_row) > 1:
-                        print(f"Multiple entries found for Survey 3 on {survey_date} for participant {initials}. Taking the first entry.")
-                        date = survey_3_row["Date"][0]
-                        name = survey_3_row["Name"][0]
-                        
-                        code = compare_times(survey_3_row, send_time_df, 3)
-                        # put values in survey_3_dict
-                        survey_3_dict["Date"].append(date)
-                        survey_3_dict["Time"].append(None)
-                        survey_3_dict["Code"].append(code)
-                else:
-                    print(f"No entry found for Survey 3 on {survey_date} for participant {initials}.")
-                    # Add this block - append None values when no entry found
-                    survey_3_dict["Date"].append(survey_date)
-                    survey_3_dict["Time"].append(None)
-                    survey_3_dict["Code"].append("✗ NR")
-        else:
-            # Add this block - for dates in the future, still append to maintain length
-            survey_3_dict["Date"].append(survey_date)
-            survey_3_dict["Time"].append(None)
-            survey_3_dict["Code"].append(None)
-            
-    # Put values in compliance_df (already has "Date" column and "Survey 3" columns). Match the date values to ensure correct placement. For the "Survey 3" column put f"{code} {time}"
-    ## Join compliance_df with survey_3_dict on Date
-    survey_3_df = pl.DataFrame(survey_3_dict)
-    compliance_df = compliance_df.join(
-        survey_3_df,
-        on="Date",
-        how="left",
-        suffix="_survey3"
-    ).with_columns(
-        pl.when(pl.col("Code").is_not_null())
-          .then(pl.col("Code"))
-          .otherwise(None)
-          .alias("Survey 3")
-    ).drop(["Time", "Code"])
-    
-    return compliance_df
-
-def check_survey_4(participant_id: str, initials: str, start_date: datetime, end_date: datetime, merged_df: pl.DataFrame, send_time_df: pl.DataFrame, compliance_df: pl.DataFrame, use_age: bool = False, age: int = None):
-    current_day = datetime.now().date()
-    survey_4_dict = {
-        "Date": [],
-        "Time": [],
-        "Code": []
-    }
-    
-    for row in compliance_df.iter_rows(named=True):
-        survey_date = row['Date']
-        if survey_date <= current_day:
-            print(f"--- Checking Survey 4 for date: {survey_date} ---")
-
-            day_in_study = (survey_date - start_date.date()).days + 1
-            print(f"Day in study: {day_in_study}")
-
-            if day_in_study > 0 and day_in_study <= 14:
-                if use_age is True:
-                    survey_4_row = merged_df.filter(
-                        (pl.col('Date') == survey_date) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 4') &
-                        (pl.col('Age') == age)
-                    )
-                else:
-                    survey_4_row = merged_df.filter(
-                        (pl.col('Date') == survey_date) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 4')
-                    )
-                    
-                if not survey_4_row.is_empty():
-                    print(f"Survey 4 completed on {survey_date}")
-                    if len(survey_4_row) == 1:
-                        print(f"Found one entry for Survey 4 on {survey_date}.")
-                        date = survey_4_row["Date"][0]
-                        time = survey_4_row["Time"][0]
-                        name = survey_4_row["Name"][0]
-                        
-                        code = compare_times(survey_4_row, send_time_df, 4)
-                        
-                        # put values in survey_4_dict
-                        survey_4_dict["Date"].append(date)
-                        survey_4_dict["Time"].append(time)
-                        survey_4_dict["Code"].append(code)
-                    elif len(survey_4_row) > 1:
-                        print(f"Multiple entries found for Survey 4 on {survey_date} for participant {initials}. Taking the first entry.")
-                        date = survey_4_row["Date"][0]
-                        name = survey_4_row["Name"][0]
-                        
-                        code = compare_times(survey_4_row, send_time_df, 4)
-                        # put values in survey_4_dict
-                        survey_4_dict["Date"].append(date)
-                        survey_4_dict["Time"].append(None)
-                        survey_4_dict["Code"].append(code)
-                else:
-                    print(f"No entry found for Survey 4 on {survey_date} for participant {initials}.")
-                    # Add this block - append None values when no entry found
-                    survey_4_dict["Date"].append(survey_date)
-                    survey_4_dict["Time"].append(None)
-                    survey_4_dict["Code"].append("✗ NR")
-        else:
-            # Add this block - for dates in the future, still append to maintain length
-            survey_4_dict["Date"].append(survey_date)
-            survey_4_dict["Time"].append(None)
-            survey_4_dict["Code"].append(None)
-            
-    # Put values in compliance_df (already has "Date" column and "Survey 4" columns). Match the date values to ensure correct placement. For the "Survey 4" column put f"{code} {time}"
-    ## Join compliance_df with survey_4_dict on Date
-    survey_4_df = pl.DataFrame(survey_4_dict)
-    compliance_df = compliance_df.join(
-        survey_4_df,
-        on="Date",
-        how="left",
-        suffix="_survey4"
-    ).with_columns(
-        pl.when(pl.col("Code").is_not_null())
-          .then(pl.col("Code"))
-          .otherwise(None)
-          .alias("Survey 4")
-    ).drop(["Time", "Code"])
-    
-    return compliance_df
-
-def compare_times(filtered_row, send_time_df, survey_number):
-    #print("DEBUG: compare_times called")
-    #print(f"DEBUG: filtered_row columns: {filtered_row.columns}")
-    #print(f"DEBUG: filtered_row shape: {filtered_row.shape}")
-    
-    # Get the send time column based on survey number from the send_time_df
-    survey_col = f"Survey {survey_number}"
-    survey_date = str(filtered_row["Date"][0])
+    grid = grid.join(send_times, on=["Schedule Type", "Date", "Survey"], how="left", maintain_order="left")
+    grid = match_responses(grid, merged_df, ["Participant ID", "Date", "Survey"], single_window, multiple_window)
+    grid = grid.with_columns(compliance_status(skip_unsent=False).alias("Status"))
     
-    #print(f"DEBUG: survey_date = {survey_date}, survey_complete_time = {survey_complete_time}")
-    #print(f"DEBUG: send_time_df columns: {send_time_df.columns}")
-    #print(f"DEBUG: send_time_df Date column sample: {send_time_df['Date'].head()}")
-    
-    send_time_row = send_time_df.filter(pl.col("Date") == survey_date)
-    
-    #print(f"DEBUG: send_time_row length: {len(send_time_row)}")
-
-    if len(filtered_row) == 0:
-        print(f"No send time found for {survey_col} on {survey_date}.")
-        code = "Issue"
-        return code
-    elif len(filtered_row) > 1:
-        # Iterate through each entry and compare times, if one is within 1 hour, print and stop
-        for i in range(len(filtered_row)):
-            survey_complete_time = str(filtered_row["Time"][i])
-            actual_time = send_time_row[survey_col][0]
-            
-            
-            # Check if send time is within 1 hour of survey completion time
-            if actual_time is None:
-                print(f"No actual send time recorded for {survey_col} on {survey_date}.")
-                code = "Issue"
-                return code
-            
-            survey_complete_dt = datetime.strptime(f"{survey_date} {survey_complete_time}", "%Y-%m-%d %H:%M:%S")
-            actual_send_dt = datetime.strptime(f"{survey_date} {actual_time}", "%Y-%m-%d %H:%M:%S")
-            time_diff = (survey_complete_dt - actual_send_dt).total_seconds() / 60  # in minutes
-            
-            # Convert Survey complete time to America/New_York timezone and a string to be put in the table
-            est = pytz.timezone('America/New_York')
-            survey_complete_dt = est.localize(survey_complete_dt)
-            actual_send_dt = est.localize(actual_send_dt)
-            survey_complete_time_str = survey_complete_dt.strftime("%Y-%m-%d %H:%M:%S")
-            
-            if (time_diff <= 60 and time_diff > 0):
-                print(f"{survey_col} on {survey_date}: Survey Complete Time = {survey_complete_time_str}, Actual Send Time = {actual_time}, Time Difference (minutes) = {time_diff}")
-                code = f"✓ MR {survey_complete_time_str}" # Multiple Responses, one within range
-                return code
-            else:
-                code = "✗ MR" # Multiple Responses, none within range
-                return code
-    else:
-        survey_complete_time = str(filtered_row["Time"][0])
-        actual_time = send_time_row[survey_col][0]
-        
-        # Check if send time is within 1 hour of survey completion time
-        if actual_time is None:
-            print(f"No actual send time recorded for {survey_col} on {survey_date}.")
-            code = "Issue"
-            return code
-        
-        survey_complete_dt = datetime.strptime(f"{survey_date} {survey_complete_time}", "%Y-%m-%d %H:%M:%S")
-        actual_send_dt = datetime.strptime(f"{survey_date} {actual_time}", "%Y-%m-%d %H:%M:%S")
-        time_diff = (survey_complete_dt - actual_send_dt).total_seconds() / 60  # in minutes
-        
-        # Convert Survey complete time to America/New_York timezone and a string to be put in the table
-        est = pytz.timezone('America/New_York')
-        survey_complete_dt = est.localize(survey_complete_dt)
-        actual_send_dt = est.localize(actual_send_dt)
-        survey_complete_time_str = survey_complete_dt.strftime("%Y-%m-%d %H:%M:%S")
-
-        
-        if (time_diff <= 60 and time_diff > -10):
-            code = f"✓ SR {survey_complete_time_str}" # Single Response within range
-            print(f"{survey_col} on {survey_date}: Survey Complete Time = {survey_complete_time_str}, Actual Send Time = {actual_time}, Time Difference (minutes) = {time_diff}")
-        else:
-            code = f"✗ SR {survey_complete_time_str}" # Single Response, not within range
-    return code
+    return (
+        grid.group_by(["Participant ID", "Date"])
+        .agg([
+            pl.col("Status").filter(pl.col("Survey") == survey).first().alias(f"Survey {survey}")
+            for survey in [1, 2, 3, 4]
+        ])
+        .sort(["Participant ID", "Date"])
+    )
 
 def compliance_over_time_plot(compliance_df_percentage: pl.DataFrame):
 
@@ -1156,6 +369,7 @@ def calculate_compliance_percentage(compliance_df: pl.DataFrame):
 
     return compliance_df
 
+@timed('participants.list')
 def get_participant_list(date_input: str):
     # Convert date_input to datetime object
     try:
@@ -1164,26 +378,8 @@ def get_participant_list(date_input: str):
         print("Invalid date format. Please use YYYY-MM-DD.")
         return None
     
-    env_vars = read_env_variables()
-    
-    aws_access_key_id = env_vars.get('aws_access_key_id') or env_vars.get('AWS_ACCESS_KEY_ID')
-    aws_secret_access_key = env_vars.get('aws_secret_access_key') or env_vars.get('AWS_SECRET_ACCESS_KEY')
-    region_name = env_vars.get('region') or env_vars.get('REGION') or env_vars.get('AWS_DEFAULT_REGION')
-    table_name = env_vars.get('insight_p3_table_name')
-
     try:
-        
-        Session = boto3.Session(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name
-        )
-        
-        dynamodb = Session.resource('dynamodb')
-        table = dynamodb.Table(table_name)
-        response = table.scan()
-        data = response['Items']
-        df = pl.DataFrame(data)
+        df = scan_participant_table()
         
         df = df.with_columns([
             pl.col('start_date').str.strptime(pl.Date, format="%Y-%m-%d").alias('start_date'),
@@ -1242,509 +438,212 @@ def get_participant_list(date_input: str):
     else:
         return df
 
-def compliance_table_daily_report(date_input: str, participant_df: pl.DataFrame, early_bird_df: pl.DataFrame, standard_schedule_df: pl.DataFrame, night_owl_df: pl.DataFrame, merged_df: pl.DataFrame):
-    date_input_dt = datetime.strptime(date_input, "%Y-%m-%d")
-    date_input_yesterday = date_input_dt - timedelta(days=1)
+SCHEDULE_TYPES = ["Early Bird Schedule", "Standard Schedule", "Night Owl Schedule"]
+
+# Columns of the daily report: (column name, survey number, days before the report date)
+DAILY_REPORT_SLOTS = [
+    ("Survey 4 (Yesterday)", 4, 1),
+    ("Survey 1", 1, 0),
+    ("Survey 2", 2, 0),
+    ("Survey 3", 3, 0),
+    ("Survey 4", 4, 0),
+]
+
+def expected_survey_source(day_in_study: pl.Expr, survey_number: pl.Expr) -> pl.Expr:
+    # Surveys 1 and 2 use the B version in phases 1 and 3 (days 1-4, 13-14) and the A version in phase 2 (days 5-12);
+    # surveys 3 and 4 are the same every day of the study
+    phase_2 = day_in_study.is_between(5, 12)
+    phase_1_or_3 = day_in_study.is_between(1, 4) | day_in_study.is_between(13, 14)
+    return (
+        pl.when(survey_number.is_in([1, 2]) & phase_1_or_3).then(pl.format("Survey {}B", survey_number))
+          .when(survey_number.is_in([1, 2]) & phase_2).then(pl.format("Survey {}A", survey_number))
+          .when(survey_number.is_in([3, 4]) & day_in_study.is_between(1, 14)).then(pl.format("Survey {}", survey_number))
+          .otherwise(None)
+    )
+
+def send_times_long(send_time_dfs: dict) -> pl.DataFrame:
+    # Turn wide per-schedule send time tables ({schedule type: Date, Survey 1..4}) into one
+    # (Schedule Type, Date, Survey, Send Time) table. Tables from send_times_wide are already typed;
+    # "YYYY-MM-DD" / "HH:MM:SS" strings are still accepted.
+    frames = []
+    for schedule_type, wide_df in send_time_dfs.items():
+        if wide_df is None or "Date" not in wide_df.columns:
+            continue
+        survey_cols = [c for c in wide_df.columns if c.startswith("Survey ")]
+        if wide_df.schema["Date"] == pl.Utf8:
+            wide_df = wide_df.with_columns(pl.col("Date").str.to_date("%Y-%m-%d"))
+        wide_df = wide_df.with_columns([
+            pl.col(c).str.to_time("%H:%M:%S", strict=False) if wide_df.schema[c] == pl.Utf8 else pl.col(c).cast(pl.Time)
+            for c in survey_cols
+        ])
+        frames.append(
+            wide_df.unpivot(index="Date", on=survey_cols, variable_name="Survey", value_name="Send Time")
+            .select(
+                pl.lit(schedule_type).alias("Schedule Type"),
+                pl.col("Date"),
+                pl.col("Survey").str.extract(r"(\d+)").cast(pl.Int64),
+                pl.col("Send Time")
+            )
+        )
+    if not frames:
+        return pl.DataFrame(schema={"Schedule Type": pl.Utf8, "Date": pl.Date, "Survey": pl.Int64, "Send Time": pl.Time})
+    return pl.concat(frames, how="vertical").drop_nulls("Send Time")
+
+def participant_attributes() -> pl.DataFrame:
+    # Initials/age per participant plus whether the initials are shared (then responses must match on age too)
+    directory = get_participant_directory()
+    return directory.frame.select(
+        pl.col("Participant ID #").cast(pl.Int64).alias("Participant ID"),
+        pl.col("Initials"),
+        pl.col("Age").cast(pl.Int64, strict=False),
+        pl.col("Initials").is_in(list(directory.shared_initials)).fill_null(False).alias("Needs Age")
+    )
+
+def sent_at(date_col: str = "Date", time_col: str = "Send Time") -> pl.Expr:
+    # Send date + local send time as an America/New_York Datetime, comparable with survey completion times
+    return (
+        pl.col(date_col).dt.combine(pl.col(time_col))
+        .dt.replace_time_zone("America/New_York", ambiguous="earliest", non_existent="null")
+    )
+
+def evaluate_response_windows(matched: pl.DataFrame, key_cols: list,
+                              single_window: tuple = SINGLE_RESPONSE_WINDOW,
+                              multiple_window: tuple = MULTIPLE_RESPONSE_WINDOW) -> pl.DataFrame:
+    """Evaluate every response against its survey's send time in one pass.
+
+    Args:
+        matched (pl.DataFrame): One row per response with key_cols, "Completed At" and "Sent At"
+            (timezone-aware Datetimes; "Sent At" is null when the survey was not sent).
+        key_cols (list): Columns identifying one expected survey.
+        single_window (tuple, optional): (early, late) minutes for a lone response. Defaults to (-10, 60).
+        multiple_window (tuple, optional): (early, late) minutes when there are several responses. Defaults to (0, 60).
+
+    Returns:
+        pl.DataFrame: One row per key with "Responses", "In Window" (any response inside the window),
+        "Completed At" and "Latency (min)" of the newest in-window response, or of the newest response
+        if none is in the window (the time the MR/SR cell shows).
+    """
+    responses = pl.len().over(key_cols)
+    early = pl.when(responses == 1).then(pl.lit(single_window[0])).otherwise(pl.lit(multiple_window[0]))
+    late = pl.when(responses == 1).then(pl.lit(single_window[1])).otherwise(pl.lit(multiple_window[1]))
+    latency = (pl.col("Completed At") - pl.col("Sent At")).dt.total_seconds() / 60
+    
+    evaluated = matched.with_columns(latency.alias("Latency (min)")).with_columns(
+        ((pl.col("Latency (min)") > early) & (pl.col("Latency (min)") <= late)).fill_null(False).alias("In Window")
+    )
+    # In-window responses first, newest first within each group
+    chosen_first = [~pl.col("In Window"), pl.col("Completed At")]
+    return evaluated.group_by(key_cols).agg(
+        pl.len().alias("Responses"),
+        pl.col("In Window").any(),
+        pl.col("Completed At").sort_by(chosen_first, descending=[False, True]).first(),
+        pl.col("Latency (min)").sort_by(chosen_first, descending=[False, True]).first()
+    )
+
+def match_responses(expected_df: pl.DataFrame, merged_df: pl.DataFrame, key_cols: list,
+                    single_window: tuple = SINGLE_RESPONSE_WINDOW,
+                    multiple_window: tuple = MULTIPLE_RESPONSE_WINDOW) -> pl.DataFrame:
+    # Attach the evaluated responses to every expected survey, matching on (initials, date,
+    # survey source) and on age when the initials are shared
+    responses = merged_df.select(
+        pl.col("Name").alias("Initials"),
+        pl.col("Age").cast(pl.Int64, strict=False).alias("Response Age"),
+        pl.col("Date/Time").dt.date().alias("Date"),
+        pl.col("Date/Time").dt.convert_time_zone("America/New_York").alias("Completed At"),
+        pl.col("Survey_Source")
+    )
+    matched = (
+        expected_df.select(list(dict.fromkeys(key_cols + ["Initials", "Age", "Needs Age", "Date", "Survey_Source", "Send Time"])))
+        .join(responses, on=["Initials", "Date", "Survey_Source"], how="inner")
+        .filter(~pl.col("Needs Age") | (pl.col("Response Age") == pl.col("Age")))
+        .with_columns(sent_at().alias("Sent At"))
+    )
+    evaluated = evaluate_response_windows(matched, key_cols, single_window, multiple_window)
+    return expected_df.join(evaluated, on=key_cols, how="left", maintain_order="left")
+
+def compliance_status(skip_unsent: bool = True) -> pl.Expr:
+    # Status codes from the columns added by match_responses: ✓/✗ SR for a single response,
+    # ✓ MR when any of several responses is inside the window, ✗ MR when none is, ✗ NR for no response.
+    # With skip_unsent, surveys that were never sent stay blank; otherwise a response to an
+    # unsent survey is flagged as an "Issue".
+    completed_str = pl.col("Completed At").dt.strftime("%Y-%m-%d %H:%M:%S")
+    status = pl.when(pl.col("Survey_Source").is_null()).then(None)
+    if skip_unsent:
+        status = status.when(pl.col("Send Time").is_null()).then(None)
+    return (
+        status
+          .when(pl.col("Responses").is_null()).then(pl.lit("✗ NR"))
+          .when(pl.col("Send Time").is_null()).then(pl.lit("Issue"))
+          .when(pl.col("Responses") == 1).then(
+              pl.when(pl.col("In Window"))
+                .then(pl.format("✓ SR {}", completed_str))
+                .otherwise(pl.format("✗ SR {}", completed_str))
+          )
+          .otherwise(
+              pl.when(pl.col("In Window"))
+                .then(pl.format("✓ MR {}", completed_str))
+                .otherwise(pl.lit("✗ MR"))
+          )
+    )
+
+@timed('compliance.daily_report')
+def compliance_table_daily_report(date_input: str, participant_df: pl.DataFrame, early_bird_df: pl.DataFrame, standard_schedule_df: pl.DataFrame, night_owl_df: pl.DataFrame, merged_df: pl.DataFrame,
+                                  single_window: tuple = SINGLE_RESPONSE_WINDOW, multiple_window: tuple = MULTIPLE_RESPONSE_WINDOW, include_latency: bool = False):
+    # include_latency adds a "<column> Latency (min)" column per survey (minutes from send to the evaluated response)
+    report_date = datetime.strptime(date_input, "%Y-%m-%d").date()
     
     currently_in_study = participant_df['currently_in_study']
     
-    merged_df = merged_df.with_columns(
-        pl.col("Date/Time").dt.date().alias("Date"),
-        pl.col("Date/Time").dt.time().alias("Time")
+    # One row per participant with their directory attributes and day in study
+    participants = currently_in_study.select(
+        pl.col("Participant ID").cast(pl.Int64),
+        "Schedule Type", "Start Date", "End Date"
+    ).join(participant_attributes(), on="Participant ID", how="left", maintain_order="left").with_columns(
+        ((pl.lit(report_date) - pl.col("Start Date")).dt.total_days() + 1).alias("Day in Study")
     )
     
-    # Make a blank dataframe with
-    compliance_df = pl.DataFrame({
-        "Participant ID": currently_in_study["Participant ID"],
-        "Initials": pl.Series([None] * currently_in_study.height, dtype=pl.Utf8),
-        "Age": pl.Series([None] * currently_in_study.height, dtype=pl.Int64),
-        "Day in Study": [None] * currently_in_study.height,
-        "Schedule Type": currently_in_study["Schedule Type"],
-        "Start Date": currently_in_study["Start Date"],
-        "End Date": currently_in_study["End Date"],
-        "Survey 4 (Yesterday)": [None] * currently_in_study.height,
-        "Survey 1": [None] * currently_in_study.height,
-        "Survey 2": [None] * currently_in_study.height,
-        "Survey 3": [None] * currently_in_study.height,
-        "Survey 4": [None] * currently_in_study.height
-    })
-    
-    # Calculate day in the study from start date and date_input, add as a column to compliance_df
-    compliance_df = compliance_df.with_columns(
-        ((pl.lit(date_input_dt).cast(pl.Date) - pl.col("Start Date")).dt.total_days() + 1).alias("Day in Study")
+    # Participants x expected surveys for yesterday's Survey 4 and today's Surveys 1-4
+    slots = pl.DataFrame(
+        [(column, survey, report_date - timedelta(days=days_back)) for column, survey, days_back in DAILY_REPORT_SLOTS],
+        schema={"Column": pl.Utf8, "Survey": pl.Int64, "Date": pl.Date},
+        orient="row"
+    )
+    expected = participants.join(slots, how="cross").with_columns(
+        pl.when(pl.col("Column") == "Survey 4 (Yesterday)")
+          .then(pl.lit("Survey 4"))
+          .otherwise(expected_survey_source(pl.col("Day in Study"), pl.col("Survey")))
+          .alias("Survey_Source")
     )
     
-    # Iterate over participants currently in study and check compliance for each survey, put results in compliance_df
-    for row in compliance_df.iter_rows(named=True):
-        # participant info
-        participant_id = row['Participant ID']
-        schedule_type = row['Schedule Type']
-        day_in_study = row['Day in Study']
-        
-        # get initials from participant_db using participant_id
-        initials_df = get_participant_initials()
-        
-         # get initials from participant_db using participant_id
-        initials_df = get_participant_initials()
-        
-        initials_row = initials_df.filter(pl.col("Participant ID #") == participant_id)
-        initials_row = initials_df.filter(pl.col("Participant ID #") == participant_id)
-        initials = initials_row.select('Initials').to_series()[0]
-        age = int(initials_row.select('Age').to_series()[0])
-
-        
-        #put initials in compliance_df
-        compliance_df = compliance_df.with_columns(
-            pl.when(pl.col("Participant ID") == participant_id)
-              .then(pl.lit(initials))
-              .otherwise(pl.col("Initials"))
-              .alias("Initials")
-        )
-        
-        # check if anyone has the same initials
-        same_initials_df = initials_df.filter(pl.col('Initials') == initials).filter(pl.col('Participant ID #') != participant_id)
-        if same_initials_df.height > 0:
-            print(f"Warning: The initials {initials} are shared by multiple participants: {same_initials_df.select('Participant ID #').to_series().to_list()}")
-            use_age = True
-            print(f"Use_age: {use_age}")
-            age = initials_row.select('Age').to_series()[0]
-        else:
-            use_age = False
-            print(f"Use_age: {use_age}")
-        
-        #put age in compliance_df
-        compliance_df = compliance_df.with_columns(
-            pl.when(pl.col("Participant ID") == participant_id)
-              .then(pl.lit(age, dtype=pl.Int64))
-              .otherwise(pl.col("Age"))
-              .alias("Age")
-        )
-        
-        # get schedule
-        if schedule_type == "Early Bird Schedule":
-            survey_send_time_df = early_bird_df
-        elif schedule_type == "Standard Schedule":
-            survey_send_time_df = standard_schedule_df
-        elif schedule_type == "Night Owl Schedule":
-            survey_send_time_df = night_owl_df
-        else:
-            print(f"Unknown schedule type {schedule_type} for participant {participant_id}. Skipping.")
-            return
-        
-        # Check survey 4 compliance for yesterday's date and put in "Survey 4 (Yesterday)" column
-        try:
-            survey_4_yesterday_send_time = survey_send_time_df.filter(pl.col("Date") == str(date_input_yesterday.date()))
-            survey_4_yesterday_was_sent = (
-                not survey_4_yesterday_send_time.is_empty() and
-                survey_4_yesterday_send_time["Survey 4"][0] is not None
-            )
-            
-            if not survey_4_yesterday_was_sent:
-                pass
-            else:
-                if use_age is True:
-                    survey_4_yesterday_row = merged_df.filter(
-                        (pl.col('Date') == date_input_yesterday) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 4') &
-                        (pl.col('Age') == age)
-                    )
-                else:
-                    survey_4_yesterday_row = merged_df.filter(
-                        (pl.col('Date') == date_input_yesterday) &
-                        (pl.col('Name') == initials) &
-                        (pl.col('Survey_Source') == 'Survey 4')
-                    )
-                
-                if not survey_4_yesterday_row.is_empty():
-                    if len(survey_4_yesterday_row) == 1:
-                        code = compare_times(survey_4_yesterday_row, survey_send_time_df, 4)
-                        compliance_df = compliance_df.with_columns(
-                            pl.when(pl.col("Participant ID") == participant_id)
-                                .then(pl.lit(code))
-                                .otherwise(pl.col("Survey 4 (Yesterday)"))
-                                .alias("Survey 4 (Yesterday)")
-                        )
-                    elif len(survey_4_yesterday_row) > 1:
-                        print(f"Multiple entries found for Survey 4 on {date_input_yesterday} for participant {initials}. Taking the first entry.")
-                        code = compare_times(survey_4_yesterday_row, survey_send_time_df, 4)
-                        compliance_df = compliance_df.with_columns(
-                            pl.when(pl.col("Participant ID") == participant_id)
-                                .then(pl.lit(code))
-                                .otherwise(pl.col("Survey 4 (Yesterday)"))
-                                .alias("Survey 4 (Yesterday)")
-                        )
-                else:
-                    compliance_df = compliance_df.with_columns(
-                        pl.when(pl.col("Participant ID") == participant_id)
-                            .then(pl.lit("✗ NR"))
-                            .otherwise(pl.col("Survey 4 (Yesterday)"))
-                            .alias("Survey 4 (Yesterday)")
-                    )
-        except Exception as e:
-            print(f"Error checking Survey 4 compliance for participant {participant_id} on {date_input_yesterday}: {e}")
-            compliance_df = compliance_df.with_columns(
-                pl.when(pl.col("Participant ID") == participant_id)
-                    .then(pl.lit("Issue"))
-                    .otherwise(pl.col("Survey 4 (Yesterday)"))
-                    .alias("Survey 4 (Yesterday)")
-            )
-        
-        # Check Survey 1 for date_input and put results in "Survey 1" column
-        try:
-            survey_1_send_time = survey_send_time_df.filter(pl.col("Date") == str(date_input_dt.date()))
-            survey_1_was_sent = (
-                not survey_1_send_time.is_empty() and
-                survey_1_send_time["Survey 1"][0] is not None
-            )
-            
-            if not survey_1_was_sent:
-                pass
-            else:
-                if (day_in_study >= 1 and day_in_study <= 4) or (day_in_study == 13 or day_in_study == 14):
-                    if use_age is True:
-                        survey_1b_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 1B') &
-                            (pl.col('Age') == age)
-                        )
-                    else:
-                        survey_1b_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 1B')
-                        )
-                    
-                    if not survey_1b_row.is_empty():
-                        if len(survey_1b_row) == 1:
-                            code = compare_times(survey_1b_row, survey_send_time_df, 1)
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 1"))
-                                    .alias("Survey 1")
-                            )
-                        elif len(survey_1b_row) > 1:
-                            print(f"Multiple entries found for Survey 1 on {date_input} for participant {initials}. Taking the first entry.")
-                            code = compare_times(survey_1b_row, survey_send_time_df, 1)
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 1"))
-                                    .alias("Survey 1")
-                            )
-                    else:
-                        compliance_df = compliance_df.with_columns(
-                            pl.when(pl.col("Participant ID") == participant_id)
-                                .then(pl.lit("✗ NR"))
-                                .otherwise(pl.col("Survey 1"))
-                                .alias("Survey 1")
-                        )
-                elif day_in_study >= 5 and day_in_study <= 12:
-                    if use_age is True:
-                        survey_1a_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 1A') &
-                            (pl.col('Age') == age)
-                        )
-                    else:
-                        survey_1a_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 1A')
-                        )
-                        
-                    if not survey_1a_row.is_empty():
-                        print(f"Survey 1 completed on {date_input_dt}")
-                        if len(survey_1a_row) == 1:
-                            print(f"Found one entry for Survey 1 on {date_input_dt}.")
-                            date = survey_1a_row["Date"][0]
-                            time = survey_1a_row["Time"][0]
-                            name = survey_1a_row["Name"][0]
-                            
-                            code = compare_times(survey_1a_row, survey_send_time_df, 1)
-                            # put values in compliance_df
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 1"))
-                                    .alias("Survey 1")
-                            )
-                        elif len(survey_1a_row) > 1:
-                            print(f"Multiple entries found for Survey 1 on {date_input_dt} for participant {initials}. Taking the first entry.")
-                            date = survey_1a_row["Date"][0]
-                            name = survey_1a_row["Name"][0]
-                            
-                            code = compare_times(survey_1a_row, survey_send_time_df, 1)
-                            # put values in compliance_df
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 1"))
-                                    .alias("Survey 1")
-                            )
-                    else:
-                        print(f"No entry found for Survey 1 on {date_input_dt} for participant {initials}.")
-                        compliance_df = compliance_df.with_columns(
-                            pl.when(pl.col("Participant ID") == participant_id)
-                                .then(pl.lit("✗ NR"))
-                                .otherwise(pl.col("Survey 1"))
-                                .alias("Survey 1")
-                        )
-        except Exception as e:
-            print(f"Error processing Survey 1 for participant {initials}: {e}")
-        
-        # Check Survey 2 for date_input and put results in "Survey 2" column
-        try:
-            survey_2_send_time = survey_send_time_df.filter(pl.col("Date") == str(date_input_dt.date()))
-            survey_2_was_sent = (
-                not survey_2_send_time.is_empty() and
-                survey_2_send_time["Survey 2"][0] is not None
-            )
-            
-            if not survey_2_was_sent:
-                pass
-            else:
-                if (day_in_study >= 1 and day_in_study <= 4) or (day_in_study == 13 or day_in_study == 14):
-                    if use_age is True:
-                        survey_2b_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 2B') &
-                            (pl.col('Age') == age)
-                        )
-                    else:
-                        survey_2b_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 2B')
-                        )
-                    
-                    if not survey_2b_row.is_empty():
-                        print(f"Survey 2 completed on {date_input_dt}")
-                        if len(survey_2b_row) == 1:
-                            print(f"Found one entry for Survey 2 on {date_input_dt}.")
-                            date = survey_2b_row["Date"][0]
-                            time = survey_2b_row["Time"][0]
-                            name = survey_2b_row["Name"][0]
-                            
-                            code = compare_times(survey_2b_row, survey_send_time_df, 2)
-                            # put values in compliance_df
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 2"))
-                                    .alias("Survey 2")
-                            )
-                        elif len(survey_2b_row) > 1:
-                            print(f"Multiple entries found for Survey 2 on {date_input_dt} for participant {initials}. Taking the first entry.")
-                            date = survey_2b_row["Date"][0]
-                            name = survey_2b_row["Name"][0]
-                            
-                            code = compare_times(survey_2b_row, survey_send_time_df, 2)
-                            # put values in compliance_df
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 2"))
-                                    .alias("Survey 2")
-                            )
-                    else:
-                        print(f"No entry found for Survey 2 on {date_input_dt} for participant {initials}.")
-                        compliance_df = compliance_df.with_columns(
-                            pl.when(pl.col("Participant ID") == participant_id)
-                                .then(pl.lit("✗ NR"))
-                                .otherwise(pl.col("Survey 2"))
-                                .alias("Survey 2")
-                        )
-                elif (day_in_study >= 5 and day_in_study <= 12):
-                    if use_age is True:
-                        survey_2a_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 2A') &
-                            (pl.col('Age') == age)
-                        )
-                    else:
-                        survey_2a_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 2A')
-                        )
-                        
-                    if not survey_2a_row.is_empty():
-                        print(f"Survey 2 completed on {date_input_dt}")
-                        if len(survey_2a_row) == 1:
-                            print(f"Found one entry for Survey 2 on {date_input_dt}.")
-                            date = survey_2a_row["Date"][0]
-                            time = survey_2a_row["Time"][0]
-                            name = survey_2a_row["Name"][0]
-                            
-                            code = compare_times(survey_2a_row, survey_send_time_df, 2)
-                            # put values in compliance_df
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 2"))
-                                    .alias("Survey 2")
-                            )
-                        elif len(survey_2a_row) > 1:
-                            print(f"Multiple entries found for Survey 2 on {date_input_dt} for participant {initials}. Taking the first entry.")
-                            date = survey_2a_row["Date"][0]
-                            name = survey_2a_row["Name"][0]
-                            
-                            code = compare_times(survey_2a_row, survey_send_time_df, 2)
-                            # put values in compliance_df
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 2"))
-                                    .alias("Survey 2")
-                            )
-                    else:
-                        print(f"No entry found for Survey 2 on {date_input_dt} for participant {initials}.")
-                        compliance_df = compliance_df.with_columns(
-                            pl.when(pl.col("Participant ID") == participant_id)
-                                .then(pl.lit("✗ NR"))
-                                .otherwise(pl.col("Survey 2"))
-                                .alias("Survey 2")
-                        )
-        except Exception as e:
-            print(f"Error processing Survey 2 for participant {initials}: {e}")
-        
-        # Check Survey 3 for date_input and put results in "Survey 3" column
-        try:
-            survey_3_send_time = survey_send_time_df.filter(pl.col("Date") == str(date_input_dt.date()))
-            survey_3_was_sent = (
-                not survey_3_send_time.is_empty() and
-                survey_3_send_time["Survey 3"][0] is not None
-            )
-            
-            if not survey_3_was_sent:
-                pass
-            else:
-                if day_in_study >= 1 and day_in_study <= 14:
-                    if use_age is True:
-                        survey_3_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 3') &
-                            (pl.col('Age') == age)
-                        )
-                    else:
-                        survey_3_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 3')
-                        )
-                    if not survey_3_row.is_empty():
-                        print(f"Survey 3 completed on {date_input_dt}")
-                        if len(survey_3_row) == 1:
-                            print(f"Found one entry for Survey 3 on {date_input_dt}.")
-                            date = survey_3_row["Date"][0]
-                            time = survey_3_row["Time"][0]
-                            name = survey_3_row["Name"][0]
-                            
-                            code = compare_times(survey_3_row, survey_send_time_df, 3)
-                            # put values in compliance_df
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 3"))
-                                    .alias("Survey 3")
-                            )
-                        elif len(survey_3_row) > 1:
-                            print(f"Multiple entries found for Survey 3 on {date_input_dt} for participant {initials}. Taking the first entry.")
-                            date = survey_3_row["Date"][0]
-                            name = survey_3_row["Name"][0]
-                            
-                            code = compare_times(survey_3_row, survey_send_time_df, 3)
-                            # put values in compliance_df
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 3"))
-                                    .alias("Survey 3")
-                            )
-                    else:
-                        print(f"No entry found for Survey 3 on {date_input_dt} for participant {initials}.")
-                        compliance_df = compliance_df.with_columns(
-                            pl.when(pl.col("Participant ID") == participant_id)
-                                .then(pl.lit("✗ NR"))
-                                .otherwise(pl.col("Survey 3"))
-                                .alias("Survey 3")
-                        )
-        except Exception as e:
-            print(f"Error processing Survey 3 for participant {initials}: {e}")
-            
-        # Check Survey 4 for date_input and put results in "Survey 4" column
-        try:
-            survey_4_send_time = survey_send_time_df.filter(pl.col("Date") == str(date_input_dt.date()))
-            survey_4_was_sent = (
-                not survey_4_send_time.is_empty() and
-                survey_4_send_time["Survey 4"][0] is not None
-        )
-            if not survey_4_was_sent:
-                    pass
-            else:
-                if day_in_study >= 1 and day_in_study <= 14:
-                    if use_age is True:
-                        survey_4_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 4') &
-                            (pl.col('Age') == age)
-                        )
-                    else:
-                        survey_4_row = merged_df.filter(
-                            (pl.col('Date') == date_input_dt) &
-                            (pl.col('Name') == initials) &
-                            (pl.col('Survey_Source') == 'Survey 4')
-                        )
-                    if not survey_4_row.is_empty():
-                        print(f"Survey 4 completed on {date_input_dt}")
-                        if len(survey_4_row) == 1:
-                            print(f"Found one entry for Survey 4 on {date_input_dt}.")
-                            date = survey_4_row["Date"][0]
-                            time = survey_4_row["Time"][0]
-                            name = survey_4_row["Name"][0]
-                            
-                            code = compare_times(survey_4_row, survey_send_time_df, 4)
-                            # put values in compliance_df
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 4"))
-                                    .alias("Survey 4")
-                            )
-                        elif len(survey_4_row) > 1:
-                            print(f"Multiple entries found for Survey 4 on {date_input_dt} for participant {initials}. Taking the first entry.")
-                            date = survey_4_row["Date"][0]
-                            name = survey_4_row["Name"][0]
-                            
-                            code = compare_times(survey_4_row, survey_send_time_df, 4)
-                            # put values in compliance_df
-                            compliance_df = compliance_df.with_columns(
-                                pl.when(pl.col("Participant ID") == participant_id)
-                                    .then(pl.lit(code))
-                                    .otherwise(pl.col("Survey 4"))
-                                    .alias("Survey 4")
-                            )
-                    else:
-                        print(f"No entry found for Survey 4 on {date_input_dt} for participant {initials}.")
-                        compliance_df = compliance_df.with_columns(
-                            pl.when(pl.col("Participant ID") == participant_id)
-                                .then(pl.lit("✗ NR"))
-                                .otherwise(pl.col("Survey 4"))
-                                .alias("Survey 4")
-                        )
-        except Exception as e:
-            print(f"Error processing Survey 4 for participant {initials}: {e}")
+    # Send times for (schedule, date, survey) and the participant's responses
+    send_time_dfs = dict(zip(SCHEDULE_TYPES, [early_bird_df, standard_schedule_df, night_owl_df]))
+    expected = expected.join(
+        send_times_long(send_time_dfs),
+        on=["Schedule Type", "Date", "Survey"],
+        how="left",
+        maintain_order="left"
+    )
+    expected = match_responses(expected, merged_df, ["Participant ID", "Column"], single_window, multiple_window)
+    expected = expected.with_columns(compliance_status().alias("Status"))
+    
+    columns = [column for column, _, _ in DAILY_REPORT_SLOTS]
+    aggregations = [pl.col("Status").filter(pl.col("Column") == column).first().alias(column) for column in columns]
+    if include_latency:
+        aggregations += [
+            pl.col("Latency (min)").filter(pl.col("Column") == column).first().round(1).alias(f"{column} Latency (min)")
+            for column in columns
+        ]
+        columns += [f"{column} Latency (min)" for column in columns]
+    statuses = expected.group_by("Participant ID").agg(aggregations)
+    
+    compliance_df = participants.join(statuses, on="Participant ID", how="left", maintain_order="left").select(
+        "Participant ID", "Initials", "Age", "Day in Study", "Schedule Type", "Start Date", "End Date",
+        *columns
+    )
     
     return compliance_df
 
+@timed('compliance.contact_checks')
 def contact_checks(compliance_df: pl.DataFrame):
     did_not_do_lb = []
     # Check participants in days 5-12 who did not complete Survey 1 (NR), put participant_id in did_not_do_lb list
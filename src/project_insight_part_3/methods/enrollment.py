@@ -0,0 +1,135 @@
+import io
+import json
+import random
+import re
+from datetime import datetime, timedelta
+from importlib.resources import files
+import polars as pl
+from .aws_functions import participant_item
+
+# A participant's end date is their start date + 13 days (14 study days)
+STUDY_LENGTH_DAYS = 13
+
+# Days 4-11 on which a reminder message may be sent; half of them are picked at random
+REMINDER_DAYS = ['Day 4', 'Day 5', 'Day 6', 'Day 7', 'Day 8', 'Day 9', 'Day 10', 'Day 11']
+
+# Bulk enrollment CSV columns, with the header spellings accepted for each
+ENROLLMENT_CSV_COLUMNS = {
+    'participant_id': ['participant_id', 'participant id', 'id'],
+    'start_date': ['start_date', 'start date'],
+    'phone_number': ['phone_number', 'phone number', 'phone'],
+    'lb_link': ['lb_link', 'leaderboard_link', 'leaderboard link'],
+    'schedule': ['schedule', 'schedule_type', 'schedule type'],
+}
+
+
+def load_schedules() -> dict:
+    """Return the send schedules from schedules.json, keyed by schedule type."""
+    schedules_path = files("project_insight_part_3.methods").joinpath("schedules.json")
+    with schedules_path.open("r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def study_end_date(start_date: str) -> str:
+    """Return the end date ("YYYY-MM-DD") for a participant starting on start_date ("YYYY-MM-DD")."""
+    end_date = datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=STUDY_LENGTH_DAYS)
+    return end_date.strftime('%Y-%m-%d')
+
+
+def normalize_phone_number(phone_number: str) -> str:
+    """Strip the number and make sure it starts with +."""
+    phone_number = phone_number.strip()
+    if not phone_number.startswith('+'):
+        phone_number = f"+{phone_number}"
+    return phone_number
+
+
+def shuffle_message_randomizer() -> list:
+    """Return a random reminder schedule for REMINDER_DAYS: four 1s (send a message) and four 0s."""
+    send_randomizer = [1, 1, 1, 1, 0, 0, 0, 0]
+    random.shuffle(send_randomizer)
+    return send_randomizer
+
+
+def read_enrollment_csv(content: bytes) -> list:
+    """Read a bulk enrollment CSV into one dict per row with the ENROLLMENT_CSV_COLUMNS keys.
+
+    Headers are matched case-insensitively; every value is read as text.
+
+    Raises:
+        ValueError: If a required column is missing.
+    """
+    df = pl.read_csv(io.BytesIO(content), infer_schema=False)
+    headers = {column.strip().lower(): column for column in df.columns}
+    renames = {}
+    for key, spellings in ENROLLMENT_CSV_COLUMNS.items():
+        column = next((headers[spelling] for spelling in spellings if spelling in headers), None)
+        if column is None:
+            raise ValueError(f"Missing column '{key}' (accepted headers: {', '.join(spellings)})")
+        renames[column] = key
+    return df.select(list(renames)).rename(renames).to_dicts()
+
+
+def plan_enrollment(rows: list, existing_ids: set = None) -> list:
+    """Validate bulk enrollment rows and compute what would be written for each.
+
+    Applies the same checks as the Add User page and the same rules as the confirm page:
+    end date = start date + STUDY_LENGTH_DAYS, phone numbers prefixed with +, and a
+    shuffled message_randomizer per participant.
+
+    Args:
+        rows (list): Rows from read_enrollment_csv().
+        existing_ids (set, optional): Participant IDs already enrolled; these rows are rejected.
+
+    Returns:
+        list: One dict per row with 'row' (CSV line number), the participant fields, 'end_date',
+        'message_randomizer' and 'error' (None if the row can be written).
+    """
+    existing_ids = existing_ids or set()
+    schedules = load_schedules()
+    seen_ids = set()
+    planned = []
+
+    for index, row in enumerate(rows):
+        values = {key: (row.get(key) or '').strip() for key in ENROLLMENT_CSV_COLUMNS}
+        entry = {'row': index + 2, **values, 'end_date': None, 'message_randomizer': None, 'error': None}
+
+        if not values['participant_id'].isdigit():
+            entry['error'] = 'Participant ID must be an integer'
+        elif int(values['participant_id']) in existing_ids:
+            entry['error'] = 'Participant ID is already enrolled'
+        elif int(values['participant_id']) in seen_ids:
+            entry['error'] = 'Participant ID appears more than once in the file'
+        elif not re.match(r'^\d{4}-\d{2}-\d{2}$', values['start_date']):
+            entry['error'] = 'Start date must be in the format YYYY-MM-DD'
+        elif not re.match(r'^\+\d{11}$', normalize_phone_number(values['phone_number'])):
+            entry['error'] = 'Phone number must be 11 digits in international format (e.g., +12345678901)'
+        elif values['schedule'] not in schedules:
+            entry['error'] = f"Schedule must be one of: {', '.join(schedules)}"
+
+        if entry['error'] is None:
+            try:
+                entry['end_date'] = study_end_date(values['start_date'])
+            except ValueError:
+                entry['error'] = 'Start date is not a valid date'
+
+        if entry['error'] is None:
+            seen_ids.add(int(values['participant_id']))
+            entry['phone_number'] = normalize_phone_number(values['phone_number'])
+            entry['message_randomizer'] = shuffle_message_randomizer()
+        planned.append(entry)
+
+    return planned
+
+
+def enrollment_item(entry: dict) -> dict:
+    """Build the DynamoDB item for a valid plan_enrollment() entry."""
+    return participant_item(
+        entry['participant_id'],
+        entry['start_date'],
+        entry['end_date'],
+        entry['phone_number'],
+        entry['lb_link'],
+        entry['schedule'],
+        entry['message_randomizer']
+    )
@@ -1,5 +1,7 @@
 import os
+import threading
 from dotenv import load_dotenv, find_dotenv, dotenv_values
+from .timing import timed
 
 
 def check_env_file_exists() -> bool:
@@ -92,6 +94,7 @@ def create_env_file(aws_access_key_id: str,
             f.write(f"qualtrics_survey_p3_4_path={qualtrics_survey_p3_4_path}\n")
         if participant_db is not None:
             f.write(f"participant_db={participant_db}\n")
+    _env_config.invalidate()
     
 def update_env_variable(variable: str, value: str):
     """Update a specific environment variable in the .env file.
@@ -116,23 +119,159 @@ def update_env_variable(variable: str, value: str):
         for key, val in env_vars.items():
              if val is None: val = ""
              f.write(f"{key}={val}\n")
+    _env_config.invalidate()
 
+def _parse_env_file(path: str) -> dict:
+    env_vars = {}
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                env_vars[key.strip()] = value.strip()
+    return env_vars
+
+
+# .env keys holding the six Qualtrics export paths
+QUALTRICS_PATH_KEYS = [
+    'qualtrics_survey_p3_1a_path',
+    'qualtrics_survey_p3_1b_path',
+    'qualtrics_survey_p3_2a_path',
+    'qualtrics_survey_p3_2b_path',
+    'qualtrics_survey_p3_3_path',
+    'qualtrics_survey_p3_4_path',
+]
+
+AWS_CREDENTIAL_KEYS = ['aws_access_key_id', 'aws_secret_access_key', 'region',
+                       'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'REGION', 'AWS_DEFAULT_REGION']
+
+
+class EnvConfig:
+    """The .env file in the working directory, parsed once and re-read only when it changes.
+
+    Every access does a cheap stat() of the file; it is re-parsed only when its mtime or
+    size changed (or after invalidate()). Subscribers are called with the set of keys whose
+    values changed, so caches built from the configuration can reset exactly then.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._fingerprint = None
+        self._values = {}
+        self._listeners = []
+
+    @staticmethod
+    def path() -> str:
+        return os.path.join(os.getcwd(), '.env')
+
+    def _refresh(self):
+        path = self.path()
+        try:
+            stat = os.stat(path)
+            fingerprint = (path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            fingerprint = None
+
+        with self._lock:
+            if fingerprint == self._fingerprint and (fingerprint is not None or not self._values):
+                return
+            try:
+                values = _parse_env_file(path) if fingerprint is not None else {}
+            except Exception:
+                values = {}
+            changed = {key for key in set(values) | set(self._values) if values.get(key) != self._values.get(key)}
+            self._fingerprint = fingerprint
+            self._values = values
+            listeners = list(self._listeners)
+
+        if changed:
+            for listener in listeners:
+                try:
+                    listener(changed)
+                except Exception as e:
+                    print(f"Error handling .env change: {e}")
+
+    def invalidate(self):
+        """Force the file to be re-parsed on the next access (e.g. right after writing it)."""
+        with self._lock:
+            self._fingerprint = None
+
+    def subscribe(self, listener):
+        """Call listener(changed_keys: set) whenever values in the .env file change."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def values(self) -> dict:
+        """Return a copy of every variable in the .env file."""
+        self._refresh()
+        with self._lock:
+            return dict(self._values)
+
+    def get(self, key: str, default=None):
+        self._refresh()
+        with self._lock:
+            return self._values.get(key, default)
+
+    @staticmethod
+    def credentials_from(env_vars: dict) -> tuple:
+        """Resolve (aws_access_key_id, aws_secret_access_key, region_name) from .env values, accepting upper-case keys."""
+        aws_access_key_id = env_vars.get('aws_access_key_id') or env_vars.get('AWS_ACCESS_KEY_ID')
+        aws_secret_access_key = env_vars.get('aws_secret_access_key') or env_vars.get('AWS_SECRET_ACCESS_KEY')
+        region_name = env_vars.get('region') or env_vars.get('REGION') or env_vars.get('AWS_DEFAULT_REGION')
+        return aws_access_key_id, aws_secret_access_key, region_name
+
+    @property
+    def aws_credentials(self) -> tuple:
+        return self.credentials_from(self.values())
+
+    @property
+    def region(self) -> str:
+        return self.aws_credentials[2]
+
+    @property
+    def table_name(self) -> str:
+        return self.get('insight_p3_table_name')
+
+    @property
+    def participant_db(self) -> str:
+        return self.get('participant_db')
+
+    @property
+    def qualtrics_paths(self) -> dict:
+        """The six Qualtrics export paths keyed by their .env variable (None if not set)."""
+        values = self.values()
+        return {key: values.get(key) for key in QUALTRICS_PATH_KEYS}
+
+
+_env_config = EnvConfig()
+
+
+def get_env_config() -> EnvConfig:
+    """Return the shared .env configuration."""
+    return _env_config
+
+
+@timed('env.read')
 def read_env_variables() -> dict:
     """Read all environment variables from the .env file.
+
+    Served from the shared EnvConfig, which only re-parses the file when it changes.
+
     Returns:
         dict: A dictionary of environment variables and their values.
     """
-    path = os.path.join(os.getcwd(), '.env')
-    if not os.path.exists(path):
-        return {}
-    env_vars = {}
-    try:
-        with open(path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
-    except Exception as e:
-        return {}
-    return env_vars
\ No newline at end of file
+    return _env_config.values()
+
+def get_cache_dir() -> str:
+    """Return the local cache directory (next to the .env file), creating it if needed.
+    Returns:
+        str: Path to the cache directory.
+    """
+    path = os.path.join(os.getcwd(), '.insight_cache')
+    os.makedirs(path, exist_ok=True)
+    return path
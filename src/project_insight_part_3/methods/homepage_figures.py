@@ -1,49 +1,52 @@
-from turtle import title
 import plotly.graph_objects as go
 import polars as pl
 import datetime as dt
-import boto3
 from nicegui import ui
 from typing import Dict, Any
 from .env_initialize import read_env_variables
+from .aws_clients import get_aws_credentials
+from .participant_snapshot import get_participant_snapshot
+from .compliance_methods import study_today
 
-def pie_chart_progress() -> go.Figure:
-    """Creates a pie chart showing participant progress.
+def load_participant_data(df: pl.DataFrame = None) -> pl.DataFrame:
+    """Return the participant data used by the homepage figures.
+
+    Args:
+        df (pl.DataFrame, optional): An already-loaded participant snapshot. Defaults to the shared snapshot.
 
     Returns:
-        go.Figure: A Plotly Figure object representing the pie chart.
+        pl.DataFrame: Participant table with typed start/end dates, or None if it could not be loaded.
     """
-    # Initialize AWS session
+    if df is not None:
+        return df
+
     env_vars = read_env_variables()
-    
-    aws_access_key_id = env_vars.get('aws_access_key_id') or env_vars.get('AWS_ACCESS_KEY_ID')
-    aws_secret_access_key = env_vars.get('aws_secret_access_key') or env_vars.get('AWS_SECRET_ACCESS_KEY')
-    region_name = env_vars.get('region') or env_vars.get('REGION') or env_vars.get('AWS_DEFAULT_REGION')
-    table_name = env_vars.get('insight_p3_table_name')
+    _, _, region_name = get_aws_credentials(env_vars)
 
     if not region_name:
         ui.label('Error: AWS Region not specified in environment variables.').style('color: red; font-weight: bold;')
-        return go.Figure()
-    
+        return None
+
     try:
-        Session = boto3.Session(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name
-        )
+        return get_participant_snapshot()
+    except Exception as e:
+        ui.label(f'AWS Error: {str(e)}').style('color: red; font-weight: bold;')
+        return None
 
-        dynamodb = Session.resource('dynamodb')
-        table = dynamodb.Table(table_name)
-        response = table.scan()
-        
-        # Load data into Polars DataFrame + Clean
-        data = response['Items']
-        df = pl.DataFrame(data)
-        df = df.with_columns([
-            pl.col('start_date').str.strptime(pl.Date, format="%Y-%m-%d").alias('start_date'),
-            pl.col('end_date').str.strptime(pl.Date, format="%Y-%m-%d").alias('end_date')
-        ])
+def pie_chart_progress(df: pl.DataFrame = None) -> go.Figure:
+    """Creates a pie chart showing participant progress.
 
+    Args:
+        df (pl.DataFrame, optional): Participant snapshot. Defaults to the shared snapshot.
+
+    Returns:
+        go.Figure: A Plotly Figure object representing the pie chart.
+    """
+    df = load_participant_data(df)
+    if df is None:
+        return go.Figure()
+    
+    try:
         # Calculate counts
         not_started_count = df.filter(pl.col('start_date') > dt.date.today()).height
         in_progress_count = df.filter((pl.col('start_date') <= dt.date.today()) & (pl.col('end_date') >= dt.date.today())).height
@@ -85,44 +88,18 @@ def pie_chart_progress() -> go.Figure:
         return go.Figure()
 
 # Fig 2: Phase breakdown Pie Chart
-def phase_breakdown_pie_chart() -> go.Figure:
+def phase_breakdown_pie_chart(df: pl.DataFrame = None) -> go.Figure:
     """Creates a pie chart showing the breakdown of participants by phase.
 
+    Args:
+        df (pl.DataFrame, optional): Participant snapshot. Defaults to the shared snapshot.
+
     Returns:
         go.Figure: A Plotly Figure object representing the pie chart.
     """
-    # Initialize AWS session
-    env_vars = read_env_variables()
-    
-    aws_access_key_id = env_vars.get('aws_access_key_id') or env_vars.get('AWS_ACCESS_KEY_ID')
-    aws_secret_access_key = env_vars.get('aws_secret_access_key') or env_vars.get('AWS_SECRET_ACCESS_KEY')
-    region_name = env_vars.get('region') or env_vars.get('REGION') or env_vars.get('AWS_DEFAULT_REGION')
-    table_name = env_vars.get('insight_p3_table_name')
-
-    if not region_name:
-        ui.label('Error: AWS Region not specified in environment variables.').style('color: red; font-weight: bold;')
+    df = load_participant_data(df)
+    if df is None:
         return go.Figure()
-
-    try:
-        Session = boto3.Session(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name
-        )
-        
-        dynamodb = Session.resource('dynamodb')
-        table = dynamodb.Table(table_name)
-        response = table.scan()
-    except Exception as e:
-        ui.label(f'AWS Error: {str(e)}').style('color: red; font-weight: bold;')
-        return go.Figure()
-    
-    data = response['Items']
-    df = pl.DataFrame(data)
-    df = df.with_columns([
-        pl.col('start_date').str.strptime(pl.Date, format="%Y-%m-%d").alias('start_date'),
-        pl.col('end_date').str.strptime(pl.Date, format="%Y-%m-%d").alias('end_date')
-    ])
     
     current_date = dt.date.today()
     in_progress_participants = df.filter((pl.col('end_date') >= current_date) & (pl.col('start_date') <= current_date))
@@ -174,68 +151,70 @@ def phase_breakdown_pie_chart() -> go.Figure:
     return fig_phase
     
 
-# Fig 3: Enrollment Progress Over Time
-def enrollment_progress_over_time() -> go.Figure:
-    """Creates a bar chart showing enrollment progress over time.
+ENROLLMENT_BUCKETS = {'day': '1d', 'week': '1w', 'month': '1mo'}
+
+def enrollment_counts_by_bucket(df: pl.DataFrame,
+                                bucket: str = 'week',
+                                start_date: dt.date = None,
+                                end_date: dt.date = None) -> pl.DataFrame:
+    """Count enrollments (participant start dates) per day/week/month bucket.
+
+    Start dates are truncated to their bucket in one group_by and left-joined onto a
+    complete bucket spine, so empty buckets show up as zero. Weeks start on Monday.
+    The last bucket is counted whole, so participants scheduled to start later in the
+    current week (or month) are included.
+
+    Args:
+        df (pl.DataFrame): Participant snapshot with a Date-typed start_date column.
+        bucket (str, optional): 'day', 'week', 'month' or a Polars interval string. Defaults to 'week'.
+        start_date (dt.date, optional): Window start. Defaults to the earliest start date.
+        end_date (dt.date, optional): A date in the last bucket. Defaults to today (America/New_York).
 
     Returns:
-        go.Figure: A Plotly Figure object representing the bar chart.
+        pl.DataFrame: Columns 'date' (bucket start) and 'enrollment_count'.
     """
-    # Initialize AWS session
-    env_vars = read_env_variables()
-    
-    aws_access_key_id = env_vars.get('aws_access_key_id') or env_vars.get('AWS_ACCESS_KEY_ID')
-    aws_secret_access_key = env_vars.get('aws_secret_access_key') or env_vars.get('AWS_SECRET_ACCESS_KEY')
-    region_name = env_vars.get('region') or env_vars.get('REGION') or env_vars.get('AWS_DEFAULT_REGION')
-    table_name = env_vars.get('insight_p3_table_name')
+    interval = ENROLLMENT_BUCKETS.get(bucket, bucket)
+    starts = df.select('start_date').drop_nulls()
 
-    if not region_name:
-        ui.label('Error: AWS Region not specified in environment variables.').style('color: red; font-weight: bold;')
-        return go.Figure()
+    window_start = start_date or starts.select(pl.col('start_date').min()).item()
+    window_end = end_date or study_today()
+    spine_start = None if window_start is None else pl.select(pl.lit(window_start).dt.truncate(interval)).item()
+    if spine_start is None or spine_start > window_end:
+        return pl.DataFrame(schema={'date': pl.Date, 'enrollment_count': pl.UInt32})
 
-    try:
-        Session = boto3.Session(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name
-        )
-        
-        dynamodb = Session.resource('dynamodb')
-        table = dynamodb.Table(table_name)
-        response = table.scan()
-    except Exception as e:
-        ui.label(f'AWS Error: {str(e)}').style('color: red; font-weight: bold;')
-        return go.Figure()
-    
-    data = response['Items']
-    df = pl.DataFrame(data)
-    df = df.with_columns([
-        pl.col('start_date').str.strptime(pl.Date, format="%Y-%m-%d").alias('start_date'),
-        pl.col('end_date').str.strptime(pl.Date, format="%Y-%m-%d").alias('end_date')
-    ])
-    
-    # Create a date range from the earliest start date to latest start date
-    min_date = df.select(pl.col('start_date').min()).item()
-    max_date = dt.date.today()
+    spine = pl.date_range(spine_start, window_end, interval=interval, eager=True).alias('date').to_frame()
+    spine_end = pl.select(pl.lit(spine['date'].max()).dt.offset_by(interval)).item()
+
+    starts = starts.filter((pl.col('start_date') >= window_start) & (pl.col('start_date') < spine_end))
+    counts = starts.group_by(pl.col('start_date').dt.truncate(interval).alias('date')).agg(pl.len().alias('enrollment_count'))
 
-    # Adjust to start on the Monday of the first week
-    # Python's weekday(): Monday is 0
-    start_date = min_date - dt.timedelta(days=min_date.weekday())
+    return (
+        spine.join(counts, on='date', how='left')
+        .with_columns(pl.col('enrollment_count').fill_null(0))
+        .sort('date')
+    )
 
-    # Create eager date range (Series)
-    date_range = pl.date_range(start_date, max_date, interval='1w', eager=True).alias('date')
+# Fig 3: Enrollment Progress Over Time
+def enrollment_progress_over_time(df: pl.DataFrame = None,
+                                  bucket: str = 'week',
+                                  start_date: dt.date = None,
+                                  end_date: dt.date = None) -> go.Figure:
+    """Creates a bar chart showing enrollment progress over time.
 
-    enrollment_counts = []
-    for date in date_range:
-        # Filter for start_date within the specific week (date inclusive, next week exclusive)
-        count = df.filter(
-            (pl.col('start_date') >= date) & 
-            (pl.col('start_date') < (date + dt.timedelta(days=7)))
-        ).height
-        enrollment_counts.append((date, count))
+    Args:
+        df (pl.DataFrame, optional): Participant snapshot. Defaults to the shared snapshot.
+        bucket (str, optional): Bucket size, one of 'day', 'week', 'month' or a Polars interval such as '2w'. Defaults to 'week'.
+        start_date (dt.date, optional): First date to show. Defaults to the earliest start date.
+        end_date (dt.date, optional): A date in the last bucket to show. Defaults to today (America/New_York).
 
-    enrollment_df = pl.DataFrame(enrollment_counts, schema=['date', 'enrollment_count'], orient='row')
-    print(enrollment_df)
+    Returns:
+        go.Figure: A Plotly Figure object representing the bar chart.
+    """
+    df = load_participant_data(df)
+    if df is None:
+        return go.Figure()
+    
+    enrollment_df = enrollment_counts_by_bucket(df, bucket, start_date, end_date)
 
     # Create bar chart
     fig = go.Figure(data=[go.Bar(x=enrollment_df['date'].to_list(), y=enrollment_df['enrollment_count'].to_list(), marker_color='cyan')])
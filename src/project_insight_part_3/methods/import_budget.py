@@ -0,0 +1,67 @@
+import json
+import subprocess
+import sys
+
+# Cold import of the insight-part3 entry point, NiceGUI included
+IMPORT_TIME_BUDGET_SECONDS = 2.0
+
+# Modules only the pages that need them should load
+DEFERRED_MODULES = ['boto3', 'botocore', 'polars', 'plotly', 'pytz', 'turtle', 'tkinter']
+
+_MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import nicegui
+baseline = set(sys.modules)
+framework_done = time.perf_counter()
+import {module}
+done = time.perf_counter()
+print(json.dumps({{
+    'seconds': done - start,
+    'own_seconds': done - framework_done,
+    'loaded': sorted(name for name in sys.modules if name not in baseline)
+}}))
+"""
+
+
+def measure_import(module_name: str) -> dict:
+    """Import a module in a fresh interpreter and time it.
+
+    Args:
+        module_name (str): Absolute module name, e.g. 'project_insight_part_3.pages.main'.
+
+    Returns:
+        dict: 'seconds' (total, NiceGUI included), 'own_seconds' (after NiceGUI) and
+        'loaded' (modules the import added on top of NiceGUI).
+    """
+    completed = subprocess.run(
+        [sys.executable, '-c', _MEASURE_SCRIPT.format(module=module_name)],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def check_import_budget(module_name: str, budget_seconds: float = IMPORT_TIME_BUDGET_SECONDS) -> dict:
+    """Check that a cold import of a module stays within budget and does not load DEFERRED_MODULES.
+
+    Args:
+        module_name (str): Absolute module name.
+        budget_seconds (float, optional): Allowed total import time. Defaults to IMPORT_TIME_BUDGET_SECONDS.
+
+    Returns:
+        dict: The measure_import() timings (without 'loaded'), 'budget_seconds', 'deferred_loaded'
+        (deferred modules the import pulled in) and 'ok'.
+    """
+    measured = measure_import(module_name)
+    deferred_loaded = sorted({
+        name.split('.')[0] for name in measured['loaded']
+        if name.split('.')[0] in DEFERRED_MODULES
+    })
+    return {
+        'module': module_name,
+        'seconds': round(measured['seconds'], 3),
+        'own_seconds': round(measured['own_seconds'], 3),
+        'budget_seconds': budget_seconds,
+        'deferred_loaded': deferred_loaded,
+        'ok': measured['seconds'] <= budget_seconds and not deferred_loaded
+    }
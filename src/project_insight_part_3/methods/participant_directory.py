@@ -0,0 +1,105 @@
+import os
+import threading
+import polars as pl
+from .env_initialize import get_env_config
+
+
+class ParticipantDirectory:
+    """In-memory index of the participant DB CSV.
+
+    Holds the cleaned frame plus dictionary indexes by participant ID and by
+    normalized initials, and flags participants whose initials are shared with
+    someone else (their survey responses must also be matched on age).
+    """
+
+    def __init__(self, path: str, fingerprint: tuple, df: pl.DataFrame):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.frame = df
+
+        initials_counts = df.group_by('Initials').agg(pl.len().alias('count'))
+        self.shared_initials = set(initials_counts.filter(pl.col('count') > 1)['Initials'].to_list())
+
+        self.by_id = {}
+        self.by_initials = {}
+        for row in df.iter_rows(named=True):
+            row['needs_age'] = row['Initials'] in self.shared_initials
+            self.by_id[int(row['Participant ID #'])] = row
+            self.by_initials.setdefault(row['Initials'], []).append(int(row['Participant ID #']))
+
+    def lookup(self, participant_id) -> dict:
+        """Return the participant's row (with a 'needs_age' flag), or None if not in the DB."""
+        try:
+            return self.by_id.get(int(participant_id))
+        except (TypeError, ValueError):
+            return None
+
+    def ids_for_initials(self, initials: str) -> list:
+        """Return every participant ID using the given (normalized) initials."""
+        return self.by_initials.get(normalize_initials(initials), [])
+
+    def needs_age(self, participant_id) -> bool:
+        """True if the participant's initials are shared and responses must be matched on age too."""
+        participant = self.lookup(participant_id)
+        return bool(participant and participant['needs_age'])
+
+
+_directory = None
+_directory_lock = threading.Lock()
+
+
+def normalize_initials(initials: str) -> str:
+    """Uppercase initials and strip spaces, matching how survey Names are normalized."""
+    return (initials or '').upper().replace(' ', '')
+
+
+def _read_participant_db(path: str) -> pl.DataFrame:
+    participant_db_df = pl.read_csv(path)
+    participant_db_df = participant_db_df.select([
+        'Participant ID #',
+        'Initials',
+        'Age'
+    ])
+
+    participant_db_df = participant_db_df.filter(pl.col('Participant ID #').is_not_null())
+
+    # Capitalize initials and remove spaces from initials
+    participant_db_df = participant_db_df.with_columns(
+        pl.col('Initials').str.to_uppercase().str.replace_all(" ", "")
+    )
+
+    # Combine Participant ID # and Initials into a new column
+    participant_db_df = participant_db_df.with_columns(
+        (pl.col('Participant ID #').cast(pl.Utf8) + ' (' + pl.col('Initials') + ')').alias('Participant_Initials')
+    )
+
+    return participant_db_df
+
+
+def _on_config_change(changed_keys: set):
+    global _directory
+    if 'participant_db' in changed_keys:
+        with _directory_lock:
+            _directory = None
+
+
+get_env_config().subscribe(_on_config_change)
+
+
+def get_participant_directory() -> ParticipantDirectory:
+    """Return the participant directory, reloading the CSV only if its path, size or mtime changed.
+
+    Returns:
+        ParticipantDirectory: The shared directory.
+    """
+    global _directory
+    path = get_env_config().participant_db
+    if not path:
+        raise KeyError('participant_db')
+    stat = os.stat(path)
+    fingerprint = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+    with _directory_lock:
+        if _directory is None or _directory.fingerprint != fingerprint:
+            _directory = ParticipantDirectory(path, fingerprint, _read_participant_db(path))
+        return _directory
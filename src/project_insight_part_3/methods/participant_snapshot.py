@@ -0,0 +1,93 @@
+import threading
+import time
+import polars as pl
+from .aws_functions import scan_participant_table
+from .env_initialize import AWS_CREDENTIAL_KEYS, get_env_config
+
+DEFAULT_SNAPSHOT_TTL_SECONDS = 300
+
+
+class ParticipantSnapshot:
+    """A TTL-cached copy of the participant table shared by the dashboard figures.
+
+    The table is scanned once per TTL window and the start/end dates are parsed
+    into Date columns once, so every figure reads the same typed frame.
+    """
+
+    def __init__(self, ttl_seconds: int = DEFAULT_SNAPSHOT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._df = None
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def fetched_at(self):
+        """Epoch time of the last successful scan, or None if never fetched."""
+        return self._fetched_at
+
+    def is_stale(self) -> bool:
+        if self._df is None or self._fetched_at is None:
+            return True
+        return (time.time() - self._fetched_at) > self.ttl_seconds
+
+    def get(self, force_refresh: bool = False) -> pl.DataFrame:
+        """Return the cached participant frame, rescanning if stale or forced.
+
+        Args:
+            force_refresh (bool, optional): Rescan even if the TTL has not expired. Defaults to False.
+
+        Returns:
+            pl.DataFrame: Participant table with start_date/end_date as pl.Date.
+        """
+        with self._lock:
+            if force_refresh or self.is_stale():
+                df = scan_participant_table()
+                df = df.with_columns([
+                    pl.col('start_date').str.strptime(pl.Date, format="%Y-%m-%d", strict=False).alias('start_date'),
+                    pl.col('end_date').str.strptime(pl.Date, format="%Y-%m-%d", strict=False).alias('end_date')
+                ])
+                self._df = df
+                self._fetched_at = time.time()
+            return self._df
+
+    def refresh(self) -> pl.DataFrame:
+        """Force a rescan of the participant table."""
+        return self.get(force_refresh=True)
+
+    def invalidate(self):
+        """Drop the cached frame so the next get() rescans."""
+        with self._lock:
+            self._df = None
+            self._fetched_at = None
+
+
+_participant_snapshot = ParticipantSnapshot()
+
+
+def _on_config_change(changed_keys: set):
+    # A different account or table means the cached scan is for the wrong data
+    if changed_keys & (set(AWS_CREDENTIAL_KEYS) | {'insight_p3_table_name'}):
+        _participant_snapshot.invalidate()
+
+
+get_env_config().subscribe(_on_config_change)
+
+
+def get_participant_snapshot(force_refresh: bool = False) -> pl.DataFrame:
+    """Return the shared participant snapshot frame."""
+    return _participant_snapshot.get(force_refresh=force_refresh)
+
+
+def refresh_participant_snapshot() -> pl.DataFrame:
+    """Force the shared participant snapshot to rescan DynamoDB."""
+    return _participant_snapshot.refresh()
+
+
+def invalidate_participant_snapshot():
+    """Mark the shared participant snapshot as stale."""
+    _participant_snapshot.invalidate()
+
+
+def participant_snapshot_fetched_at():
+    """Epoch time of the shared snapshot's last scan, or None."""
+    return _participant_snapshot.fetched_at
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+import polars as pl
+from .env_initialize import get_env_config, get_cache_dir
+from .survey_cache import source_fingerprint
+from .send_time_store import read_send_times
+from .aws_functions import get_user_info
+from .participant_directory import get_participant_directory
+from .participant_snapshot import refresh_participant_snapshot
+from .compliance_methods import generate_compliance_table_individual, get_participant_list, merge_survey_data, scan_merged_surveys, study_today
+from .report_jobs import submit_compliance_report
+from .timing import span, request_scope
+
+# Local hour (America/New_York) at which the nightly run starts
+PREMATERIALIZE_HOUR = 2
+
+
+def _timelines_dir() -> str:
+    path = os.path.join(get_cache_dir(), 'timelines')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _timeline_inputs(participant_id: int) -> dict:
+    # Everything the participant's timeline reads; the timeline is reused while this is unchanged
+    user_info, _ = get_user_info(participant_id)
+    if user_info is None:
+        raise KeyError(participant_id)
+    participant = get_participant_directory().lookup(participant_id)
+    responses = scan_merged_surveys(
+        start_date=user_info['start_date'],
+        end_date=user_info['end_date'],
+        initials=[participant['Initials']] if participant else []
+    )
+    summary = None
+    if responses is not None:
+        summary = [str(value) for value in responses.select(
+            pl.len(), pl.col("Date/Time").min().alias("first"), pl.col("Date/Time").max().alias("last")
+        ).collect().row(0)]
+    start_date = datetime.strptime(user_info['start_date'], "%Y-%m-%d").date()
+    end_date = datetime.strptime(user_info['end_date'], "%Y-%m-%d").date()
+    inputs = {
+        'as_of': str(study_today()),
+        'participant': {key: str(user_info.get(key)) for key in ['start_date', 'end_date', 'schedule_type', 'message_randomizer']},
+        'participant_db': source_fingerprint([get_env_config().participant_db]),
+        'responses': summary,
+        'send_times': read_send_times(start_date, end_date, [user_info['schedule_type']]).height
+    }
+    return json.loads(json.dumps(inputs, default=str))
+
+
+def get_compliance_timeline(participant_id, force: bool = False) -> pl.DataFrame:
+    """Return a participant's compliance timeline, reusing the precomputed one while its inputs are unchanged.
+
+    Args:
+        participant_id (int | str): Participant ID.
+        force (bool, optional): Rebuild even if a current saved timeline exists. Defaults to False.
+
+    Returns:
+        pl.DataFrame: The timeline from generate_compliance_table_individual.
+    """
+    participant_id = int(participant_id)
+    frame_path = os.path.join(_timelines_dir(), f"{participant_id}.arrow")
+    meta_path = os.path.join(_timelines_dir(), f"{participant_id}.json")
+
+    if not force and os.path.exists(frame_path) and os.path.exists(meta_path):
+        try:
+            with span('timeline.load_saved'):
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    saved_inputs = json.load(f)['inputs']
+                if saved_inputs == _timeline_inputs(participant_id):
+                    return pl.read_ipc(frame_path, memory_map=False)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error reading saved timeline for {participant_id}, rebuilding: {e}")
+
+    compliance_df = generate_compliance_table_individual(participant_id)
+    # Taken after the build, which syncs send times and ingests new survey rows
+    inputs = _timeline_inputs(participant_id)
+    try:
+        compliance_df.write_ipc(frame_path, compression='uncompressed')
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'inputs': inputs, 'created_at': time.time()}, f, indent=2)
+    except OSError as e:
+        print(f"Error saving timeline for {participant_id}: {e}")
+    return compliance_df
+
+
+def prematerialize(report_date=None) -> dict:
+    """Precompute the artifacts staff open every morning.
+
+    Builds the daily compliance reports for the date and the day before, the compliance
+    timelines of every participant currently in the study, and the homepage data (participant
+    snapshot and merged survey cache).
+
+    Args:
+        report_date (date, optional): Date to prepare for. Defaults to today (America/New_York).
+
+    Returns:
+        dict: Counts of what was built and a list of errors.
+    """
+    report_date = report_date or study_today()
+    summary = {'reports': 0, 'timelines': 0, 'errors': []}
+    with request_scope(f"prematerialize {report_date}"):
+        _prematerialize(report_date, summary)
+    for error in summary['errors']:
+        print(f"Prematerialization error: {error}")
+    return summary
+
+
+def _prematerialize(report_date, summary: dict):
+    try:
+        refresh_participant_snapshot()
+        merge_survey_data()
+    except Exception as e:
+        summary['errors'].append(f"Homepage data: {e}")
+
+    for day in [report_date - timedelta(days=1), report_date]:
+        try:
+            submit_compliance_report(day.strftime("%Y-%m-%d")).result()
+            summary['reports'] += 1
+        except Exception as e:
+            summary['errors'].append(f"Report {day}: {e}")
+
+    participants = get_participant_list(report_date.strftime("%Y-%m-%d"))
+    if participants is not None:
+        for participant_id in participants['currently_in_study']['Participant ID'].to_list():
+            try:
+                get_compliance_timeline(participant_id)
+                summary['timelines'] += 1
+            except Exception as e:
+                summary['errors'].append(f"Timeline {participant_id}: {e}")
+
+
+def _seconds_until(hour: int) -> float:
+    now = datetime.now(ZoneInfo("America/New_York"))
+    next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+async def run_nightly_prematerialization(hour: int = PREMATERIALIZE_HOUR):
+    """Run prematerialize() every night at the given New York hour, off the event loop. Never returns."""
+    while True:
+        await asyncio.sleep(_seconds_until(hour))
+        started = time.time()
+        try:
+            summary = await asyncio.to_thread(prematerialize)
+            print(f"Prematerialized {summary['reports']} reports and {summary['timelines']} timelines in {time.time() - started:.1f}s")
+        except Exception as e:
+            # Keep the schedule running; the next night starts from scratch
+            print(f"Error in nightly prematerialization: {e}")
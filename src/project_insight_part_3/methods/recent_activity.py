@@ -0,0 +1,85 @@
+import threading
+import polars as pl
+from .survey_ingest import STORE_COLUMNS, ingest_survey_exports, survey_store_files
+from .compliance_methods import get_participant_initials, match_initials_table, scan_merged_surveys
+from .timing import timed
+
+# Newest responses kept in memory; the dashboard asks for a prefix of these
+RECENT_ACTIVITY_SIZE = 100
+
+RECENT_ACTIVITY_COLUMNS = ['Date/Time', 'Participant ID #', 'Initials', 'Survey Source']
+
+
+class RecentActivity:
+    """The newest RECENT_ACTIVITY_SIZE survey responses, kept up to date from the survey store.
+
+    The store is append-only (one Arrow part per ingest), so after the first build only the
+    parts added since the last call are read and merged into the current top rows. If a part
+    disappears (a source was re-ingested from scratch) the top rows are rebuilt with a top-k
+    scan of the whole store.
+    """
+
+    def __init__(self, size: int = RECENT_ACTIVITY_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._files = set()
+        self._top = None
+
+    def _top_k(self, files: list) -> pl.DataFrame:
+        return pl.scan_ipc(files, memory_map=True).select(STORE_COLUMNS).top_k(self.size, by="Date/Time").collect()
+
+    def refresh(self) -> pl.DataFrame:
+        """Ingest new export rows and return the newest responses (STORE_COLUMNS, newest first), or None if the store is empty."""
+        ingest_survey_exports()
+        files = survey_store_files()
+        if not files:
+            return None
+        with self._lock:
+            if self._top is None or not self._files.issubset(files):
+                self._top = self._top_k(files)
+                self._files = set(files)
+            else:
+                new_files = [path for path in files if path not in self._files]
+                if new_files:
+                    self._top = pl.concat([self._top, self._top_k(new_files)], how="vertical_relaxed").top_k(self.size, by="Date/Time")
+                    self._files.update(new_files)
+            return self._top.sort("Date/Time", descending=True)
+
+    def invalidate(self):
+        """Drop the kept rows; the next refresh() rebuilds them from the whole store."""
+        with self._lock:
+            self._top = None
+            self._files = set()
+
+
+_recent_activity = RecentActivity()
+
+
+def _newest_responses(k: int) -> pl.DataFrame:
+    try:
+        responses = _recent_activity.refresh()
+        return None if responses is None else responses.head(k)
+    except Exception as e:
+        print(f"Error reading recent activity from the survey store, scanning the exports: {e}")
+        responses = scan_merged_surveys()
+        return None if responses is None else responses.head(k).collect()
+
+
+@timed('recent_activity.top_k')
+def get_recent_activities(k: int = 25) -> pl.DataFrame:
+    """Return the k newest survey responses matched to participant IDs.
+
+    Only the k rows are joined to the participant database, so the cost does not grow with
+    the number of stored responses.
+
+    Args:
+        k (int, optional): Number of responses. At most RECENT_ACTIVITY_SIZE are kept. Defaults to 25.
+
+    Returns:
+        pl.DataFrame: RECENT_ACTIVITY_COLUMNS, newest first ('N/A' for unknown initials), or None
+        if no survey data is available.
+    """
+    responses = _newest_responses(min(k, RECENT_ACTIVITY_SIZE))
+    if responses is None:
+        return None
+    return match_initials_table(responses, get_participant_initials()).select(RECENT_ACTIVITY_COLUMNS)
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+import polars as pl
+from .env_initialize import get_env_config, get_cache_dir
+from .survey_cache import source_fingerprint
+from .send_time_store import read_send_times
+from .participant_snapshot import get_participant_snapshot
+from .timing import span, request_scope, submit_in_context
+from .compliance_methods import get_survey_send_times_all, get_participant_list, study_today, scan_merged_surveys, compliance_table_daily_report, contact_checks
+
+# How long a report for today (whose inputs are still arriving) is served before it is rebuilt
+REPORT_TTL_SECONDS = 300
+
+REPORT_FRAMES = ['early_bird_df', 'standard_schedule_df', 'night_owl_df', 'compliance_df']
+PARTICIPANT_GROUPS = ['not_started', 'currently_in_study', 'done_with_study']
+
+# DynamoDB participant fields a report depends on, as named in get_participant_list()
+PARTICIPANT_DIGEST_COLUMNS = ['Participant ID', 'Start Date', 'End Date', 'Schedule Type']
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='compliance-report')
+_jobs = {}
+_jobs_lock = threading.Lock()
+_save_lock = threading.Lock()
+
+
+def _reports_dir() -> str:
+    path = os.path.join(get_cache_dir(), 'reports')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def participant_digest(participants: pl.DataFrame) -> str:
+    """Hash the participant rows a report uses (ID, start/end date, schedule type), independent of row order."""
+    rows = participants.select(PARTICIPANT_DIGEST_COLUMNS).sort('Participant ID').rows()
+    return hashlib.sha1(json.dumps(rows, default=str).encode('utf-8')).hexdigest()
+
+
+def _snapshot_participants() -> pl.DataFrame:
+    return get_participant_snapshot().select(
+        pl.col('participant_id').alias('Participant ID'),
+        pl.col('start_date').alias('Start Date'),
+        pl.col('end_date').alias('End Date'),
+        pl.col('schedule_type').alias('Schedule Type')
+    )
+
+
+def _report_inputs(report_date) -> dict:
+    # Cheap summary of everything a report reads, compared to decide whether a saved report is still valid.
+    # Participants come from the shared snapshot on both sides, so rows outside every participant group
+    # (e.g. no start date yet) are hashed the same way when the report is built and when it is checked.
+    responses = scan_merged_surveys(start_date=report_date - timedelta(days=1), end_date=report_date)
+    summary = None
+    if responses is not None:
+        summary = [str(value) for value in responses.select(
+            pl.len(), pl.col("Date/Time").min().alias("first"), pl.col("Date/Time").max().alias("last")
+        ).collect().row(0)]
+    return {
+        'participant_db': source_fingerprint([get_env_config().participant_db]),
+        'participants': participant_digest(_snapshot_participants()),
+        'responses': summary,
+        'send_times': read_send_times(report_date - timedelta(days=1), report_date).height
+    }
+
+
+def _collect_responses(report_date) -> pl.DataFrame:
+    with span('surveys.scan'):
+        return scan_merged_surveys(start_date=report_date - timedelta(days=1), end_date=report_date).collect()
+
+
+def build_compliance_report(date_value: str) -> dict:
+    """Compute the daily compliance report for a date.
+
+    Send times, the participant list and the survey responses are fetched concurrently.
+
+    Args:
+        date_value (str): Report date, "YYYY-MM-DD".
+
+    Returns:
+        dict: 'date', the three send schedule frames, 'participant_df' (dict of not_started /
+        currently_in_study / done_with_study frames), 'compliance_df', 'did_not_do_lb',
+        'two_NRs_in_a_row', 'created_at' (epoch seconds) and 'inputs'.
+    """
+    report_date = datetime.strptime(date_value, "%Y-%m-%d").date()
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        send_times_job = submit_in_context(executor, get_survey_send_times_all, date_value)
+        participants_job = submit_in_context(executor, get_participant_list, date_value)
+        # The daily report only looks at yesterday's and today's responses
+        responses_job = submit_in_context(executor, _collect_responses, report_date)
+        early_bird_df, standard_schedule_df, night_owl_df = send_times_job.result()
+        participant_df = participants_job.result()
+        merged_df = responses_job.result()
+
+    if participant_df is None:
+        raise ValueError(f"Could not load the participant list for {date_value}.")
+
+    compliance_df = compliance_table_daily_report(date_value, participant_df, early_bird_df, standard_schedule_df, night_owl_df, merged_df)
+    did_not_do_lb, two_NRs_in_a_row = contact_checks(compliance_df)
+
+    return {
+        'date': date_value,
+        'early_bird_df': early_bird_df,
+        'standard_schedule_df': standard_schedule_df,
+        'night_owl_df': night_owl_df,
+        'participant_df': participant_df,
+        'compliance_df': compliance_df,
+        'did_not_do_lb': did_not_do_lb,
+        'two_NRs_in_a_row': two_NRs_in_a_row,
+        'created_at': time.time(),
+        # Taken after the build, which syncs send times and ingests new survey rows
+        'inputs': _report_inputs(report_date)
+    }
+
+
+def save_report(report: dict):
+    """Persist a report under .insight_cache/reports/<date>/ (Arrow IPC frames plus report.json)."""
+    target = os.path.join(_reports_dir(), report['date'])
+    tmp_dir = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    os.makedirs(tmp_dir, exist_ok=True)
+    try:
+        for name in REPORT_FRAMES:
+            report[name].write_ipc(os.path.join(tmp_dir, f"{name}.arrow"), compression='uncompressed')
+        for group in PARTICIPANT_GROUPS:
+            report['participant_df'][group].write_ipc(os.path.join(tmp_dir, f"participants_{group}.arrow"), compression='uncompressed')
+        with open(os.path.join(tmp_dir, 'report.json'), 'w', encoding='utf-8') as f:
+            json.dump({key: report[key] for key in ['date', 'did_not_do_lb', 'two_NRs_in_a_row', 'created_at', 'inputs']}, f, indent=2, default=str)
+
+        with _save_lock:
+            if os.path.exists(target):
+                shutil.rmtree(target)
+            os.replace(tmp_dir, target)
+    except OSError as e:
+        print(f"Error saving compliance report for {report['date']}: {e}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def load_saved_report(date_value: str) -> dict:
+    """Return the saved report for a date, or None if there is none (or it cannot be read)."""
+    report_dir = os.path.join(_reports_dir(), date_value)
+    if not os.path.exists(os.path.join(report_dir, 'report.json')):
+        return None
+    try:
+        with _save_lock:
+            with open(os.path.join(report_dir, 'report.json'), 'r', encoding='utf-8') as f:
+                report = json.load(f)
+            for name in REPORT_FRAMES:
+                report[name] = pl.read_ipc(os.path.join(report_dir, f"{name}.arrow"), memory_map=False)
+            report['participant_df'] = {
+                group: pl.read_ipc(os.path.join(report_dir, f"participants_{group}.arrow"), memory_map=False)
+                for group in PARTICIPANT_GROUPS
+            }
+        return report
+    except (OSError, ValueError) as e:
+        print(f"Error reading saved compliance report for {date_value}: {e}")
+        return None
+
+
+def is_report_current(report: dict) -> bool:
+    """True if a saved report can be served as is.
+
+    Reports for past dates are final while their inputs (participant DB, the DynamoDB participant
+    rows, that day's survey responses and send times) are unchanged; today's report is also rebuilt after REPORT_TTL_SECONDS.
+    """
+    report_date = datetime.strptime(report['date'], "%Y-%m-%d").date()
+    if report_date >= study_today() and time.time() - report['created_at'] > REPORT_TTL_SECONDS:
+        return False
+    return report['inputs'] == json.loads(json.dumps(_report_inputs(report_date), default=str))
+
+
+def _run_report_job(date_value: str, force: bool) -> dict:
+    with request_scope(f"compliance report {date_value}"):
+        if not force:
+            with span('report.load_saved'):
+                report = load_saved_report(date_value)
+                current = report is not None and is_report_current(report)
+            if current:
+                report['cached'] = True
+                return report
+        report = build_compliance_report(date_value)
+        with span('report.save'):
+            save_report(report)
+        report['cached'] = False
+        return report
+
+
+def _forget_job(date_value: str, job: Future):
+    with _jobs_lock:
+        if _jobs.get(date_value) is job:
+            del _jobs[date_value]
+
+
+def submit_compliance_report(date_value: str, force: bool = False) -> Future:
+    """Queue a compliance report on the report worker pool.
+
+    Concurrent requests for the same date share one job, and a saved report whose inputs
+    are unchanged is returned without recomputing.
+
+    Args:
+        date_value (str): Report date, "YYYY-MM-DD".
+        force (bool, optional): Rebuild even if a current saved report exists. Defaults to False.
+
+    Returns:
+        Future: Resolves to the report dict (see build_compliance_report), with 'cached' set.
+    """
+    datetime.strptime(date_value, "%Y-%m-%d")
+    with _jobs_lock:
+        job = _jobs.get(date_value)
+        if job is not None and not job.done():
+            return job
+        job = _executor.submit(_run_report_job, date_value, force)
+        _jobs[date_value] = job
+    job.add_done_callback(lambda done: _forget_job(date_value, done))
+    return job
@@ -0,0 +1,129 @@
+import os
+import sqlite3
+import threading
+from datetime import date
+import polars as pl
+from .env_initialize import get_cache_dir
+
+SEND_TIME_SCHEMA = {"Schedule Type": pl.Utf8, "Survey": pl.Int64, "Date": pl.Date, "Send Time": pl.Time}
+
+_write_lock = threading.Lock()
+
+_CREATE_TABLES = """
+CREATE TABLE IF NOT EXISTS send_times (
+    schedule_type TEXT NOT NULL,
+    survey INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    send_time TEXT NOT NULL,
+    first_event_ms INTEGER NOT NULL,
+    PRIMARY KEY (schedule_type, survey, date)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    log_group TEXT PRIMARY KEY,
+    synced_from TEXT NOT NULL,
+    last_first_event_ms INTEGER
+);
+"""
+
+
+def send_time_store_path() -> str:
+    return os.path.join(get_cache_dir(), 'send_times.sqlite')
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(send_time_store_path(), timeout=30)
+    conn.executescript(_CREATE_TABLES)
+    return conn
+
+
+def get_sync_state(log_group_name: str) -> dict:
+    """Return a log group's sync state, or None if it has never been synced.
+
+    Returns:
+        dict: 'synced_from' (date, earliest date stored) and 'last_first_event_ms' (int or None).
+    """
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT synced_from, last_first_event_ms FROM sync_state WHERE log_group = ?",
+            (log_group_name,)
+        ).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        return None
+    return {'synced_from': date.fromisoformat(row[0]), 'last_first_event_ms': row[1]}
+
+
+def save_send_times(rows: pl.DataFrame, log_group_name: str, synced_from: date, last_first_event_ms: int):
+    """Upsert send times for one log group and record how far it has been synced, in one transaction.
+
+    When a (schedule, survey, date) is already stored, the earlier send time is kept.
+
+    Args:
+        rows (pl.DataFrame): "Schedule Type", "Survey", "Date", "Send Time" and "First Event" (epoch ms).
+        log_group_name (str): Log group the rows were read from.
+        synced_from (date): Earliest date now covered for this log group.
+        last_first_event_ms (int): Latest stream start seen, where the next sync resumes.
+    """
+    records = [
+        (schedule_type, survey, day.isoformat(), send_time.strftime("%H:%M:%S"), first_event)
+        for schedule_type, survey, day, send_time, first_event in rows.select(
+            "Schedule Type", "Survey", "Date", "Send Time", "First Event"
+        ).iter_rows()
+    ]
+    with _write_lock:
+        conn = _connect()
+        try:
+            with conn:
+                conn.executemany(
+                    """INSERT INTO send_times (schedule_type, survey, date, send_time, first_event_ms)
+                       VALUES (?, ?, ?, ?, ?)
+                       ON CONFLICT (schedule_type, survey, date) DO UPDATE SET
+                           send_time = excluded.send_time,
+                           first_event_ms = excluded.first_event_ms
+                       WHERE excluded.first_event_ms < send_times.first_event_ms""",
+                    records
+                )
+                conn.execute(
+                    """INSERT INTO sync_state (log_group, synced_from, last_first_event_ms) VALUES (?, ?, ?)
+                       ON CONFLICT (log_group) DO UPDATE SET
+                           synced_from = excluded.synced_from,
+                           last_first_event_ms = excluded.last_first_event_ms""",
+                    (log_group_name, synced_from.isoformat(), last_first_event_ms)
+                )
+        finally:
+            conn.close()
+
+
+def read_send_times(start_date: date, end_date: date, schedule_types: list = None) -> pl.DataFrame:
+    """Read stored send times for a date window.
+
+    Args:
+        start_date (date): First date, inclusive.
+        end_date (date): Last date, inclusive.
+        schedule_types (list, optional): Schedules to include. Defaults to all.
+
+    Returns:
+        pl.DataFrame: Long frame with SEND_TIME_SCHEMA.
+    """
+    query = "SELECT schedule_type, survey, date, send_time FROM send_times WHERE date BETWEEN ? AND ?"
+    params = [start_date.isoformat(), end_date.isoformat()]
+    if schedule_types is not None:
+        query += f" AND schedule_type IN ({', '.join('?' for _ in schedule_types)})"
+        params.extend(schedule_types)
+
+    conn = _connect()
+    try:
+        rows = conn.execute(query, params).fetchall()
+    finally:
+        conn.close()
+
+    return pl.DataFrame(
+        rows,
+        schema={"Schedule Type": pl.Utf8, "Survey": pl.Int64, "Date": pl.Utf8, "Send Time": pl.Utf8},
+        orient="row"
+    ).with_columns(
+        pl.col("Date").str.to_date("%Y-%m-%d"),
+        pl.col("Send Time").str.to_time("%H:%M:%S")
+    ).sort(["Schedule Type", "Date", "Survey"])
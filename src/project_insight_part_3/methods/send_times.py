@@ -0,0 +1,273 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+import polars as pl
+from .aws_clients import get_logs_client
+from .env_initialize import AWS_CREDENTIAL_KEYS, get_env_config
+from .send_time_store import get_sync_state, save_send_times, read_send_times
+from .timing import span, timed, submit_in_context
+
+# Lambda log group prefix for each schedule; message<n> sends survey n
+SEND_TIME_LOG_GROUPS = {
+    "Early Bird Schedule": "/aws/lambda/INSIGHT_Part3_earlybird_message",
+    "Standard Schedule": "/aws/lambda/INSIGHT_Part3_standard_message",
+    "Night Owl Schedule": "/aws/lambda/INSIGHT_Part3_nightowl_message",
+}
+SURVEY_NUMBERS = [1, 2, 3, 4]
+
+DEFAULT_SEND_TIME_TTL_SECONDS = 300
+
+# lastEventTimestamp is only updated eventually, so paging stops a day past the window start
+STREAM_LAST_EVENT_SLACK = timedelta(days=1)
+
+
+def send_time_log_groups(schedule_types: list = None) -> list:
+    """List the (schedule type, survey number, log group name) triples to fetch.
+
+    Args:
+        schedule_types (list, optional): Schedules to include. Defaults to all three.
+
+    Returns:
+        list: One tuple per log group.
+    """
+    return [
+        (schedule_type, survey, f"{prefix}{survey}")
+        for schedule_type, prefix in SEND_TIME_LOG_GROUPS.items()
+        if schedule_types is None or schedule_type in schedule_types
+        for survey in SURVEY_NUMBERS
+    ]
+
+
+def _as_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    return value
+
+
+def _streams_to_send_times(log_streams: list, schedule_type: str, survey: int, start_date: date, end_date: date) -> pl.DataFrame:
+    # A stream's first event is when the Lambda fired; the earliest one per (New York) day is the send time
+    first_events = pl.DataFrame(
+        {"firstEventTimestamp": [stream.get('firstEventTimestamp') for stream in log_streams]},
+        schema={"firstEventTimestamp": pl.Int64}
+    ).drop_nulls()
+    sent_at = pl.from_epoch(pl.col('firstEventTimestamp'), time_unit="ms").dt.replace_time_zone("UTC").dt.convert_time_zone("America/New_York")
+    return (
+        first_events.with_columns(sent_at.alias('Sent At'))
+        .filter(pl.col('Sent At').dt.date().is_between(start_date, end_date))
+        .group_by(pl.col('Sent At').dt.date().alias('Date'))
+        .agg(
+            pl.col('Sent At').min().dt.time().alias('Send Time'),
+            pl.col('firstEventTimestamp').min().alias('First Event')
+        )
+        .select(
+            pl.lit(schedule_type).alias("Schedule Type"),
+            pl.lit(survey, dtype=pl.Int64).alias("Survey"),
+            "Date",
+            "Send Time",
+            "First Event"
+        )
+    )
+
+
+def _epoch_ms(day: date) -> int:
+    return int(datetime.combine(day, datetime.min.time(), tzinfo=ZoneInfo("America/New_York")).timestamp() * 1000)
+
+
+def describe_streams_in_window(log_group_name: str, start_date, end_date=None) -> list:
+    """Page through a log group's streams, most recently active first, until they predate the window.
+
+    Streams are ordered by last event time, so once a stream's last event is before the window
+    start (less STREAM_LAST_EVENT_SLACK) every later page is too and paging stops. The cost scales
+    with the window requested, not with the log group's retention.
+
+    Args:
+        log_group_name (str): CloudWatch log group.
+        start_date (date | str): First date of the window (New York time).
+        end_date (date | str, optional): Last date of the window. Streams starting after it are dropped.
+
+    Returns:
+        list: The describe_log_streams stream dicts overlapping the window.
+    """
+    start_ms = _epoch_ms(_as_date(start_date) - STREAM_LAST_EVENT_SLACK)
+    end_ms = _epoch_ms(_as_date(end_date) + timedelta(days=1)) if end_date is not None else None
+
+    streams = []
+    paginator = get_logs_client().get_paginator('describe_log_streams')
+    for page in paginator.paginate(logGroupName=log_group_name, orderBy='LastEventTime', descending=True):
+        for stream in page['logStreams']:
+            last_event = stream.get('lastEventTimestamp')
+            if last_event is not None and last_event < start_ms:
+                return streams
+            first_event = stream.get('firstEventTimestamp')
+            if end_ms is not None and first_event is not None and first_event >= end_ms:
+                continue
+            streams.append(stream)
+    return streams
+
+
+def describe_streams_for_days(log_group_name: str, start_date, end_date) -> list:
+    """List a log group's streams for a bounded range of dates, by stream name prefix.
+
+    Lambda names its streams "YYYY/MM/DD/[version]id" after the UTC day they were created, so a
+    New York date range is covered by the UTC days from start_date to end_date + 1. Unlike
+    describe_streams_in_window, this does not page through anything newer than the range.
+
+    Args:
+        log_group_name (str): CloudWatch log group.
+        start_date (date | str): First date (New York time).
+        end_date (date | str): Last date, inclusive.
+
+    Returns:
+        list: The describe_log_streams stream dicts created on those days.
+    """
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    paginator = get_logs_client().get_paginator('describe_log_streams')
+    streams = []
+    day = start_date
+    while day <= end_date + timedelta(days=1):
+        for page in paginator.paginate(logGroupName=log_group_name, logStreamNamePrefix=day.strftime("%Y/%m/%d/")):
+            streams.extend(page['logStreams'])
+        day += timedelta(days=1)
+    return streams
+
+
+# Per log group: when streams newer than the store were last looked for
+_forward_synced_at = {}
+_forward_sync_lock = threading.Lock()
+
+
+def _last_synced_day(last_first_event_ms: int) -> date:
+    if last_first_event_ms is None:
+        return None
+    return datetime.fromtimestamp(last_first_event_ms / 1000, ZoneInfo("America/New_York")).date()
+
+
+def _latest_first_event(rows: pl.DataFrame, last_first_event_ms: int) -> int:
+    if rows.is_empty():
+        return last_first_event_ms
+    latest = rows.select(pl.col('First Event').max()).item()
+    return max(latest, last_first_event_ms or latest)
+
+
+def sync_log_group(schedule_type: str, survey: int, log_group_name: str, start_date: date, end_date: date,
+                   ttl_seconds: int = DEFAULT_SEND_TIME_TTL_SECONDS):
+    """Bring the local send-time store for one log group up to date for a date window.
+
+    Send times never change once logged, so the store is shared by every participant on the
+    schedule. Only the parts of the window it does not cover are fetched: dates before the
+    stored start are backfilled by stream name, and streams newer than the last seen
+    firstEventTimestamp are looked for at most once per ttl_seconds.
+    """
+    state = get_sync_state(log_group_name)
+    if state is None:
+        synced_from, last_first_event_ms = start_date, None
+        forward_from = start_date
+    else:
+        synced_from, last_first_event_ms = state['synced_from'], state['last_first_event_ms']
+        forward_from = _last_synced_day(last_first_event_ms) or synced_from
+
+        if start_date < synced_from:
+            # Backfill up to the stored start (even past end_date) so the covered range stays contiguous
+            backfill_end = synced_from - timedelta(days=1)
+            log_streams = describe_streams_for_days(log_group_name, start_date, backfill_end)
+            rows = _streams_to_send_times(log_streams, schedule_type, survey, start_date, backfill_end)
+            last_first_event_ms = _latest_first_event(rows, last_first_event_ms)
+            synced_from = start_date
+            save_send_times(rows, log_group_name, synced_from, last_first_event_ms)
+
+        if end_date < forward_from:
+            return
+        with _forward_sync_lock:
+            synced_at = _forward_synced_at.get(log_group_name)
+        if synced_at is not None and time.time() - synced_at < ttl_seconds:
+            return
+
+    # compliance_methods imports this module, so its study clock is imported here
+    from .compliance_methods import study_today
+    log_streams = describe_streams_in_window(log_group_name, forward_from)
+    rows = _streams_to_send_times(log_streams, schedule_type, survey, forward_from, study_today())
+    save_send_times(rows, log_group_name, synced_from, _latest_first_event(rows, last_first_event_ms))
+    with _forward_sync_lock:
+        _forward_synced_at[log_group_name] = time.time()
+
+
+def expire_send_times():
+    """Forget when each log group was last synced, so the next fetch looks for new sends."""
+    with _forward_sync_lock:
+        _forward_synced_at.clear()
+
+
+def _on_config_change(changed_keys: set):
+    # New credentials may see log streams the old ones could not
+    if changed_keys & set(AWS_CREDENTIAL_KEYS):
+        expire_send_times()
+
+
+get_env_config().subscribe(_on_config_change)
+
+
+def _sync_quietly(log_group: tuple, start_date: date, end_date: date, ttl_seconds: int):
+    # A failed sync should not hide what is already stored
+    try:
+        with span('cloudwatch.sync', log_group=log_group[2]):
+            sync_log_group(*log_group, start_date, end_date, ttl_seconds)
+    except Exception as e:
+        print(f"Error syncing send times from {log_group[2]}: {e}")
+
+
+@timed('send_times.fetch')
+def fetch_send_times(start_date, end_date, schedule_types: list = None, max_workers: int = 12,
+                     ttl_seconds: int = DEFAULT_SEND_TIME_TTL_SECONDS) -> pl.DataFrame:
+    """Return survey send times for a date window from the local store, syncing it from CloudWatch first.
+
+    The schedule/message log groups are synced concurrently and only for the part of the
+    window the store does not already cover, so historical windows are read without any
+    AWS call.
+
+    Args:
+        start_date (date | str): First date of the window (New York time).
+        end_date (date | str): Last date of the window, inclusive.
+        schedule_types (list, optional): Schedules to fetch. Defaults to all three.
+        max_workers (int, optional): Concurrent CloudWatch requests. Defaults to 12.
+        ttl_seconds (int, optional): How long recent send times are trusted before looking for new ones. Defaults to 300.
+
+    Returns:
+        pl.DataFrame: Long frame with SEND_TIME_SCHEMA, one row per (schedule, survey, date) sent.
+    """
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    log_groups = send_time_log_groups(schedule_types)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(log_groups)))) as executor:
+        sync_jobs = [submit_in_context(executor, _sync_quietly, group, start_date, end_date, ttl_seconds) for group in log_groups]
+        for job in sync_jobs:
+            job.result()
+    return read_send_times(start_date, end_date, schedule_types)
+
+
+def send_times_wide(send_times: pl.DataFrame, schedule_type: str, dates: list = None) -> pl.DataFrame:
+    """Derive one schedule's wide send-time table (Date, Survey 1..4) from the long frame.
+
+    Args:
+        send_times (pl.DataFrame): Long frame from fetch_send_times().
+        schedule_type (str): Schedule to show.
+        dates (list, optional): Dates to include as rows, sent or not. Defaults to the dates that have a send time.
+
+    Returns:
+        pl.DataFrame: "Date" (pl.Date) and one pl.Time column per survey (null if not sent).
+    """
+    wide = (
+        send_times.filter(pl.col("Schedule Type") == schedule_type)
+        .group_by("Date")
+        .agg([
+            pl.col("Send Time").filter(pl.col("Survey") == survey).first().alias(f"Survey {survey}")
+            for survey in SURVEY_NUMBERS
+        ])
+    )
+    if dates is not None:
+        # Date spine joined to the send times: one row per requested date in a single pass
+        spine = pl.DataFrame({"Date": [_as_date(d) for d in dates]}, schema={"Date": pl.Date})
+        wide = spine.join(wide, on="Date", how="left", maintain_order="left")
+    return wide.sort("Date").select("Date", *[f"Survey {survey}" for survey in SURVEY_NUMBERS])
@@ -0,0 +1,85 @@
+import glob
+import hashlib
+import json
+import os
+import polars as pl
+from .env_initialize import get_cache_dir
+
+
+def source_fingerprint(source_paths: list) -> list:
+    """Build a cache key from each source file's path, size and mtime.
+
+    Args:
+        source_paths (list): Paths of the source CSV files.
+
+    Returns:
+        list: [path, size, mtime_ns] for each source, or None if any file is missing.
+    """
+    fingerprint = []
+    for path in source_paths:
+        if not path:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        fingerprint.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+    return fingerprint
+
+
+def _fingerprint_digest(name: str, fingerprint: list) -> str:
+    payload = json.dumps([name, fingerprint], sort_keys=True).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()[:16]
+
+
+def _remove_stale_files(name: str, keep_path: str):
+    # Old snapshots may still be memory-mapped by another request (and locked on
+    # Windows), so removal is best effort.
+    for path in glob.glob(os.path.join(get_cache_dir(), f"{name}_*.arrow")):
+        if os.path.abspath(path) != os.path.abspath(keep_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def load_cached_frame(name: str, source_paths: list, build) -> pl.DataFrame:
+    """Return a frame derived from source files, using an Arrow IPC cache on disk.
+
+    The frame produced by build() is written uncompressed to the cache directory
+    under a file name derived from the sources' path/size/mtime. Later calls with
+    unchanged sources memory-map that file instead of calling build() again.
+
+    Args:
+        name (str): Cache entry name, e.g. 'merged_surveys'.
+        source_paths (list): Files the frame is derived from.
+        build (callable): Zero-argument function that builds the frame (may return None).
+
+    Returns:
+        pl.DataFrame: The cached or freshly built frame, or None if build() returned None.
+    """
+    fingerprint = source_fingerprint(source_paths)
+    if fingerprint is None:
+        return build()
+
+    cache_path = os.path.join(get_cache_dir(), f"{name}_{_fingerprint_digest(name, fingerprint)}.arrow")
+    if os.path.exists(cache_path):
+        try:
+            return pl.read_ipc(cache_path, memory_map=True)
+        except Exception as e:
+            print(f"Error reading cached {name}, rebuilding: {e}")
+
+    df = build()
+    if df is None:
+        return None
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        df.write_ipc(tmp_path, compression='uncompressed')
+        os.replace(tmp_path, cache_path)
+        _remove_stale_files(name, cache_path)
+    except OSError as e:
+        print(f"Error writing {name} cache: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return df
@@ -0,0 +1,222 @@
+import glob
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+import polars as pl
+from .env_initialize import read_env_variables, get_cache_dir
+from .survey_cache import source_fingerprint
+from .timing import timed
+
+# Qualtrics export for each survey source, keyed by the .env variable holding its path
+SURVEY_SOURCE_KEYS = {
+    "Survey 1A": "qualtrics_survey_p3_1a_path",
+    "Survey 1B": "qualtrics_survey_p3_1b_path",
+    "Survey 2A": "qualtrics_survey_p3_2a_path",
+    "Survey 2B": "qualtrics_survey_p3_2b_path",
+    "Survey 3": "qualtrics_survey_p3_3_path",
+    "Survey 4": "qualtrics_survey_p3_4_path",
+}
+
+# Columns kept in the normalized store (the rest of the Qualtrics export is never read)
+STORE_COLUMNS = ["Name", "Age", "Date/Time", "Survey_Source"]
+
+# Qualtrics Date/Time format (America/Denver); high-water marks are stored in it
+MARK_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_ingest_lock = threading.Lock()
+
+
+def _store_dir() -> str:
+    path = os.path.join(get_cache_dir(), 'survey_store')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _state_path() -> str:
+    return os.path.join(_store_dir(), 'state.json')
+
+
+def _source_slug(source: str) -> str:
+    return source.lower().replace(' ', '_')
+
+
+def _read_state() -> dict:
+    try:
+        with open(_state_path(), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_state(state: dict):
+    tmp_path = f"{_state_path()}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, _state_path())
+
+
+def _row_hash(row: tuple) -> str:
+    return hashlib.sha1(json.dumps(row, default=str).encode('utf-8')).hexdigest()
+
+
+def normalize_survey_rows(raw_df: pl.DataFrame, source: str) -> pl.DataFrame:
+    """Normalize raw Qualtrics rows the same way merge_survey_data always has.
+
+    Parses Date/Time (exported in America/Denver) into America/New_York, uppercases
+    Name and strips its spaces, tags the survey source and drops rows without a time.
+
+    Args:
+        raw_df (pl.DataFrame | pl.LazyFrame): Name, Age and Date/Time columns as read from the CSV.
+        source (str): Survey source label, e.g. "Survey 1A".
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: Rows with STORE_COLUMNS.
+    """
+    return raw_df.with_columns(
+        pl.col("Date/Time").str.strptime(pl.Datetime, format="%Y-%m-%d %H:%M:%S", strict=False)
+        .dt.replace_time_zone("America/Denver").dt.convert_time_zone("America/New_York"),
+        pl.col("Name").str.to_uppercase().str.replace_all(" ", ""),
+        pl.col("Age").cast(pl.Int64, strict=False),
+        pl.lit(source).alias("Survey_Source")
+    ).filter(pl.col("Date/Time").is_not_null()).select(STORE_COLUMNS)
+
+
+def _reset_source(source: str):
+    for path in glob.glob(os.path.join(_store_dir(), f"{_source_slug(source)}-*.arrow")):
+        os.remove(path)
+
+
+def _parse_mark(value: str):
+    try:
+        return datetime.strptime(value, MARK_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def _ingest_source(source: str, path: str, source_state: dict) -> tuple:
+    """Append the rows of one export that are newer than its high-water mark.
+
+    Exports are cumulative, so only rows whose parsed Date/Time is at or after the stored
+    high-water mark are kept; rows exactly at the mark are de-duplicated by hash. Rows whose
+    Date/Time does not parse (Qualtrics header/ImportId rows) are dropped before the mark is
+    taken, so they can never become the mark.
+
+    Returns:
+        tuple: (new source state, number of rows appended)
+    """
+    fingerprint = source_fingerprint([path])
+    if source_state.get('fingerprint') == fingerprint:
+        return source_state, 0
+
+    high_water_mark = _parse_mark(source_state.get('high_water_mark'))
+    if source_state.get('path') != os.path.abspath(path) or (source_state.get('high_water_mark') is not None and high_water_mark is None):
+        # A different export file was configured, or the stored mark is unusable: rebuild this source from scratch
+        _reset_source(source)
+        source_state = {}
+        high_water_mark = None
+
+    boundary_hashes = set(source_state.get('boundary_hashes', []))
+
+    lf = pl.scan_csv(path, schema_overrides={"Date/Time": pl.Utf8}).select(["Name", "Age", "Date/Time"])
+    lf = lf.with_columns(
+        pl.col("Date/Time").str.strptime(pl.Datetime, format=MARK_FORMAT, strict=False).alias("_parsed")
+    ).filter(pl.col("_parsed").is_not_null())
+    if high_water_mark is not None:
+        lf = lf.filter(pl.col("_parsed") >= high_water_mark)
+    parsed_df = lf.collect()
+
+    if high_water_mark is not None and boundary_hashes:
+        at_mark = parsed_df.filter(pl.col("_parsed") == high_water_mark)
+        seen = [_row_hash(row) in boundary_hashes for row in at_mark.drop("_parsed").iter_rows()]
+        parsed_df = pl.concat([
+            parsed_df.filter(pl.col("_parsed") != high_water_mark),
+            at_mark.filter(~pl.Series(seen, dtype=pl.Boolean))
+        ])
+
+    new_rows = normalize_survey_rows(parsed_df.drop("_parsed"), source)
+    part_number = source_state.get('parts', 0)
+    if not new_rows.is_empty():
+        part_number += 1
+        part_path = os.path.join(_store_dir(), f"{_source_slug(source)}-{part_number:06d}.arrow")
+        new_rows.write_ipc(part_path, compression='uncompressed')
+
+    if not parsed_df.is_empty():
+        latest = parsed_df.select(pl.col("_parsed").max()).item()
+        if high_water_mark is None or latest > high_water_mark:
+            high_water_mark = latest
+            boundary_hashes = set()
+        boundary_hashes.update(
+            _row_hash(row) for row in parsed_df.filter(pl.col("_parsed") == high_water_mark).drop("_parsed").iter_rows()
+        )
+
+    new_state = {
+        'path': os.path.abspath(path),
+        'fingerprint': fingerprint,
+        'high_water_mark': high_water_mark.strftime(MARK_FORMAT) if high_water_mark is not None else None,
+        'boundary_hashes': sorted(boundary_hashes),
+        'parts': part_number
+    }
+    return new_state, new_rows.height
+
+
+@timed('surveys.ingest')
+def ingest_survey_exports(env_vars: dict = None) -> dict:
+    """Append new responses from every configured Qualtrics export to the local store.
+
+    Exports whose size and mtime have not changed since the last ingest are skipped
+    without being opened.
+
+    Args:
+        env_vars (dict, optional): Values from read_env_variables(). Read if not given.
+
+    Returns:
+        dict: Number of rows appended per survey source.
+    """
+    env_vars = env_vars or read_env_variables()
+    appended = {}
+    with _ingest_lock:
+        state = _read_state()
+        for source, key in SURVEY_SOURCE_KEYS.items():
+            path = env_vars.get(key)
+            if not path or not os.path.exists(path):
+                print(f"Survey export for {source} not found ({key}). Skipping.")
+                continue
+            state[source], appended[source] = _ingest_source(source, path, state.get(source, {}))
+        _write_state(state)
+    return appended
+
+
+def rebuild_survey_store(env_vars: dict = None) -> dict:
+    """Drop the local store and re-ingest every export from scratch."""
+    with _ingest_lock:
+        for source in SURVEY_SOURCE_KEYS:
+            _reset_source(source)
+        if os.path.exists(_state_path()):
+            os.remove(_state_path())
+    return ingest_survey_exports(env_vars)
+
+
+def survey_store_files(survey_sources: list = None) -> list:
+    """Return the store part files for the given survey sources (all sources by default)."""
+    files = []
+    for source in SURVEY_SOURCE_KEYS:
+        if survey_sources is None or source in survey_sources:
+            files.extend(sorted(glob.glob(os.path.join(_store_dir(), f"{_source_slug(source)}-*.arrow"))))
+    return files
+
+
+def scan_survey_store(survey_sources: list = None) -> pl.LazyFrame:
+    """Lazily scan the normalized survey store.
+
+    Args:
+        survey_sources (list, optional): Survey sources to include. Defaults to all.
+
+    Returns:
+        pl.LazyFrame: Stored responses with STORE_COLUMNS, or None if the store is empty.
+    """
+    files = survey_store_files(survey_sources)
+    if not files:
+        return None
+    return pl.scan_ipc(files, memory_map=True)
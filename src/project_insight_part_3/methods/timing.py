@@ -0,0 +1,151 @@
+import contextvars
+import functools
+import json
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+
+# Most recent timing records kept in memory
+MAX_TIMING_RECORDS = 5000
+
+_records = deque(maxlen=MAX_TIMING_RECORDS)
+_records_lock = threading.Lock()
+_current_request = contextvars.ContextVar('timing_request', default=None)
+_current_span = contextvars.ContextVar('timing_span', default=None)
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Time a block of code and record it as a stage of the current request.
+
+    Args:
+        name (str): Stage name, e.g. 'dynamodb.scan'.
+        **attrs: Extra values stored with the record, e.g. log_group=...
+    """
+    parent = _current_span.get()
+    token = _current_span.set(name)
+    started_at = time.time()
+    start = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = repr(e)
+        raise
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        _current_span.reset(token)
+        request = _current_request.get()
+        record = {
+            'name': name,
+            'parent': parent,
+            'request_id': request['id'] if request else None,
+            'request': request['label'] if request else None,
+            'started_at': started_at,
+            'duration_ms': round(duration_ms, 3),
+            'thread': threading.current_thread().name,
+            'attrs': {key: str(value) for key, value in attrs.items()},
+            'error': error
+        }
+        with _records_lock:
+            _records.append(record)
+
+
+@contextmanager
+def request_scope(label: str):
+    """Group every span inside the block (including ones in bound worker threads) under one request."""
+    token = _current_request.set({'id': uuid.uuid4().hex[:12], 'label': label})
+    try:
+        with span(label):
+            yield
+    finally:
+        _current_request.reset(token)
+
+
+def timed(name: str = None):
+    """Decorator form of span(); the stage name defaults to the function's qualified name."""
+    def decorator(func):
+        stage = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def bind_context(func):
+    """Return func bound to a copy of the current context, so spans it records in another thread
+    (run.io_bound, a ThreadPoolExecutor) are attributed to the current request."""
+    return functools.partial(contextvars.copy_context().run, func)
+
+
+def submit_in_context(executor, func, *args, **kwargs):
+    """executor.submit() that carries the current request into the worker thread."""
+    return executor.submit(bind_context(func), *args, **kwargs)
+
+
+def timing_records(request_id: str = None) -> list:
+    """Return the recorded spans, oldest first, optionally for one request."""
+    with _records_lock:
+        records = list(_records)
+    if request_id is not None:
+        records = [record for record in records if record['request_id'] == request_id]
+    return records
+
+
+def request_breakdown(limit: int = 20) -> list:
+    """Aggregate the recorded spans per request, most recent request first.
+
+    Args:
+        limit (int, optional): Number of requests to return. Defaults to 20.
+
+    Returns:
+        list: One dict per request with 'request_id', 'request', 'started_at', 'total_ms' and
+        'stages' (name, count, total_ms, max_ms, errors), slowest stage first.
+    """
+    requests = {}
+    for record in timing_records():
+        if record['request_id'] is None:
+            continue
+        request = requests.setdefault(record['request_id'], {
+            'request_id': record['request_id'],
+            'request': record['request'],
+            'started_at': record['started_at'],
+            'total_ms': 0.0,
+            'stages': {}
+        })
+        request['started_at'] = min(request['started_at'], record['started_at'])
+        if record['name'] == record['request'] and record['parent'] is None:
+            request['total_ms'] = record['duration_ms']
+            continue
+        stage = request['stages'].setdefault(record['name'], {'name': record['name'], 'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'errors': 0})
+        stage['count'] += 1
+        stage['total_ms'] = round(stage['total_ms'] + record['duration_ms'], 3)
+        stage['max_ms'] = max(stage['max_ms'], record['duration_ms'])
+        stage['errors'] += record['error'] is not None
+
+    breakdown = sorted(requests.values(), key=lambda request: request['started_at'], reverse=True)[:limit]
+    for request in breakdown:
+        request['stages'] = sorted(request['stages'].values(), key=lambda stage: stage['total_ms'], reverse=True)
+    return breakdown
+
+
+def timings_json(limit: int = 20) -> str:
+    """Return the per-request breakdown and the raw spans as a JSON string."""
+    return json.dumps({'requests': request_breakdown(limit), 'records': timing_records()}, indent=2)
+
+
+def dump_timings_json(path: str, limit: int = 20) -> str:
+    """Write timings_json() to a file and return its path."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(timings_json(limit))
+    return path
+
+
+def clear_timings():
+    with _records_lock:
+        _records.clear()
@@ -0,0 +1,117 @@
+from nicegui import ui, run, events
+import polars as pl
+from .components import top_bar
+from .polars_table import PolarsTable
+from ..methods.aws_functions import add_users_to_database
+from ..methods.enrollment import ENROLLMENT_CSV_COLUMNS, read_enrollment_csv, plan_enrollment, enrollment_item
+from ..methods.participant_snapshot import get_participant_snapshot, invalidate_participant_snapshot
+from ..methods.timing import span, request_scope, bind_context
+
+def enrollment_frame(planned: list, results: dict = None) -> pl.DataFrame:
+    """Tabulate plan_enrollment() entries for display; results maps an entry index to its (success, message) write result."""
+    rows = []
+    for index, entry in enumerate(planned):
+        if results is not None and index in results:
+            success, message = results[index]
+            status = 'Added' if success else message
+        else:
+            status = entry['error'] or 'Ready'
+        rows.append({
+            'Row': entry['row'],
+            'Participant ID': entry['participant_id'],
+            'Start Date': entry['start_date'],
+            'End Date': entry['end_date'] or '',
+            'Phone Number': entry['phone_number'],
+            'Leaderboard Link': entry['lb_link'],
+            'Schedule': entry['schedule'],
+            'Reminder Days (4-11)': ''.join(str(value) for value in entry['message_randomizer'] or []),
+            'Status': status
+        })
+    return pl.DataFrame(rows, schema={column: pl.Int64 if column == 'Row' else pl.Utf8 for column in [
+        'Row', 'Participant ID', 'Start Date', 'End Date', 'Phone Number', 'Leaderboard Link', 'Schedule', 'Reminder Days (4-11)', 'Status'
+    ]})
+
+def bulk_add_user_page():
+    planned = []
+
+    top_bar('Bulk Add Participants')
+
+    with ui.column().classes('items-center w-full'):
+        ui.markdown(f"Upload a CSV with the columns **{'**, **'.join(ENROLLMENT_CSV_COLUMNS)}**. "
+                    "End dates and reminder schedules are computed the same way as on the Add User page.").classes('w-2/3')
+        ui.upload(label='Participants CSV', auto_upload=True, max_files=1, on_upload=lambda e: handle_upload(e)).props('accept=.csv').classes('w-2/3')
+        summary_label = ui.label('').classes('text-lg')
+        with ui.row().classes('items-center gap-2') as progress_row:
+            ui.spinner(size='md')
+            progress_label = ui.label('')
+        progress_row.visible = False
+        enroll_button = ui.button('Enroll Participants', on_click=lambda: handle_enroll()).props('color=green')
+        enroll_button.visible = False
+        table_container = ui.column().classes('w-2/3 h-auto')
+
+    def show_table(df: pl.DataFrame):
+        table_container.clear()
+        with table_container, span('render.bulk_enrollment'):
+            PolarsTable(df, rows_per_page=25).classes('w-full')
+
+    async def handle_upload(e: events.UploadEventArguments):
+        nonlocal planned
+        with request_scope('bulk enrollment preview'):
+            try:
+                rows = read_enrollment_csv(await e.file.read())
+            except Exception as error:
+                ui.notify(f'Could not read the CSV: {error}', type='negative', close_button=True, timeout=5000)
+                return
+
+            progress_label.text = 'Checking participants...'
+            progress_row.visible = True
+            try:
+                # Fresh scan, so participants added since the snapshot was taken are not written twice
+                snapshot = await run.io_bound(bind_context(get_participant_snapshot), True)
+            except Exception as error:
+                ui.notify(f'AWS Error: could not load enrolled participants: {error}', type='negative', close_button=True, timeout=5000)
+                return
+            finally:
+                progress_row.visible = False
+
+            existing_ids = set(snapshot['participant_id'].drop_nulls().to_list())
+            planned = plan_enrollment(rows, existing_ids)
+            valid = sum(entry['error'] is None for entry in planned)
+            summary_label.text = f'{valid} of {len(planned)} rows ready to enroll'
+            enroll_button.text = f'Enroll {valid} Participants'
+            enroll_button.visible = valid > 0
+            show_table(enrollment_frame(planned))
+
+    async def handle_enroll():
+        valid_indexes = [index for index, entry in enumerate(planned) if entry['error'] is None]
+        if not valid_indexes:
+            return
+
+        with request_scope('bulk enrollment write'):
+            enroll_button.disable()
+            progress_label.text = f'Adding {len(valid_indexes)} participants...'
+            progress_row.visible = True
+            try:
+                items = [enrollment_item(planned[index]) for index in valid_indexes]
+                write_results = await run.io_bound(bind_context(add_users_to_database), items)
+            except Exception as error:
+                # Some rows may have been written before the failure
+                invalidate_participant_snapshot()
+                ui.notify(f'Error adding participants: {error}', type='negative', close_button=True, timeout=5000)
+                return
+            finally:
+                progress_row.visible = False
+                enroll_button.enable()
+
+            results = dict(zip(valid_indexes, write_results))
+            added = sum(success for success, _ in write_results)
+            if added:
+                invalidate_participant_snapshot()
+
+            enroll_button.visible = False
+            summary_label.text = f'{added} of {len(valid_indexes)} participants added'
+            if added == len(valid_indexes):
+                ui.notify(f'{added} participants added successfully.', type='positive', close_button=True, timeout=5000)
+            else:
+                ui.notify(f'{len(valid_indexes) - added} participants could not be added. See the Status column.', type='negative', close_button=True, timeout=5000)
+            show_table(enrollment_frame(planned, results))
@@ -1,7 +1,11 @@
 from nicegui import ui
+import asyncio
 import re
+from datetime import datetime
 from .components import top_bar
-from ..methods.compliance_methods import get_survey_send_times_all, get_participant_list, compliance_table_daily_report, merge_survey_data, contact_checks
+from .polars_table import PolarsTable
+from ..methods.report_jobs import submit_compliance_report
+from ..methods.timing import span, request_scope
 
 def compliance_report_page():
     
@@ -29,7 +33,14 @@ def compliance_report_page():
                                 ui.button('Close', on_click=menu.close).props('flat')
                     with date_input.add_slot('append'):
                         ui.icon('edit_calendar').on('click', menu.open).classes('cursor-pointer')
-                ui.button('Generate Report', on_click=lambda: load_compliance_report()).classes('mb-3')
+                with ui.row().classes('items-center gap-2 mb-3'):
+                    generate_button = ui.button('Generate Report', on_click=lambda: load_compliance_report())
+                    regenerate_button = ui.button(icon='refresh', on_click=lambda: load_compliance_report(force=True)).props('flat').tooltip('Regenerate instead of using the saved report')
+                report_status_label = ui.label('').classes('text-sm text-gray-400')
+                with ui.row().classes('items-center gap-2') as progress_row:
+                    ui.spinner(size='md')
+                    progress_label = ui.label('')
+                progress_row.visible = False
         
         compliance_summary_column = ui.column().classes('w-200 h-flex outline outline-cyan-500 outline-offset-10 rounded-lg items-center justify-left')
         compliance_summary_column.visible = False
@@ -59,11 +70,11 @@ def compliance_report_page():
                     with content_container:
                         if participant_df is not None:
                             ui.markdown(f"#### Not Started ({len(participant_df['not_started'])}):")
-                            ui.table.from_polars(participant_df['not_started']).classes('w-full')
+                            PolarsTable(participant_df['not_started']).classes('w-full')
                             ui.markdown(f"#### Currently In Study ({len(participant_df['currently_in_study'])}):")
-                            ui.table.from_polars(participant_df['currently_in_study']).classes('w-full')
+                            PolarsTable(participant_df['currently_in_study']).classes('w-full')
                             ui.markdown(f"#### Completed ({len(participant_df['done_with_study'])}):")
-                            ui.table.from_polars(participant_df['done_with_study']).classes('w-full')
+                            PolarsTable(participant_df['done_with_study']).classes('w-full')
                         else:
                             ui.label("No participant data available for the selected date.")
                 
@@ -72,7 +83,7 @@ def compliance_report_page():
                     content_container = ui.column().classes('w-full')
                     with content_container:
                         if compliance_df is not None:
-                            ui.table.from_polars(compliance_df).classes('w-full')
+                            PolarsTable(compliance_df, rows_per_page=25).classes('w-full')
                         else:
                             ui.label("No compliance data available for the selected date.")
                 
@@ -106,22 +117,46 @@ def compliance_report_page():
                         else:
                             ui.button(str(i), on_click=lambda p=i: update_content(p)).props('flat')
             
-    def load_compliance_report():
+    async def load_compliance_report(force: bool = False):
+        with request_scope(f'compliance report page {date_input.value}'):
+            await show_compliance_report(force)
+
+    async def show_compliance_report(force: bool = False):
         nonlocal early_bird_df, standard_schedule_df, night_owl_df
         nonlocal participant_df
         nonlocal compliance_df
         nonlocal did_not_do_lb, two_NRs_in_a_row
         
         date_value = date_input.value
-        early_bird_df, standard_schedule_df, night_owl_df = get_survey_send_times_all(date_value)
-        compliance_summary_column.visible = True
+        if not date_value or not re.match(r'^\d{4}-\d{2}-\d{2}$', date_value):
+            ui.notify('Please enter a date in the format YYYY-MM-DD.', type='negative', close_button=True, timeout=5000)
+            return
         
-        participant_df = get_participant_list(date_value)
-        merged_df = merge_survey_data()
-        compliance_df = compliance_table_daily_report(date_value, participant_df, early_bird_df, standard_schedule_df, night_owl_df, merged_df)
-        did_not_do_lb, two_NRs_in_a_row = contact_checks(compliance_df)
+        generate_button.disable()
+        regenerate_button.disable()
+        progress_label.text = 'Generating report...'
+        progress_row.visible = True
+        try:
+            # Reports run on the shared report workers; identical requests from other sessions share one job
+            report = await asyncio.wrap_future(submit_compliance_report(date_value, force=force))
+        except Exception as e:
+            ui.notify(f'Error generating compliance report: {e}', type='negative', close_button=True, timeout=5000)
+            return
+        finally:
+            progress_row.visible = False
+            generate_button.enable()
+            regenerate_button.enable()
         
-        update_content(1)  # Show the first page after loading data
-
+        early_bird_df = report['early_bird_df']
+        standard_schedule_df = report['standard_schedule_df']
+        night_owl_df = report['night_owl_df']
+        participant_df = report['participant_df']
+        compliance_df = report['compliance_df']
+        did_not_do_lb, two_NRs_in_a_row = report['did_not_do_lb'], report['two_NRs_in_a_row']
         
-        
\ No newline at end of file
+        generated_at = datetime.fromtimestamp(report['created_at']).strftime("%Y-%m-%d %H:%M:%S")
+        report_status_label.text = f"{'Saved report' if report.get('cached') else 'Generated'} {generated_at}"
+        
+        compliance_summary_column.visible = True
+        with span('render.compliance_report'):
+            update_content(1)  # Show the first page after loading data
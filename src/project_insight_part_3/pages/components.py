@@ -6,6 +6,7 @@ def menu():
             ui.menu_item('Homepage', on_click=lambda: ui.navigate.to('/'))
             ui.menu_item('Initialization', on_click=lambda: ui.navigate.to('/initialization'))
             ui.menu_item('Add Participant', on_click=lambda: ui.navigate.to('/add_user'))
+            ui.menu_item('Bulk Add Participants', on_click=lambda: ui.navigate.to('/bulk_add_user'))
             with ui.menu_item('View/Edit Participant', auto_close=False):
                 with ui.item_section().props('side'):
                     ui.icon('keyboard_arrow_right')
@@ -19,6 +20,7 @@ def menu():
                 with ui.menu().props('anchor="top end" self="top start" auto-close'):
                     ui.menu_item("Daily Report", on_click=lambda: ui.navigate.to('/compliance_report'))
                     ui.menu_item("Check Individual Compliance", on_click=lambda: ui.navigate.to('/individual_compliance_check'))
+            ui.menu_item('Diagnostics', on_click=lambda: ui.navigate.to('/diagnostics'))
             
 
 def top_bar(page_title: str):
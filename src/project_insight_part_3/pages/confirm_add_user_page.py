@@ -2,27 +2,19 @@ from nicegui import ui
 from .components import top_bar
 from datetime import datetime, timedelta
 import polars as pl
-import random
-import json
-from importlib.resources import files
 from ..methods.aws_functions import add_user_to_database
+from ..methods.participant_snapshot import invalidate_participant_snapshot
+from ..methods.enrollment import REMINDER_DAYS, load_schedules, normalize_phone_number, shuffle_message_randomizer, study_end_date
 
 def confirm_add_user_page(participant_id, start_date, phone_number, lb_link, schedule):
     # Calculate end date as start date + 13 days
-    end_date = datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=13)
-    end_date = end_date.strftime('%Y-%m-%d')
+    end_date = study_end_date(start_date)
     
-    phone_number = phone_number.strip()
-    if not phone_number.startswith('+'):
-        phone_number = f"+{phone_number}"
+    phone_number = normalize_phone_number(phone_number)
         
     # Get Schedule Details from json
-    schedules_path = files("project_insight_part_3.methods").joinpath("schedules.json")
-    with schedules_path.open("r", encoding="utf-8") as file:
-        schedules = json.load(file)
-            
-        participant_schedule = schedules.get(schedule, {})
-        schedule_df = pl.DataFrame(participant_schedule)
+    participant_schedule = load_schedules().get(schedule, {})
+    schedule_df = pl.DataFrame(participant_schedule)
     
     def get_phase_breakdown():
         phase_1_end = datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=3)
@@ -34,6 +26,7 @@ def confirm_add_user_page(participant_id, start_date, phone_number, lb_link, sch
     def on_submit_handle():
         success, message = add_user_to_database(participant_id, start_date, end_date, phone_number, lb_link, schedule, send_randomizer)
         if success:
+            invalidate_participant_snapshot()
             ui.notify(f'{message}', type='positive', close_button=True, timeout=5000)
             ui.navigate.to('/')
         else:
@@ -76,17 +69,8 @@ def confirm_add_user_page(participant_id, start_date, phone_number, lb_link, sch
                         ui.button('Confirm and Add User', on_click=on_submit_handle).props('color=green').classes('mr-10')
 
 def message_shuffler():
-    send_randomizer = [1, 1, 1, 1, 0, 0, 0, 0] # 1s are send message, 0s are don't send message 
-    random.shuffle(send_randomizer)
+    send_randomizer = shuffle_message_randomizer() # 1s are send message, 0s are don't send message 
     
-    randomizer_df = pl.DataFrame(data={'Day 4': send_randomizer[0],
-                             'Day 5': send_randomizer[1],
-                             'Day 6': send_randomizer[2],
-                             'Day 7': send_randomizer[3],
-                             'Day 8': send_randomizer[4],
-                             'Day 9': send_randomizer[5],
-                             'Day 10': send_randomizer[6],
-                             'Day 11': send_randomizer[7]}
-    )
+    randomizer_df = pl.DataFrame(data=dict(zip(REMINDER_DAYS, send_randomizer)))
     
     return send_randomizer, randomizer_df
\ No newline at end of file
@@ -1,6 +1,7 @@
 from nicegui import ui
 from .components import top_bar
 from ..methods.aws_functions import get_user_info, delete_user_from_database
+from ..methods.participant_snapshot import invalidate_participant_snapshot
 
 def delete_user_page():
     
@@ -29,6 +30,7 @@ def delete_user_page():
             def confirm_delete_participant(participant_id, dialog):
                 success, message = delete_user_from_database(participant_id)
                 if success:
+                    invalidate_participant_snapshot()
                     ui.notify(f'Participant {participant_id} deleted successfully!', type='positive', close_button=True, timeout=5000)
                     participant_info_container.clear()
                     ui.navigate.to('/')
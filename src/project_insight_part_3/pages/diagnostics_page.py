@@ -0,0 +1,39 @@
+from nicegui import ui
+import polars as pl
+from datetime import datetime
+from .components import top_bar
+from ..methods.timing import request_breakdown, timings_json, clear_timings
+
+def diagnostics_page():
+    top_bar('Diagnostics')
+
+    with ui.column().classes('w-full items-center'):
+        with ui.row().classes('justify-center gap-2 mb-3'):
+            ui.button('Refresh', icon='refresh', on_click=lambda: render_breakdown())
+            ui.button('Download JSON', icon='download', on_click=lambda: ui.download.content(timings_json(), 'timings.json'))
+            ui.button('Clear', icon='delete', on_click=lambda: clear_and_render()).props('flat')
+
+        breakdown_container = ui.column().classes('w-2/3 h-auto')
+
+    def render_breakdown():
+        breakdown_container.clear()
+        breakdown = request_breakdown()
+        with breakdown_container:
+            if not breakdown:
+                ui.label('No timings recorded yet. Load a page (e.g. a compliance report) and refresh.').classes('m-3')
+                return
+            for request in breakdown:
+                started = datetime.fromtimestamp(request['started_at']).strftime("%Y-%m-%d %H:%M:%S")
+                ui.markdown(f"#### {request['request']} — {request['total_ms']:.0f} ms ({started})")
+                if request['stages']:
+                    stages_df = pl.DataFrame(request['stages']).with_columns(
+                        pl.col('total_ms').round(1),
+                        pl.col('max_ms').round(1)
+                    ).rename({'name': 'Stage', 'count': 'Calls', 'total_ms': 'Total (ms)', 'max_ms': 'Max (ms)', 'errors': 'Errors'})
+                    ui.table.from_polars(stages_df).classes('w-full')
+
+    def clear_and_render():
+        clear_timings()
+        render_breakdown()
+
+    render_breakdown()
@@ -1,17 +1,24 @@
-from nicegui import ui
+from nicegui import ui, run
 from .components import top_bar
 import polars as pl
 from datetime import datetime
 import plotly.graph_objects as go
 import json
 from importlib.resources import files
-from ..methods.compliance_methods import get_participant_initials, get_participant_dynamo_db, get_survey_send_times, generate_compliance_table_individual, calculate_compliance_percentage, compliance_over_time_plot
+from ..methods.participant_directory import get_participant_directory
+from ..methods.compliance_methods import get_participant_dynamo_db, get_survey_send_times, calculate_compliance_percentage, compliance_over_time_plot, study_today
+from ..methods.prematerialize import get_compliance_timeline
+from ..methods.timing import span, request_scope, bind_context
 
 def individual_compliance_check_page():
     top_bar('Individual Compliance Check')
 
     participant_id_input = ui.input(label='Enter Participant ID').props('clearable').classes('w-full mt-5')
-    ui.button('Search', on_click=lambda: handle_search()).props('color=blue').classes('w-full mb-5')
+    search_button = ui.button('Search', on_click=lambda: handle_search()).props('color=blue').classes('w-full mb-5')
+    with ui.row().classes('w-full justify-center items-center gap-2') as search_progress:
+        ui.spinner(size='md')
+        search_progress_label = ui.label('')
+    search_progress.visible = False
 
     participant_info_container = ui.column().classes('w-full h-auto justify-center items-center')
     participant_info_container.visible = False
@@ -102,7 +109,11 @@ def individual_compliance_check_page():
             
                 
 
-    def handle_search():
+    async def handle_search():
+        with request_scope('individual compliance search'):
+            await search_participant()
+
+    async def search_participant():
         nonlocal compliance_df
         nonlocal survey_send_df
         nonlocal schedule_type
@@ -116,30 +127,30 @@ def individual_compliance_check_page():
             ui.notify('Please enter a valid Participant ID.', type='negative', close_button=True, timeout=5000)
             return
     
+        search_button.disable()
+        search_progress.visible = True
         try:
-            participant_db = get_participant_initials()
-            participant_row = participant_db.filter(pl.col('Participant ID #') == pid)
+            search_progress_label.text = 'Looking up participant...'
+            participant = await run.io_bound(bind_context(lambda: get_participant_directory().lookup(pid)))
             
-            if participant_row.is_empty():
+            if participant is None:
                 ui.notify(f'Participant ID {pid} not found in database.', type='negative', close_button=True, timeout=5000)
                 return
                 
-            initials = participant_row.select('Initials').to_series()[0]
+            initials = participant['Initials']
             
-            study_start_date, study_end_date, schedule_type = get_participant_dynamo_db(pid)
+            study_start_date, study_end_date, schedule_type = await run.io_bound(bind_context(get_participant_dynamo_db), pid)
             
             if participant_id_input.value:
-                compliance_df = generate_compliance_table_individual(int(participant_id_input.value))
-                survey_send_df = get_survey_send_times(int(participant_id_input.value))
+                search_progress_label.text = 'Building compliance timeline...'
+                # Served from the nightly precomputed timeline while its inputs are unchanged
+                compliance_df = await run.io_bound(bind_context(get_compliance_timeline), pid)
+                # Read from the local send-time store; syncs CloudWatch first if it was not synced within the TTL
+                survey_send_df = await run.io_bound(bind_context(get_survey_send_times), pid)
                 
                 # Make sure the compliance_df has the same empty for corresponding cells (shouldn't show NR for surveys not sent yet)
                 if compliance_df is not None and survey_send_df is not None:
                     
-                    survey_send_df = survey_send_df.with_columns(
-                        pl.col("Date").str.to_date()
-                        
-                        )
-                    
                     send_cols = [c for c in survey_send_df.columns if c != "Date"]
                     join_df = compliance_df.join(
                         survey_send_df,
@@ -159,7 +170,7 @@ def individual_compliance_check_page():
                     compliance_df = join_df.select(exprs)
                     
                     # Calculate current compliance rate (only for dates <= today)
-                    today = datetime.now().date()
+                    today = study_today()
                     past_df = compliance_df.filter(pl.col("Date") <= today)
                     
                     total_cells = 0
@@ -184,18 +195,22 @@ def individual_compliance_check_page():
         except Exception as e:
             ui.notify(f"Error loading participant data: {e}", type='negative', close_button=True, timeout=5000)
             return
+        finally:
+            search_progress.visible = False
+            search_button.enable()
 
         participant_info_container.clear()
         compliance_data_container.clear()
         info_container.clear()
 
         pagination.value = 1
-        update_content(1)
+        with span('render.individual_compliance'):
+            update_content(1)
 
         with participant_info_container:
             study_start_date = datetime.strptime(study_start_date, "%Y-%m-%d")
             study_end_date = datetime.strptime(study_end_date, "%Y-%m-%d")
-            current_day_in_study = (datetime.now() - study_start_date).days + 1
+            current_day_in_study = (study_today() - study_start_date.date()).days + 1
 
             ui.markdown(
                 f'**Participant ID:** {pid}, **Initials:** {initials}, '
@@ -1,34 +1,76 @@
 # Use this to run from VSCode: python -m project_insight_part_3.pages.main
 
-from nicegui import ui
-import polars as pl
+from nicegui import app, background_tasks, ui, run
+from starlette.requests import Request
+import argparse
+import importlib
+import inspect
+import sys
 
-from ..methods.homepage_figures import pie_chart_progress, phase_breakdown_pie_chart, enrollment_progress_over_time
-from ..methods.compliance_methods import get_participant_initials, merge_survey_data, match_initials_table
-from ..methods.env_initialize import read_env_variables
+from ..methods.env_initialize import read_env_variables, QUALTRICS_PATH_KEYS
+from ..methods.import_budget import IMPORT_TIME_BUDGET_SECONDS, check_import_budget
+from ..methods.timing import span, request_scope, bind_context
 
 from .components import top_bar
-from .initialization_page import initialization_page
-from .add_user_page import add_user_page
-from .confirm_add_user_page import confirm_add_user_page
-from .view_edit_user_page import view_edit_user_page
-from .delete_user_page import delete_user_page
-from .send_sms_page import send_sms_page
-from .individual_compliance_check import individual_compliance_check_page
-from .compliance_report_page import compliance_report_page
+
+# Page modules pull in boto3, polars and plotly, so each is imported on its first request
+PAGES = {
+    '/initialization': ('initialization_page', 'initialization_page'),
+    '/add_user': ('add_user_page', 'add_user_page'),
+    '/confirm_add_user': ('confirm_add_user_page', 'confirm_add_user_page'),
+    '/bulk_add_user': ('bulk_add_user_page', 'bulk_add_user_page'),
+    '/view_edit_user': ('view_edit_user_page', 'view_edit_user_page'),
+    '/delete_user': ('delete_user_page', 'delete_user_page'),
+    '/send_sms': ('send_sms_page', 'send_sms_page'),
+    '/individual_compliance_check': ('individual_compliance_check', 'individual_compliance_check_page'),
+    '/compliance_report': ('compliance_report_page', 'compliance_report_page'),
+    '/diagnostics': ('diagnostics_page', 'diagnostics_page'),
+}
+
+# Newest survey responses listed on the dashboard
+RECENT_ACTIVITIES_SHOWN = 25
+
+# Allows for a cold import of the page module before the page is built
+LAZY_PAGE_RESPONSE_TIMEOUT = 20.0
+
+
+async def import_lazily(module_name: str):
+    """Import a module off the event loop, so other clients are not blocked while it loads.
+
+    Args:
+        module_name (str): Absolute module name.
+
+    Returns:
+        module: The imported module.
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = await run.io_bound(importlib.import_module, module_name)
+    return module
+
+
+def lazy_page(module_name: str, function_name: str):
+    """Return a page function that imports pages.<module_name> on first use and builds <function_name>.
+
+    Query parameters are passed on to the page function by name, as ui.page would for the function itself.
+    """
+    async def page(request: Request):
+        module = await import_lazily(f"{__package__}.{module_name}")
+        page_function = getattr(module, function_name)
+        parameters = inspect.signature(page_function).parameters
+        kwargs = {key: value for key, value in request.query_params.items() if key in parameters}
+        result = page_function(**kwargs)
+        if inspect.isawaitable(result):
+            await result
+
+    page.__name__ = function_name
+    return page
 
 
 def register_pages() -> None:
     ui.page('/')(main_page)
-    ui.page('/initialization')(initialization_page)
-    ui.page('/add_user')(add_user_page)
-    ui.page('/confirm_add_user')(confirm_add_user_page)
-    ui.page('/view_edit_user')(view_edit_user_page)
-    ui.page('/delete_user')(delete_user_page)
-    ui.page('/send_sms')(send_sms_page)
-    ui.page('/individual_compliance_check')(individual_compliance_check_page)
-    ui.page('/compliance_report')(compliance_report_page)
-    
+    for path, (module_name, function_name) in PAGES.items():
+        ui.page(path, response_timeout=LAZY_PAGE_RESPONSE_TIMEOUT)(lazy_page(module_name, function_name))
 
 
 def main_page():
@@ -41,26 +83,33 @@ def main_page():
             
             recent_activities_container = ui.column().classes('w-100 h-auto items-left justify-left')
             
-            def load_recent_activities():
+            def recent_activities_df():
+                from ..methods.recent_activity import get_recent_activities
+                return get_recent_activities(RECENT_ACTIVITIES_SHOWN)
+            
+            async def load_recent_activities():
+                with request_scope('homepage recent activities'):
+                    await show_recent_activities()
+            
+            async def show_recent_activities():
                 recent_activities_container.clear()
                 
                 env_vars = read_env_variables()
-                required_keys =  ['qualtrics_survey_p3_1a_path',
-                    'qualtrics_survey_p3_1b_path',
-                    'qualtrics_survey_p3_2a_path',
-                    'qualtrics_survey_p3_2b_path',
-                    'qualtrics_survey_p3_3_path',
-                    'qualtrics_survey_p3_4_path',
-                    'participant_db']
+                required_keys = QUALTRICS_PATH_KEYS + ['participant_db']
                 
                 if not all(key in env_vars and env_vars[key] for key in required_keys):
                     with recent_activities_container:
                         ui.label("Environment variables not properly set. Please initialize the environment.").classes('m-3')
                         return
                 
-                participant_df_db = get_participant_initials()
-                merged_df = merge_survey_data()
-                matched_df = match_initials_table(merged_df, participant_df_db)
+                with recent_activities_container:
+                    ui.spinner(size='lg').classes('m-3')
+                try:
+                    matched_df = await run.io_bound(bind_context(recent_activities_df))
+                except Exception as e:
+                    print(f"Error loading recent activities: {e}")
+                    matched_df = None
+                recent_activities_container.clear()
                 
                 if matched_df is None or matched_df.is_empty():
                     with recent_activities_container:
@@ -68,22 +117,20 @@ def main_page():
                         return
                 else:
                     try:
-                        front_page_df = matched_df.select([
-                            'Date/Time',
-                            'Participant ID #',
-                            'Initials',
-                            'Survey Source'
-                        ])
-                        with recent_activities_container:
-                            ui.table.from_polars(
-                                front_page_df,
-                                pagination=5
+                        # polars is already loaded by the recent activity lookup above
+                        from .polars_table import PolarsTable
+                        with recent_activities_container, span('render.recent_activities'):
+                            PolarsTable(
+                                matched_df,
+                                rows_per_page=5,
+                                searchable=False
                             ).classes('w-100 h-auto')
                     except Exception as e:
                         print(f"Error displaying recent activities: {e}")
                         with recent_activities_container:
                             ui.label("Error displaying recent activities.").classes('m-3')
-            load_recent_activities()
+            # Load after the page is sent, so the survey lookup does not hold up the whole dashboard
+            ui.timer(0, load_recent_activities, once=True)
             
 
         with ui.column().classes('w-100 outline outline-cyan-500 outline-offset-10 rounded-lg items-center'):
@@ -91,26 +138,55 @@ def main_page():
 
             fig_container = ui.column().classes('w-100 h-auto items-center justify-center mr-7')
                 
-            def update_content():
+            async def update_content():
+                with request_scope('homepage figures'):
+                    await show_figures()
+            
+            async def show_figures():
                 fig_container.clear()
-                current = page_number.value if hasattr(page_number, 'value') else 1
-                if current == 1:
-                    with fig_container:
-                        fig = pie_chart_progress()
-                        ui.plotly(fig).classes('w-80 h-auto')
-                elif current == 2:
-                    with fig_container:
-                        fig = phase_breakdown_pie_chart()
-                        ui.plotly(fig).classes('w-80 h-auto')
-                elif current == 3:
+                with fig_container:
+                    ui.spinner(size='lg').classes('m-3')
+                try:
+                    # The DynamoDB scan runs off the event loop; figures are built from the shared snapshot
+                    participant_snapshot = await import_lazily('project_insight_part_3.methods.participant_snapshot')
+                    homepage_figures = await import_lazily('project_insight_part_3.methods.homepage_figures')
+                    df = await run.io_bound(bind_context(participant_snapshot.get_participant_snapshot))
+                except Exception as e:
+                    fig_container.clear()
                     with fig_container:
-                        fig = enrollment_progress_over_time()
-                        fig.update_layout(margin=dict(l=20, r=20, t=0, b=0))
-                        fig.update_layout(width=None, height=None, autosize=True)
-                        fig = ui.plotly(fig).classes('w-80 h-auto')
+                        ui.label(f'AWS Error: {str(e)}').style('color: red; font-weight: bold;')
+                    return
                 
-            page_number = ui.pagination(1,3, direction_links=True, on_change=update_content).classes('justify-center items-center')
-            update_content()
+                fig_container.clear()
+                with span('render.homepage_figures'):
+                    current = page_number.value if hasattr(page_number, 'value') else 1
+                    if current == 1:
+                        with fig_container:
+                            fig = homepage_figures.pie_chart_progress(df)
+                            ui.plotly(fig).classes('w-80 h-auto')
+                    elif current == 2:
+                        with fig_container:
+                            fig = homepage_figures.phase_breakdown_pie_chart(df)
+                            ui.plotly(fig).classes('w-80 h-auto')
+                    elif current == 3:
+                        with fig_container:
+                            fig = homepage_figures.enrollment_progress_over_time(df)
+                            fig.update_layout(margin=dict(l=20, r=20, t=0, b=0))
+                            fig.update_layout(width=None, height=None, autosize=True)
+                            fig = ui.plotly(fig).classes('w-80 h-auto')
+                
+            async def refresh_figures():
+                try:
+                    participant_snapshot = await import_lazily('project_insight_part_3.methods.participant_snapshot')
+                    await run.io_bound(participant_snapshot.refresh_participant_snapshot)
+                except Exception as e:
+                    ui.notify(f'Error refreshing participant data: {e}', type='negative', close_button=True, timeout=5000)
+                await update_content()
+                
+            with ui.row().classes('justify-center items-center'):
+                page_number = ui.pagination(1,3, direction_links=True, on_change=update_content).classes('justify-center items-center')
+                ui.button(icon='refresh', on_click=refresh_figures).props('flat').tooltip('Refresh participant data')
+            ui.timer(0, update_content, once=True)
 
         with ui.column().classes('w-100 outline outline-cyan-500 outline-offset-10 rounded-lg items-center'):
             ui.label('Useful Links').classes('text-lg font-bold')
@@ -123,8 +199,31 @@ def main_page():
             ui.link('Tailwind CSS Documentation', 'https://tailwindcss.com/docs')
 
 
+async def nightly_prematerialization():
+    # Loaded once the server is up, so the heavy compliance stack does not delay startup
+    prematerialize_module = await import_lazily('project_insight_part_3.methods.prematerialize')
+    await prematerialize_module.run_nightly_prematerialization()
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(prog='insight-part3')
+    parser.add_argument('--prematerialize', action='store_true',
+                        help='Precompute the daily reports, participant timelines and homepage data, then exit')
+    parser.add_argument('--check-import-budget', action='store_true',
+                        help=f'Time a cold import of the entry point against the {IMPORT_TIME_BUDGET_SECONDS}s budget, then exit')
+    args, _ = parser.parse_known_args()
+    if args.prematerialize:
+        from ..methods.prematerialize import prematerialize
+        print(prematerialize())
+        return
+    if args.check_import_budget:
+        result = check_import_budget(f"{__package__}.main")
+        print(result)
+        sys.exit(0 if result['ok'] else 1)
+    
     register_pages()
+    # Precompute reports and timelines nightly so the morning's first loads are served from disk
+    app.on_startup(lambda: background_tasks.create(nightly_prematerialization(), name='nightly prematerialization'))
     
     # Add reload = False before pushing new versions to production
     ui.run(port=8081, reload=False)
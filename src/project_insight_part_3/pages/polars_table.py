@@ -0,0 +1,112 @@
+from nicegui import ui
+import polars as pl
+
+ROWS_PER_PAGE_OPTIONS = [10, 25, 50, 100]
+
+# Row key added to every served row; not shown as a column
+ROW_KEY = '_row'
+
+
+class PolarsTable(ui.table):
+    """A ui.table that keeps its Polars frame on the server and sends the browser one page at a time.
+
+    Sorting, search and filtering run in Polars on the server; the filtered and sorted frame is
+    kept between page requests and only rebuilt when the search, filter or sort order changes.
+    Use it in place of ui.table.from_polars for frames that grow with the study.
+    """
+
+    def __init__(self, df: pl.DataFrame, rows_per_page: int = 10, searchable: bool = True):
+        """
+        Args:
+            df (pl.DataFrame): Frame to show.
+            rows_per_page (int, optional): Initial page size. Defaults to 10.
+            searchable (bool, optional): Show a search box that matches any column. Defaults to True.
+        """
+        super().__init__(
+            columns=self._columns_for(df),
+            rows=[],
+            row_key=ROW_KEY,
+            pagination={'page': 1, 'rowsPerPage': rows_per_page, 'sortBy': None, 'descending': False, 'rowsNumber': df.height}
+        )
+        self._props['rows-per-page-options'] = sorted(set(ROWS_PER_PAGE_OPTIONS + [rows_per_page]))
+        self._df = df
+        self._search = ''
+        self._predicate = None
+        self._view = None
+        self._view_key = None
+        self.on('request', self._handle_request)
+
+        if searchable:
+            with self.add_slot('top-right'):
+                ui.input(placeholder='Search', on_change=lambda e: self.search(e.value)).props('dense clearable')
+
+        self._show_page(1)
+
+    @staticmethod
+    def _columns_for(df: pl.DataFrame) -> list:
+        return [{'name': column, 'label': column, 'field': column, 'sortable': True, 'align': 'left'} for column in df.columns]
+
+    def set_frame(self, df: pl.DataFrame):
+        """Replace the frame and go back to the first page."""
+        self._df = df
+        self._view = None
+        self.columns = self._columns_for(df)
+        self._show_page(1)
+
+    def search(self, text: str):
+        """Show only rows where any column contains the text (case-insensitive)."""
+        self._search = (text or '').strip()
+        self._show_page(1)
+
+    def set_filter(self, predicate: pl.Expr = None):
+        """Show only rows matching a Polars expression, e.g. pl.col('Schedule') == 'Standard Schedule'. None clears it."""
+        self._predicate = predicate
+        self._view = None
+        self._show_page(1)
+
+    def _current_view(self) -> pl.DataFrame:
+        sort_by = self.pagination.get('sortBy')
+        descending = bool(self.pagination.get('descending'))
+        view_key = (self._search, sort_by, descending)
+        if self._view is not None and view_key == self._view_key:
+            return self._view
+
+        view = self._df
+        if self._predicate is not None:
+            view = view.filter(self._predicate)
+        if self._search:
+            term = self._search.lower()
+            searchable_columns = [column for column, dtype in view.schema.items() if not dtype.is_nested()]
+            if searchable_columns:
+                view = view.filter(pl.any_horizontal([
+                    pl.col(column).cast(pl.String).str.to_lowercase().str.contains(term, literal=True)
+                    for column in searchable_columns
+                ]).fill_null(False))
+        if sort_by in view.columns:
+            view = view.sort(sort_by, descending=descending, nulls_last=True)
+
+        self._view = view
+        self._view_key = view_key
+        return view
+
+    def _show_page(self, page: int):
+        pagination = dict(self.pagination)
+        view = self._current_view()
+        # 0 is Quasar's "All"
+        rows_per_page = pagination.get('rowsPerPage') or max(view.height, 1)
+        page = max(1, min(page, (view.height - 1) // rows_per_page + 1))
+        offset = (page - 1) * rows_per_page
+        page_rows = view.slice(offset, rows_per_page).to_dicts()
+        for index, row in enumerate(page_rows):
+            row[ROW_KEY] = offset + index
+
+        pagination.update({'page': page, 'rowsNumber': view.height})
+        self.pagination = pagination
+        self.rows = page_rows
+
+    def _handle_request(self, e):
+        requested = e.args.get('pagination', {})
+        pagination = dict(self.pagination)
+        pagination.update({key: requested.get(key) for key in ['rowsPerPage', 'sortBy', 'descending'] if key in requested})
+        self.pagination = pagination
+        self._show_page(requested.get('page', 1))
@@ -1,6 +1,7 @@
 from nicegui import ui
 from .components import top_bar
 from ..methods.aws_functions import get_user_info, update_user_info
+from ..methods.participant_snapshot import invalidate_participant_snapshot
 import re
 
 def view_edit_user_page():
@@ -32,6 +33,7 @@ def view_edit_user_page():
                     new_participant_info_container.clear()
                     success, message1 = update_user_info(participant_id, attribute, new_value)
                     if success:
+                        invalidate_participant_snapshot()
                         ui.notify(f'Updated {attribute} successfully!', type='positive', close_button=True, timeout=5000)
                         user_info, message2 = get_user_info(participant_id)
                         with new_participant_info_container:
@@ -0,0 +1,95 @@
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+import polars as pl
+import pytest
+from project_insight_part_3.methods.compliance_methods import compliance_status, evaluate_response_windows, match_responses
+
+NEW_YORK = ZoneInfo("America/New_York")
+DAY = date(2025, 8, 4)
+SEND_TIME = time(10, 5)
+SENT_AT = datetime.combine(DAY, SEND_TIME, tzinfo=NEW_YORK)
+
+
+def expected(rows: list) -> pl.DataFrame:
+    # One expected survey per key, all sent at SEND_TIME
+    return pl.DataFrame([{
+        "Key": key,
+        "Initials": initials,
+        "Age": 30,
+        "Needs Age": False,
+        "Date": DAY,
+        "Survey_Source": "Survey 1A",
+        "Send Time": SEND_TIME,
+    } for key, initials in rows])
+
+
+def responses(rows: list) -> pl.DataFrame:
+    # rows: (initials, minutes after the send time)
+    return pl.DataFrame({
+        "Name": [initials for initials, _ in rows],
+        "Age": [30 for _ in rows],
+        "Date/Time": [SENT_AT + timedelta(minutes=minutes) for _, minutes in rows],
+        "Survey_Source": ["Survey 1A" for _ in rows],
+    }, schema_overrides={"Date/Time": pl.Datetime("us", "America/New_York")})
+
+
+def statuses(expected_rows: list, response_rows: list) -> dict:
+    matched = match_responses(expected(expected_rows), responses(response_rows), ["Key"])
+    return dict(zip(matched["Key"], matched.select(compliance_status()).to_series()))
+
+
+def stamp(minutes: float) -> str:
+    return (SENT_AT + timedelta(minutes=minutes)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@pytest.mark.parametrize("minutes, in_window", [
+    (-10, False),
+    (-9, True),
+    (0, True),
+    (60, True),
+    (61, False),
+])
+def test_single_response_window_edges(minutes, in_window):
+    result = statuses([(1, "AB")], [("AB", minutes)])[1]
+    assert result == f"{'✓' if in_window else '✗'} SR {stamp(minutes)}"
+
+
+@pytest.mark.parametrize("minutes, in_window", [
+    (0, False),
+    (1, True),
+    (60, True),
+    (61, False),
+])
+def test_multiple_response_window_edges(minutes, in_window):
+    # The other response is well outside the window
+    result = statuses([(1, "AB")], [("AB", minutes), ("AB", 180)])[1]
+    assert result == (f"✓ MR {stamp(minutes)}" if in_window else "✗ MR")
+
+
+def test_multiple_responses_show_the_newest_in_window_one():
+    result = statuses([(1, "AB")], [("AB", 5), ("AB", 30), ("AB", 90)])[1]
+    assert result == f"✓ MR {stamp(30)}"
+
+
+def test_no_response_is_nr():
+    result = statuses([(1, "AB"), (2, "CD")], [("AB", 5)])
+    assert result[2] == "✗ NR"
+
+
+def test_unsent_survey_is_blank_or_issue():
+    unsent = expected([(1, "AB")]).with_columns(pl.lit(None, dtype=pl.Time).alias("Send Time"))
+    matched = match_responses(unsent, responses([("AB", 5)]), ["Key"])
+    assert matched.select(compliance_status(skip_unsent=True)).item() is None
+    assert matched.select(compliance_status(skip_unsent=False)).item() == "Issue"
+
+
+def test_latency_is_reported_for_the_chosen_response():
+    matched = pl.DataFrame({
+        "Key": [1, 1],
+        "Completed At": [SENT_AT + timedelta(minutes=20), SENT_AT + timedelta(minutes=70)],
+        "Sent At": [SENT_AT, SENT_AT],
+    })
+    evaluated = evaluate_response_windows(matched, ["Key"]).row(0, named=True)
+    assert evaluated["Responses"] == 2
+    assert evaluated["In Window"] is True
+    assert evaluated["Latency (min)"] == 20
@@ -0,0 +1,63 @@
+import pytest
+from project_insight_part_3.methods.enrollment import plan_enrollment, read_enrollment_csv
+
+
+def row(participant_id="101", start_date="2025-08-04", phone_number="+12345678901", lb_link="https://lb/101", schedule="Standard Schedule"):
+    return {"participant_id": participant_id, "start_date": start_date, "phone_number": phone_number, "lb_link": lb_link, "schedule": schedule}
+
+
+def errors(rows, existing_ids=None):
+    return [entry["error"] for entry in plan_enrollment(rows, existing_ids)]
+
+
+def test_valid_row_gets_end_date_phone_prefix_and_randomizer():
+    entry = plan_enrollment([row(phone_number=" 12345678901 ")])[0]
+    assert entry["error"] is None
+    assert entry["row"] == 2
+    assert entry["end_date"] == "2025-08-17"
+    assert entry["phone_number"] == "+12345678901"
+    assert sorted(entry["message_randomizer"]) == [0, 0, 0, 0, 1, 1, 1, 1]
+
+
+def test_duplicate_ids_in_the_file_keep_only_the_first():
+    assert errors([row(), row(phone_number="+19999999999")]) == [None, "Participant ID appears more than once in the file"]
+
+
+def test_already_enrolled_ids_are_rejected():
+    assert errors([row(), row(participant_id="102")], existing_ids={101}) == ["Participant ID is already enrolled", None]
+
+
+def test_rejected_row_does_not_block_a_later_row_with_the_same_id():
+    # The first row is invalid, so the ID has not been claimed yet
+    assert errors([row(phone_number="555-1234"), row()]) == [
+        "Phone number must be 11 digits in international format (e.g., +12345678901)",
+        None,
+    ]
+
+
+@pytest.mark.parametrize("phone_number", ["", "+1234567890", "+123456789012", "+1 234 567 8901", "phone"])
+def test_bad_phone_numbers_are_rejected(phone_number):
+    assert errors([row(phone_number=phone_number)]) == ["Phone number must be 11 digits in international format (e.g., +12345678901)"]
+
+
+@pytest.mark.parametrize("field, value, message", [
+    ("participant_id", "P101", "Participant ID must be an integer"),
+    ("start_date", "08/04/2025", "Start date must be in the format YYYY-MM-DD"),
+    ("start_date", "2025-02-30", "Start date is not a valid date"),
+])
+def test_bad_ids_and_dates_are_rejected(field, value, message):
+    assert errors([row(**{field: value})]) == [message]
+
+
+def test_unknown_schedule_is_rejected():
+    assert errors([row(schedule="Lunch Schedule")])[0].startswith("Schedule must be one of:")
+
+
+def test_csv_headers_are_matched_case_insensitively():
+    content = b"Participant ID,Start Date,Phone,Leaderboard Link,Schedule Type\n101,2025-08-04,+12345678901,https://lb/101,Night Owl Schedule\n"
+    assert read_enrollment_csv(content) == [row(schedule="Night Owl Schedule")]
+
+
+def test_csv_missing_column_is_an_error():
+    with pytest.raises(ValueError, match="schedule"):
+        read_enrollment_csv(b"participant_id,start_date,phone_number,lb_link\n101,2025-08-04,+12345678901,x\n")
@@ -0,0 +1,41 @@
+from datetime import date
+import polars as pl
+from project_insight_part_3.methods import homepage_figures
+from project_insight_part_3.methods.homepage_figures import enrollment_counts_by_bucket
+
+
+def snapshot(*start_dates):
+    return pl.DataFrame({"start_date": list(start_dates)}, schema={"start_date": pl.Date})
+
+
+def counts(df):
+    return dict(zip(df["date"].to_list(), df["enrollment_count"].to_list()))
+
+
+def test_empty_weeks_are_zero():
+    df = enrollment_counts_by_bucket(snapshot(date(2026, 9, 1), date(2026, 9, 16)), end_date=date(2026, 9, 20))
+    assert counts(df) == {date(2026, 8, 31): 1, date(2026, 9, 7): 0, date(2026, 9, 14): 1}
+
+
+def test_start_later_in_the_last_week_is_counted():
+    df = enrollment_counts_by_bucket(snapshot(date(2026, 9, 1), date(2026, 10, 15)), end_date=date(2026, 10, 14))
+    assert df["date"].max() == date(2026, 10, 12)
+    assert counts(df)[date(2026, 10, 12)] == 1
+    assert df["enrollment_count"].sum() == 2
+
+
+def test_end_date_defaults_to_the_study_day(monkeypatch):
+    monkeypatch.setattr(homepage_figures, "study_today", lambda: date(2026, 10, 14))
+    df = enrollment_counts_by_bucket(snapshot(date(2026, 10, 15), date(2026, 10, 19)))
+    assert counts(df) == {date(2026, 10, 12): 1}
+
+
+def test_month_buckets():
+    df = enrollment_counts_by_bucket(snapshot(date(2026, 7, 30), date(2026, 9, 2), date(2026, 9, 28)), bucket="month", end_date=date(2026, 9, 10))
+    assert counts(df) == {date(2026, 7, 1): 1, date(2026, 8, 1): 0, date(2026, 9, 1): 2}
+
+
+def test_no_start_dates_gives_an_empty_frame():
+    df = enrollment_counts_by_bucket(snapshot(None), end_date=date(2026, 10, 14))
+    assert df.is_empty()
+    assert df.schema == {"date": pl.Date, "enrollment_count": pl.UInt32}
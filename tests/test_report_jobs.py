@@ -0,0 +1,59 @@
+from datetime import date
+from types import SimpleNamespace
+import polars as pl
+import pytest
+from project_insight_part_3.methods import report_jobs
+
+REPORT_DATE = "2025-08-06"
+
+SNAPSHOT = pl.DataFrame({
+    "participant_id": [101, 102, 103],
+    "start_date": [date(2025, 8, 1), date(2025, 8, 10), None],
+    "end_date": [date(2025, 8, 14), date(2025, 8, 23), None],
+    "schedule_type": ["Standard Schedule", "Early Bird Schedule", "Night Owl Schedule"],
+})
+
+
+def participant_groups(date_value):
+    # Same split as get_participant_list(): participant 103 has no start date and falls in no group
+    participants = SNAPSHOT.rename({"participant_id": "Participant ID", "start_date": "Start Date",
+                                    "end_date": "End Date", "schedule_type": "Schedule Type"})
+    report_date = date.fromisoformat(date_value)
+    return {
+        "not_started": participants.filter(pl.col("Start Date") > report_date),
+        "currently_in_study": participants.filter((pl.col("Start Date") <= report_date) & (pl.col("End Date") >= report_date)),
+        "done_with_study": participants.filter(pl.col("End Date") < report_date),
+    }
+
+
+@pytest.fixture
+def report_inputs(tmp_path, monkeypatch):
+    # Saved reports live under the working directory
+    monkeypatch.chdir(tmp_path)
+    participant_db = tmp_path / "participants.csv"
+    participant_db.write_text("participant_id\n101\n")
+    responses = pl.DataFrame({"Date/Time": [1, 2]}).lazy()
+    frame = pl.DataFrame({"Participant ID": [101]})
+
+    monkeypatch.setattr(report_jobs, "get_participant_snapshot", lambda: SNAPSHOT)
+    monkeypatch.setattr(report_jobs, "get_participant_list", participant_groups)
+    monkeypatch.setattr(report_jobs, "get_survey_send_times_all", lambda date_value: (frame, frame, frame))
+    monkeypatch.setattr(report_jobs, "scan_merged_surveys", lambda start_date, end_date: responses)
+    monkeypatch.setattr(report_jobs, "read_send_times", lambda start, end: frame)
+    monkeypatch.setattr(report_jobs, "compliance_table_daily_report", lambda *args: frame)
+    monkeypatch.setattr(report_jobs, "contact_checks", lambda compliance_df: ([], []))
+    monkeypatch.setattr(report_jobs, "get_env_config", lambda: SimpleNamespace(participant_db=str(participant_db)))
+
+
+def test_saved_report_is_current_when_a_participant_has_no_start_date(report_inputs):
+    report_jobs.save_report(report_jobs.build_compliance_report(REPORT_DATE))
+    report = report_jobs.load_saved_report(REPORT_DATE)
+    assert report is not None
+    assert report_jobs.is_report_current(report)
+
+
+def test_saved_report_is_stale_after_a_participant_row_changes(report_inputs, monkeypatch):
+    report_jobs.save_report(report_jobs.build_compliance_report(REPORT_DATE))
+    monkeypatch.setattr(report_jobs, "get_participant_snapshot",
+                        lambda: SNAPSHOT.with_columns(pl.col("start_date").fill_null(date(2025, 8, 20))))
+    assert not report_jobs.is_report_current(report_jobs.load_saved_report(REPORT_DATE))
@@ -0,0 +1,63 @@
+import csv
+import polars as pl
+import pytest
+from project_insight_part_3.methods.survey_ingest import ingest_survey_exports, scan_survey_store
+
+QUALTRICS_HEADER = ["Name", "Age", "Date/Time"]
+# Second header row Qualtrics adds to every export
+IMPORT_ID_ROW = ['{"ImportId":"QID1"}', '{"ImportId":"QID2"}', '{"ImportId":"Date/Time"}']
+
+
+@pytest.fixture
+def export_path(tmp_path, monkeypatch):
+    # The survey store lives under the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "survey_1a.csv"
+
+
+def write_export(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(QUALTRICS_HEADER)
+        writer.writerows(rows)
+
+
+def ingest(path):
+    return ingest_survey_exports({"qualtrics_survey_p3_1a_path": str(path)}).get("Survey 1A")
+
+
+def stored_times(tz="America/Denver"):
+    return (scan_survey_store().select(pl.col("Date/Time").dt.convert_time_zone(tz).dt.strftime("%Y-%m-%d %H:%M:%S"))
+            .collect().to_series().sort().to_list())
+
+
+def test_metadata_row_does_not_block_newer_responses(export_path):
+    rows = [IMPORT_ID_ROW, ["a b", "30", "2025-08-01 09:00:00"]]
+    write_export(export_path, rows)
+    assert ingest(export_path) == 1
+
+    write_export(export_path, rows + [["cd", "41", "2025-08-02 10:00:00"]])
+    assert ingest(export_path) == 1
+    assert stored_times() == ["2025-08-01 09:00:00", "2025-08-02 10:00:00"]
+
+
+def test_mark_compares_parsed_times_not_strings(export_path):
+    rows = [["ab", "30", "2025-8-2 9:00:00"]]
+    write_export(export_path, rows)
+    assert ingest(export_path) == 1
+
+    # "2025-08-10" sorts before "2025-8-2" as a string
+    write_export(export_path, rows + [["cd", "41", "2025-08-10 08:00:00"]])
+    assert ingest(export_path) == 1
+    assert stored_times() == ["2025-08-02 09:00:00", "2025-08-10 08:00:00"]
+
+
+def test_rows_at_the_mark_are_not_duplicated(export_path):
+    rows = [["ab", "30", "2025-08-01 09:00:00"]]
+    write_export(export_path, rows)
+    assert ingest(export_path) == 1
+
+    # A second response at the same second as the mark is new, the first one is not
+    write_export(export_path, rows + [["cd", "41", "2025-08-01 09:00:00"]])
+    assert ingest(export_path) == 1
+    assert stored_times() == ["2025-08-01 09:00:00", "2025-08-01 09:00:00"]